@@ -0,0 +1,58 @@
+import argparse
+import asyncio
+import uuid
+
+from benchmarks.tools import measure, format_timings
+from config import settings
+from libs.context.base import RequestContext
+from libs.grpc.client.base import build_grpc_channel
+from libs.grpc.client.registry import grpc_channel_registry
+from libs.http.client.base import build_http_client
+from libs.http.client.registry import http_client_registry
+from libs.logger import get_logger
+from services.users.clients.grpc import UsersGRPCClient, get_users_grpc_client
+from services.users.clients.http import UsersHTTPClient
+
+USER_ID = uuid.uuid4()
+
+
+async def run(iterations: int, scenario: str):
+    context = RequestContext(test_scenario=scenario)
+    logger = get_logger("BENCHMARK_GATEWAY_CLIENTS")
+
+    async def http_per_request():
+        client = build_http_client(logger=logger, config=settings.users_http_client)
+        async with client:
+            await UsersHTTPClient(client=client, context=context).get_user(USER_ID)
+
+    async def http_pooled():
+        client = http_client_registry.get_client(name="BENCHMARK_USERS_HTTP_CLIENT", config=settings.users_http_client)
+        await UsersHTTPClient(client=client, context=context).get_user(USER_ID)
+
+    async def grpc_per_request():
+        async with build_grpc_channel(logger=logger, config=settings.users_grpc_client) as channel:
+            await UsersGRPCClient(channel=channel).get_user(str(USER_ID), context)
+
+    async def grpc_pooled():
+        await get_users_grpc_client().get_user(str(USER_ID), context)
+
+    try:
+        for name, func in (
+                ("http per-request client", http_per_request),
+                ("http pooled client", http_pooled),
+                ("grpc per-request channel", grpc_per_request),
+                ("grpc pooled channel", grpc_pooled),
+        ):
+            print(format_timings(name, await measure(func, iterations)))
+    finally:
+        await http_client_registry.close()
+        await grpc_channel_registry.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Downstream client construction: per-request vs pooled")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--scenario", default="user_with_active_credit_card_account")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.iterations, args.scenario))
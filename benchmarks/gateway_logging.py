@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+import logging
+import tempfile
+
+from httpx import Request, Response
+
+from benchmarks.tools import measure, format_timings
+from libs.config.logger import LoggerConfig, LogFormat
+from libs.http.client.event_hooks.logger_event_hook import HTTPLoggerEventHook
+from libs.logger import configure_logging, logging_pipeline, TEXT_LOG_FORMAT
+
+DOWNSTREAMS = ("USERS_SERVICE_HTTP_CLIENT", "ACCOUNTS_SERVICE_HTTP_CLIENT")
+
+
+class LegacyHTTPLoggerEventHook:
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+
+    async def request(self, request: Request):
+        self.logger.info(f"{request.method} {request.url} - Waiting for response")
+
+    async def response(self, response: Response):
+        request = response.request
+        self.logger.info(f"{request.method} {request.url} - Status {response.status_code}")
+
+
+def build_legacy_logger(name: str, stream) -> logging.Logger:
+    logger = logging.getLogger(f"LEGACY_{name}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+    handler = logging.StreamHandler(stream)
+    handler.setLevel(logging.DEBUG)
+    handler.setFormatter(logging.Formatter(TEXT_LOG_FORMAT))
+    logger.addHandler(handler)
+
+    return logger
+
+
+def build_gateway_request(hooks: list[HTTPLoggerEventHook | LegacyHTTPLoggerEventHook]):
+    request = Request("GET", "http://http-mock:8003/api/v1/users/3fa85f64-5717-4562-b3fc-2c963f66afa6")
+    response = Response(200, request=request)
+
+    async def gateway_request():
+        for hook in hooks:
+            await hook.request(request)
+            await hook.response(response)
+
+    return gateway_request
+
+
+async def run(iterations: int):
+    with tempfile.TemporaryFile(mode="w") as stream:
+        legacy_hooks = [LegacyHTTPLoggerEventHook(build_legacy_logger(name, stream)) for name in DOWNSTREAMS]
+        print(format_timings("sync stream handler, f-strings", await measure(
+            build_gateway_request(legacy_hooks), iterations
+        )))
+
+        hooks = [HTTPLoggerEventHook(logging.getLogger(name)) for name in DOWNSTREAMS]
+        for name, config in (
+                ("queue, text", LoggerConfig(format=LogFormat.TEXT)),
+                ("queue, json", LoggerConfig(format=LogFormat.JSON)),
+                ("queue, json, 10% access sample", LoggerConfig(access_sample_rate=0.1)),
+                ("queue, level WARNING", LoggerConfig(level="WARNING")),
+        ):
+            configure_logging(config, stream)
+            print(format_timings(name, await measure(build_gateway_request(hooks), iterations)))
+            logging_pipeline.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Per-request logging cost of the gateway downstream event hooks")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.iterations))
@@ -0,0 +1,102 @@
+import argparse
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta
+
+import cramjam
+
+from benchmarks.tools import measure, format_timings
+from contracts.services.operations.operation_event_pb2 import OperationEvent
+from contracts.services.operations.operation_pb2 import (
+    OperationType as ProtoOperationType,
+    OperationStatus as ProtoOperationStatus
+)
+from libs.kafka.message import KafkaMessage, KafkaContentType, parse_kafka_content_type, build_protobuf_content_type_header
+from services.operations.app.controllers.kafka import decode_operation_event
+from services.operations.app.schema.operation import OperationEventSchema
+from services.operations.types.operations import OperationType, OperationStatus
+
+OPERATION_TYPE_PROTO_MAP = OperationType.proto_map(ProtoOperationType)
+OPERATION_STATUS_PROTO_MAP = OperationStatus.proto_map(ProtoOperationStatus)
+
+
+def build_events(count: int) -> list[OperationEventSchema]:
+    created_at = datetime(2026, 1, 1)
+    return [
+        OperationEventSchema(
+            type=random.choice(list(OperationType)),
+            status=random.choice(list(OperationStatus)),
+            amount=round(random.uniform(1, 10_000), 2),
+            user_id=uuid.uuid4(),
+            card_id=uuid.uuid4(),
+            category=random.choice(("groceries", "taxi", "restaurants", "utilities")),
+            event_id=uuid.uuid4(),
+            account_id=uuid.uuid4(),
+            created_at=created_at + timedelta(seconds=index),
+        )
+        for index in range(count)
+    ]
+
+
+def encode_protobuf(event: OperationEventSchema) -> bytes:
+    return OperationEvent(
+        event_id=event.event_id.bytes,
+        type=OPERATION_TYPE_PROTO_MAP.to_proto(event.type),
+        status=OPERATION_STATUS_PROTO_MAP.to_proto(event.status),
+        amount=event.amount,
+        user_id=event.user_id.bytes,
+        card_id=event.card_id.bytes,
+        category=event.category,
+        created_at=event.created_at.isoformat(),
+        account_id=event.account_id.bytes,
+    ).SerializeToString()
+
+
+def build_decode_batch(messages: list[KafkaMessage]):
+    async def decode_batch():
+        for message in messages:
+            decode_operation_event(message)
+
+    return decode_batch
+
+
+def format_sizes(name: str, values: list[bytes]) -> str:
+    payload = b"".join(values)
+    lz4 = len(cramjam.lz4.compress_block(payload))
+    zstd = len(cramjam.zstd.compress(payload))
+    return (
+        f"{name:<32} avg={len(payload) / len(values):.1f}B "
+        f"batch={len(payload)}B lz4={lz4}B zstd={zstd}B n={len(values)}"
+    )
+
+
+async def run(iterations: int, batch_size: int):
+    events = build_events(batch_size)
+    _, message_type = parse_kafka_content_type(build_protobuf_content_type_header(OperationEvent)[1])
+
+    json_values = [event.model_dump_json().encode() for event in events]
+    protobuf_values = [encode_protobuf(event) for event in events]
+    json_messages = [KafkaMessage(value, KafkaContentType.JSON) for value in json_values]
+    protobuf_messages = [KafkaMessage(value, KafkaContentType.PROTOBUF, message_type) for value in protobuf_values]
+
+    assert [decode_operation_event(message) for message in json_messages] == [
+        decode_operation_event(message) for message in protobuf_messages
+    ]
+
+    print(f"decode cost per batch of {batch_size} events")
+    print(format_timings("json, pydantic", await measure(build_decode_batch(json_messages), iterations)))
+    print(format_timings("protobuf, fast path", await measure(build_decode_batch(protobuf_messages), iterations)))
+
+    print("message size")
+    print(format_sizes("json", json_values))
+    print(format_sizes("protobuf", protobuf_values))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Decode cost and size of JSON vs protobuf operation events")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.iterations, args.batch_size))
@@ -0,0 +1,21 @@
+import time
+from statistics import quantiles
+from typing import Callable, Awaitable
+
+
+async def measure(func: Callable[[], Awaitable[object]], iterations: int, warmup: int = 10) -> list[float]:
+    for _ in range(warmup):
+        await func()
+
+    timings: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return timings
+
+
+def format_timings(name: str, timings: list[float]) -> str:
+    percentiles = quantiles(timings, n=100)
+    return f"{name:<32} p50={percentiles[49]:.3f}ms p99={percentiles[98]:.3f}ms n={len(timings)}"
@@ -2,10 +2,13 @@ import os
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from libs.config.cache import CacheConfig
 from libs.config.grpc import GRPCServerConfig, GRPCClientConfig
 from libs.config.http import HTTPServerConfig, HTTPClientConfig
 from libs.config.kafka import KafkaClientConfig
+from libs.config.logger import LoggerConfig
 from libs.config.postgres import PostgresConfig
+from libs.config.tracing import TracingConfig
 
 
 class Settings(BaseSettings):
@@ -23,15 +26,26 @@ class Settings(BaseSettings):
     cards_grpc_client: GRPCClientConfig
 
     gateway_http_server: HTTPServerConfig
+    gateway_http_metrics_server: HTTPServerConfig
     gateway_grpc_server: GRPCServerConfig
+    gateway_grpc_metrics_server: HTTPServerConfig
 
     accounts_http_client: HTTPClientConfig
     accounts_grpc_client: GRPCClientConfig
 
     operations_http_server: HTTPServerConfig
+    operations_http_metrics_server: HTTPServerConfig
     operations_grpc_server: GRPCServerConfig
+    operations_grpc_metrics_server: HTTPServerConfig
+    operations_kafka_metrics_server: HTTPServerConfig
+    operations_outbox_metrics_server: HTTPServerConfig
     operations_kafka_client: KafkaClientConfig
     operations_postgres_database: PostgresConfig
+    operations_summary_daily_rollups: bool = False
+
+    logger: LoggerConfig = LoggerConfig()
+    tracing: TracingConfig = TracingConfig()
+    downstream_cache: CacheConfig = CacheConfig()
 
 
 settings = Settings()
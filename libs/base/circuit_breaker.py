@@ -0,0 +1,86 @@
+import time
+from collections import deque
+from enum import StrEnum
+from logging import Logger
+
+from libs.config.circuit_breaker import CircuitBreakerConfig
+
+
+class CircuitState(StrEnum):
+    OPEN = "OPEN"
+    CLOSED = "CLOSED"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitBreakerOpenError(Exception):
+    def __init__(self, name: str):
+        super().__init__(f"Circuit breaker for {name} is open")
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, config: CircuitBreakerConfig, logger: Logger):
+        self.name = name
+        self.config = config
+        self.logger = logger
+
+        self.state = CircuitState.CLOSED
+        self.outcomes: deque[tuple[float, bool]] = deque()
+        self.opened_at = 0.0
+        self.half_open_in_flight = 0
+
+    def allow_request(self) -> bool:
+        if not self.config.enabled or self.state == CircuitState.CLOSED:
+            return True
+
+        if self.state == CircuitState.OPEN:
+            if time.monotonic() - self.opened_at < self.config.cool_down:
+                return False
+
+            self.transition(CircuitState.HALF_OPEN)
+
+        if self.half_open_in_flight >= self.config.half_open_calls:
+            return False
+
+        self.half_open_in_flight += 1
+        return True
+
+    def release(self) -> None:
+        if self.state == CircuitState.HALF_OPEN and self.half_open_in_flight > 0:
+            self.half_open_in_flight -= 1
+
+    def record_success(self) -> None:
+        if self.state == CircuitState.HALF_OPEN:
+            self.transition(CircuitState.CLOSED)
+            return
+
+        self.record(failed=False)
+
+    def record_failure(self) -> None:
+        if self.state == CircuitState.HALF_OPEN:
+            self.transition(CircuitState.OPEN)
+            return
+
+        self.record(failed=True)
+
+        failures = sum(failed for _, failed in self.outcomes)
+        if (
+                len(self.outcomes) >= self.config.minimum_calls
+                and failures / len(self.outcomes) >= self.config.failure_rate_threshold
+        ):
+            self.transition(CircuitState.OPEN)
+
+    def record(self, failed: bool) -> None:
+        now = time.monotonic()
+        self.outcomes.append((now, failed))
+
+        while self.outcomes and self.outcomes[0][0] < now - self.config.window:
+            self.outcomes.popleft()
+
+    def transition(self, state: CircuitState) -> None:
+        self.logger.warning(f"Circuit breaker for {self.name}: {self.state} -> {state}")
+
+        self.state = state
+        self.outcomes.clear()
+        self.half_open_in_flight = 0
+        if state == CircuitState.OPEN:
+            self.opened_at = time.monotonic()
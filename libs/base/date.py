@@ -1,5 +1,19 @@
-from datetime import datetime
+from datetime import datetime, UTC
+
+
+PROTO_DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 
 def to_proto_datetime(value: datetime) -> str:
-    return value.strftime('%Y-%m-%d %H:%M:%S')
+    return value.strftime(PROTO_DATETIME_FORMAT)
+
+
+def from_proto_datetime(value: str) -> datetime:
+    return datetime.strptime(value, PROTO_DATETIME_FORMAT)
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+
+    return value.astimezone(UTC).replace(tzinfo=None)
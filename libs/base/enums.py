@@ -1,23 +1,64 @@
 from enum import Enum
-from typing import Self, TypeVar
+from functools import lru_cache
+from typing import Generic, Iterable, Self, TypeVar
 
 from libs.base.strings import to_upper_snake_case
 
 T = TypeVar('T')
+E = TypeVar('E', bound=Enum)
+
+PROTO_ENUM_UNSPECIFIED = 'UNSPECIFIED'
+
+
+class ProtoEnumMap(Generic[E, T]):
+    def __init__(self, enum: type[E], proto: type[T]):
+        prefix = f'{to_upper_snake_case(proto.DESCRIPTOR.name)}_'
+        proto_keys = set(proto.keys())
+
+        unmapped_members = [member.name for member in enum if f'{prefix}{member.name}' not in proto_keys]
+        if unmapped_members:
+            raise ValueError(f"{enum.__name__} members {unmapped_members} have no value in {proto.DESCRIPTOR.name}")
+
+        member_keys = {f'{prefix}{member.name}' for member in enum}
+        unmapped_proto_keys = [
+            key for key in proto.keys()
+            if key not in member_keys and key != f'{prefix}{PROTO_ENUM_UNSPECIFIED}'
+        ]
+        if unmapped_proto_keys:
+            raise ValueError(f"{proto.DESCRIPTOR.name} values {unmapped_proto_keys} have no member in {enum.__name__}")
+
+        self.enum = enum
+        self.proto = proto
+        self.to_proto_map: dict[E, T] = {member: proto.Value(f'{prefix}{member.name}') for member in enum}
+        self.from_proto_map: dict[T, E] = {value: member for member, value in self.to_proto_map.items()}
+
+    def to_proto(self, value: E) -> T:
+        return self.to_proto_map[value]
+
+    def from_proto(self, value: T) -> E:
+        return self.from_proto_map[value]
+
+    def to_proto_many(self, values: Iterable[E]) -> list[T]:
+        return list(map(self.to_proto_map.__getitem__, values))
+
+    def from_proto_many(self, values: Iterable[T]) -> list[E]:
+        return list(map(self.from_proto_map.__getitem__, values))
+
+
+@lru_cache(maxsize=None)
+def get_proto_enum_map(enum: type[E], proto: type[T]) -> ProtoEnumMap[E, T]:
+    return ProtoEnumMap(enum, proto)
 
 
 class ProtoEnum(Enum):
     @classmethod
-    def to_proto_map(cls, proto: type[T]) -> dict[Self, T]:
-        proto_name = proto.DESCRIPTOR.name
+    def proto_map(cls, proto: type[T]) -> ProtoEnumMap[Self, T]:
+        return get_proto_enum_map(cls, proto)
 
-        return {
-            key: getattr(proto, proto_key)
-            for proto_key in proto.keys()
-            for key in cls
-            if proto_key == f'{to_upper_snake_case(proto_name)}_{key.name}'
-        }
+    @classmethod
+    def to_proto_map(cls, proto: type[T]) -> dict[Self, T]:
+        return dict(cls.proto_map(proto).to_proto_map)
 
     @classmethod
     def from_proto_map(cls, proto: type[T]) -> dict[T, Self]:
-        return {value: key for key, value in cls.to_proto_map(proto).items()}
+        return dict(cls.proto_map(proto).from_proto_map)
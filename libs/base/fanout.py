@@ -0,0 +1,16 @@
+import asyncio
+from typing import Any, Coroutine
+
+
+async def fan_out(*coroutines: Coroutine[Any, Any, Any]) -> tuple[Any, ...]:
+    try:
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(coroutine) for coroutine in coroutines]
+    except BaseExceptionGroup as group:
+        error = group.exceptions[0]
+        while isinstance(error, BaseExceptionGroup):
+            error = error.exceptions[0]
+
+        raise error
+
+    return tuple(task.result() for task in tasks)
@@ -0,0 +1,26 @@
+from collections import OrderedDict
+from typing import Generic, Hashable, Iterable, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+
+
+class RecentKeys(Generic[K]):
+    def __init__(self, max_size: int):
+        self.keys: OrderedDict[K, None] = OrderedDict()
+        self.max_size = max_size
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self.keys
+
+    def add(self, key: K) -> None:
+        self.keys[key] = None
+        self.keys.move_to_end(key)
+        if len(self.keys) > self.max_size:
+            self.keys.popitem(last=False)
+
+    def update(self, keys: Iterable[K]) -> None:
+        for key in keys:
+            self.add(key)
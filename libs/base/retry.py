@@ -0,0 +1,49 @@
+import random
+import time
+
+from libs.config.retry import RetryConfig
+
+
+class RetryBudget:
+    def __init__(self, capacity: float, refill_rate: float):
+        self.tokens = capacity
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.updated_at = time.monotonic()
+
+    def try_acquire(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_rate)
+        self.updated_at = now
+
+        if self.tokens < 1:
+            return False
+
+        self.tokens -= 1
+        return True
+
+
+class RetryPolicy:
+    def __init__(self, config: RetryConfig, max_retries: int):
+        self.config = config
+        self.max_retries = max_retries
+        self.budget = RetryBudget(capacity=config.budget_capacity, refill_rate=config.budget_refill_rate)
+
+    def get_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        delay = random.uniform(0, min(self.config.backoff_max, self.config.backoff_base * 2 ** attempt))
+        if retry_after is not None:
+            return max(delay, retry_after)
+
+        return delay
+
+    def get_stop_reason(self, attempt: int, delay: float, deadline: float | None) -> str | None:
+        if attempt + 1 >= self.max_retries:
+            return f"all {self.max_retries} attempts failed"
+
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return "deadline would be exceeded"
+
+        if not self.budget.try_acquire():
+            return "retry budget exhausted"
+
+        return None
@@ -0,0 +1,12 @@
+from typing import Protocol
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> bytes | None:
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
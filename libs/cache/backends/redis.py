@@ -0,0 +1,17 @@
+class RedisCacheBackend:
+    def __init__(self, url: str):
+        try:
+            from redis.asyncio import Redis
+        except ImportError as error:
+            raise RuntimeError("Redis cache backend requires the 'redis' package") from error
+
+        self.client = Redis.from_url(url)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(key, value, px=int(ttl * 1000))
+
+    async def close(self) -> None:
+        await self.client.aclose()
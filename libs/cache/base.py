@@ -0,0 +1,59 @@
+import asyncio
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, TypeVar
+
+from libs.cache.backends.base import CacheBackend
+from libs.cache.backends.memory import MemoryCacheBackend
+from libs.cache.backends.redis import RedisCacheBackend
+from libs.cache.serializers import CacheSerializer
+from libs.config.cache import CacheConfig, CacheBackendType
+from libs.context.base import RequestContext
+
+T = TypeVar('T')
+
+
+def build_cache_key(name: str, context: RequestContext, *args: Any) -> str:
+    return ":".join([name, *map(str, args), context.as_cache_key()])
+
+
+class ResponseCache:
+    def __init__(self, config: CacheConfig, backend: CacheBackend):
+        self.config = config
+        self.backend = backend
+        self.in_flight: dict[str, asyncio.Future[bytes]] = {}
+
+    async def get_or_load(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[T]],
+            serializer: CacheSerializer[T]
+    ) -> T:
+        if not self.config.enabled:
+            return await loader()
+
+        if (value := await self.backend.get(key)) is not None:
+            return serializer.load(value)
+
+        future = self.in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self.load(key, loader, serializer))
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+            self.in_flight[key] = future
+
+        return serializer.load(await asyncio.shield(future))
+
+    async def load(self, key: str, loader: Callable[[], Awaitable[T]], serializer: CacheSerializer[T]) -> bytes:
+        value = serializer.dump(await loader())
+        await self.backend.set(key, value, self.config.ttl)
+        return value
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+
+@lru_cache(maxsize=None)
+def get_response_cache(config: CacheConfig) -> ResponseCache:
+    if config.backend == CacheBackendType.REDIS:
+        return ResponseCache(config=config, backend=RedisCacheBackend(url=config.redis_url))
+
+    return ResponseCache(config=config, backend=MemoryCacheBackend(max_size=config.max_size))
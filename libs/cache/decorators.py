@@ -0,0 +1,29 @@
+import inspect
+from functools import wraps
+from typing import Callable, Coroutine, Any
+
+from libs.cache.base import ResponseCache, build_cache_key
+from libs.cache.serializers import CacheSerializer
+
+CachedFunc = Callable[..., Coroutine[Any, Any, Any]]
+
+
+def cache_response(cache: ResponseCache, name: str, serializer: CacheSerializer):
+    def wrapper(func: CachedFunc):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def inner(*args, **kwargs):
+            arguments = signature.bind(*args, **kwargs).arguments
+            client = arguments.pop('self')
+            context = arguments.pop('context', None) or client.context
+
+            return await cache.get_or_load(
+                key=build_cache_key(name, context, *arguments.values()),
+                loader=lambda: func(*args, **kwargs),
+                serializer=serializer
+            )
+
+        return inner
+
+    return wrapper
@@ -0,0 +1,36 @@
+from typing import Protocol, TypeVar
+
+from google.protobuf.message import Message
+from pydantic import BaseModel
+
+T = TypeVar('T')
+
+
+class CacheSerializer(Protocol[T]):
+    def dump(self, value: T) -> bytes:
+        ...
+
+    def load(self, value: bytes) -> T:
+        ...
+
+
+class PydanticCacheSerializer:
+    def __init__(self, model: type[BaseModel]):
+        self.model = model
+
+    def dump(self, value: BaseModel) -> bytes:
+        return value.model_dump_json(by_alias=True).encode()
+
+    def load(self, value: bytes) -> BaseModel:
+        return self.model.model_validate_json(value)
+
+
+class ProtobufCacheSerializer:
+    def __init__(self, message: type[Message]):
+        self.message = message
+
+    def dump(self, value: Message) -> bytes:
+        return value.SerializeToString()
+
+    def load(self, value: bytes) -> Message:
+        return self.message.FromString(value)
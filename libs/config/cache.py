@@ -0,0 +1,18 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CacheBackendType(StrEnum):
+    MEMORY = "memory"
+    REDIS = "redis"
+
+
+class CacheConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    ttl: float = 30.0
+    enabled: bool = True
+    backend: CacheBackendType = CacheBackendType.MEMORY
+    max_size: int = 10_000
+    redis_url: str = "redis://localhost:6379/0"
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class CircuitBreakerConfig(BaseModel):
+    enabled: bool = True
+    window: float = 30.0
+    cool_down: float = 10.0
+    minimum_calls: int = 20
+    half_open_calls: int = 3
+    failure_rate_threshold: float = 0.5
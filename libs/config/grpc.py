@@ -1,5 +1,8 @@
 from pydantic import BaseModel, IPvAnyAddress
 
+from libs.config.circuit_breaker import CircuitBreakerConfig
+from libs.config.retry import RetryConfig
+
 
 class GRPCServerConfig(BaseModel):
     port: int
@@ -13,6 +16,8 @@ class GRPCServerConfig(BaseModel):
 class GRPCClientConfig(BaseModel):
     port: int
     host: str
+    retry: RetryConfig = RetryConfig()
+    circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig()
     retries: int = 10
     timeout: float = 180.0
     insecure_skip_verify: bool = True
@@ -1,5 +1,8 @@
 from pydantic import BaseModel, IPvAnyAddress, HttpUrl
 
+from libs.config.circuit_breaker import CircuitBreakerConfig
+from libs.config.retry import RetryConfig
+
 
 class HTTPServerConfig(BaseModel):
     port: int
@@ -8,8 +11,13 @@ class HTTPServerConfig(BaseModel):
 
 class HTTPClientConfig(BaseModel):
     host: HttpUrl
+    retry: RetryConfig = RetryConfig()
+    circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig()
     retries: int = 5
     timeout: float = 120.0
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
 
     @property
     def url(self) -> str:
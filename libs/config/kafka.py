@@ -1,9 +1,43 @@
+from enum import StrEnum
+
 from pydantic import BaseModel
 
 
+class KafkaCompressionType(StrEnum):
+    LZ4 = "lz4"
+    GZIP = "gzip"
+    ZSTD = "zstd"
+    SNAPPY = "snappy"
+
+
 class KafkaClientConfig(BaseModel):
     port: int = 9092
     host: str
+    batch_min_records: int = 50
+    batch_max_records: int = 500
+    batch_min_wait: float = 0.05
+    batch_max_wait: float = 1.0
+    batch_target_latency: float = 0.25
+    topic_partitions: int = 1
+    topic_replication_factor: int = 1
+    consumer_processes: int = 1
+    consumer_max_in_flight: int = 8
+    consumer_partition_queue_size: int = 2
+    consumer_dedup_cache_size: int = 100_000
+    consumer_retries: int = 3
+    consumer_retry_backoff: float = 0.5
+    consumer_retry_backoff_max: float = 30.0
+    consumer_revoke_timeout: float = 10.0
+    consumer_backpressure_interval: float = 0.1
+    producer_linger: float = 0.005
+    producer_compression: KafkaCompressionType | None = None
+    producer_flush_timeout: float = 10.0
+    producer_max_batch_size: int = 64 * 1024
+    producer_enable_idempotence: bool = True
+    outbox_workers: int = 1
+    outbox_batch_size: int = 500
+    outbox_poll_interval: float = 0.5
+    outbox_retry_backoff: float = 1.0
 
     @property
     def bootstrap_servers(self) -> str:
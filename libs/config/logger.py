@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict
+
+
+class LogFormat(StrEnum):
+    JSON = "json"
+    TEXT = "text"
+
+
+class LoggerConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    level: str = "INFO"
+    levels: dict[str, str] = {}
+    format: LogFormat = LogFormat.JSON
+    access_sample_rate: float = 1.0
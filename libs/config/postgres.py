@@ -1,6 +1,13 @@
+from enum import StrEnum
+
 from pydantic import BaseModel, SecretStr, ConfigDict
 
 
+class PostgresPingStrategy(StrEnum):
+    PESSIMISTIC = "pessimistic"
+    OPTIMISTIC = "optimistic"
+
+
 class PostgresConfig(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -11,9 +18,37 @@ class PostgresConfig(BaseModel):
     username: str
     password: SecretStr
 
+    pool_size: int = 30
+    pool_warmup: int = 0
+    pool_recycle: float = 1800.0
+    pool_timeout: float = 30.0
+    max_overflow: int = 50
+    pool_saturation_threshold: float = 0.9
+    connect_timeout: float = 10.0
+    ping_strategy: PostgresPingStrategy = PostgresPingStrategy.PESSIMISTIC
+    statement_cache_size: int = 100
+
+    replica_hosts: tuple[str, ...] = ()
+    replica_cool_down: float = 30.0
+    task_read_your_writes_window: float = 0.0
+
     @property
     def url(self) -> str:
         return (
             f"{self.driver}://{self.username}:{self.password.get_secret_value()}"
             f"@{self.host}:{self.port}/{self.database}"
         )
+
+    @property
+    def pool_name(self) -> str:
+        return f"{self.database}@{self.host}:{self.port}"
+
+    def build_replica_configs(self) -> list['PostgresConfig']:
+        configs: list[PostgresConfig] = []
+        for replica_host in self.replica_hosts:
+            host, _, port = replica_host.partition(':')
+            configs.append(
+                self.model_copy(update={'host': host, 'port': int(port) if port else self.port, 'replica_hosts': ()})
+            )
+
+        return configs
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class RetryConfig(BaseModel):
+    backoff_base: float = 0.1
+    backoff_max: float = 5.0
+    budget_capacity: float = 20.0
+    budget_refill_rate: float = 2.0
@@ -0,0 +1,20 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TracingExporterType(StrEnum):
+    NONE = "none"
+    FILE = "file"
+    OTLP = "otlp"
+
+
+class TracingConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    exporter: TracingExporterType = TracingExporterType.NONE
+    file_path: str = ".traces/spans.jsonl"
+    otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    flush_interval: float = 1.0
+    max_batch_size: int = 512
+    max_queue_size: int = 10_000
@@ -1,5 +1,30 @@
 from pydantic import BaseModel
 
+from libs.tracing.propagation import SpanContext
+
 
 class RequestContext(BaseModel):
     test_scenario: str | None = None
+    trace_id: str | None = None
+    span_id: str | None = None
+
+    @property
+    def span_context(self) -> SpanContext | None:
+        if self.trace_id and self.span_id:
+            return SpanContext(trace_id=self.trace_id, span_id=self.span_id)
+
+        return None
+
+    def as_cache_key(self) -> str:
+        return f"test_scenario={self.test_scenario}"
+
+
+def build_request_context(test_scenario: str | None, span_context: SpanContext | None) -> RequestContext:
+    if span_context is None:
+        return RequestContext(test_scenario=test_scenario)
+
+    return RequestContext(
+        test_scenario=test_scenario,
+        trace_id=span_context.trace_id,
+        span_id=span_context.span_id
+    )
@@ -1,11 +1,16 @@
 from grpc import ServicerContext
 
-from libs.context.base import RequestContext
+from libs.context.base import RequestContext, build_request_context
+from libs.tracing.span import get_current_span_context
+from libs.tracing.propagation import TRACEPARENT_HEADER, parse_traceparent, format_traceparent
 
 
 def get_grpc_request_context(context: ServicerContext) -> RequestContext:
     metadata = dict(context.invocation_metadata())
-    return RequestContext(test_scenario=metadata.get("x-test-scenario"))
+    return build_request_context(
+        test_scenario=metadata.get("x-test-scenario"),
+        span_context=get_current_span_context() or parse_traceparent(metadata.get(TRACEPARENT_HEADER))
+    )
 
 
 def build_grpc_metadata(context: RequestContext) -> list[tuple[str, str]]:
@@ -14,4 +19,7 @@ def build_grpc_metadata(context: RequestContext) -> list[tuple[str, str]]:
     if context.test_scenario:
         metadata.append(("x-test-scenario", context.test_scenario))
 
+    if span_context := context.span_context:
+        metadata.append((TRACEPARENT_HEADER, format_traceparent(span_context)))
+
     return metadata
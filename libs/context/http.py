@@ -1,7 +1,24 @@
 from fastapi import Request
 
-from libs.context.base import RequestContext
+from libs.context.base import RequestContext, build_request_context
+from libs.tracing.span import get_current_span_context
+from libs.tracing.propagation import TRACEPARENT_HEADER, parse_traceparent, format_traceparent
 
 
 def get_http_request_context(request: Request) -> RequestContext:
-    return RequestContext(test_scenario=request.headers.get("x-test-scenario"))
+    return build_request_context(
+        test_scenario=request.headers.get("x-test-scenario"),
+        span_context=get_current_span_context() or parse_traceparent(request.headers.get(TRACEPARENT_HEADER))
+    )
+
+
+def build_http_headers(context: RequestContext) -> dict[str, str]:
+    headers: dict[str, str] = {}
+
+    if context.test_scenario:
+        headers["x-test-scenario"] = context.test_scenario
+
+    if span_context := context.span_context:
+        headers[TRACEPARENT_HEADER] = format_traceparent(span_context)
+
+    return headers
@@ -0,0 +1,28 @@
+from typing import Sequence
+
+from libs.context.base import RequestContext, build_request_context
+from libs.tracing.propagation import TRACEPARENT_HEADER, parse_traceparent, format_traceparent
+
+KafkaHeaders = Sequence[tuple[str, bytes]]
+
+
+def get_kafka_request_context(headers: KafkaHeaders | None) -> RequestContext:
+    headers = dict(headers or ())
+    test_scenario = headers.get("x-test-scenario")
+
+    return build_request_context(
+        test_scenario=test_scenario.decode() if test_scenario else None,
+        span_context=parse_traceparent(headers.get(TRACEPARENT_HEADER))
+    )
+
+
+def build_kafka_headers(context: RequestContext) -> list[tuple[str, bytes]]:
+    headers: list[tuple[str, bytes]] = []
+
+    if context.test_scenario:
+        headers.append(("x-test-scenario", context.test_scenario.encode()))
+
+    if span_context := context.span_context:
+        headers.append((TRACEPARENT_HEADER, format_traceparent(span_context).encode()))
+
+    return headers
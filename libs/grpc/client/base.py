@@ -3,10 +3,15 @@ from logging import Logger
 import grpc
 import grpc.experimental.gevent as grpc_gevent
 
+from libs.base.circuit_breaker import CircuitBreaker
+from libs.base.retry import RetryPolicy
 from libs.config.grpc import GRPCClientConfig
+from libs.grpc.client.interceptors.circuit_breaker_interceptor import GRPCCircuitBreakerInterceptor
 from libs.grpc.client.interceptors.logger_interceptor import GRPCLoggerInterceptor
+from libs.grpc.client.interceptors.metrics_interceptor import GRPCMetricsInterceptor
 from libs.grpc.client.interceptors.retries_interceptor import GRPCRetriesInterceptor, DEFAULT_GRPC_RETRY_CODES
 from libs.grpc.client.interceptors.timeout_interceptor import GRPCTimeoutInterceptor
+from libs.grpc.client.interceptors.tracing_interceptor import GRPCTracingInterceptor
 
 grpc_gevent.init_gevent()
 
@@ -22,9 +27,18 @@ def build_grpc_channel(
         retry_codes: tuple[grpc.StatusCode, ...] = DEFAULT_GRPC_RETRY_CODES
 ) -> grpc.Channel:
     interceptors = [
+        GRPCTracingInterceptor(downstream=logger.name),
+        GRPCMetricsInterceptor(downstream=logger.name),
         GRPCLoggerInterceptor(logger=logger),
+        GRPCCircuitBreakerInterceptor(
+            breaker=CircuitBreaker(name=logger.name, config=config.circuit_breaker, logger=logger)
+        ),
         GRPCTimeoutInterceptor(timeout=config.timeout),
-        GRPCRetriesInterceptor(logger=logger, max_retries=config.retries, retry_codes=retry_codes)
+        GRPCRetriesInterceptor(
+            logger=logger,
+            policy=RetryPolicy(config=config.retry, max_retries=config.retries),
+            retry_codes=retry_codes
+        )
     ]
 
     return grpc.aio.insecure_channel(config.url, interceptors=interceptors)
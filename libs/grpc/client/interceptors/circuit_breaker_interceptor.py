@@ -0,0 +1,57 @@
+from typing import Callable
+
+import grpc
+from grpc.aio import UnaryUnaryClientInterceptor, ClientCallDetails, AioRpcError, Metadata
+from grpc.aio._call import UnaryUnaryCall
+from grpc.aio._typing import RequestType, ResponseType
+
+from libs.base.circuit_breaker import CircuitBreaker
+
+DEFAULT_GRPC_FAILURE_CODES: tuple[grpc.StatusCode, ...] = (
+    grpc.StatusCode.UNKNOWN,
+    grpc.StatusCode.INTERNAL,
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+)
+
+
+class GRPCCircuitBreakerInterceptor(UnaryUnaryClientInterceptor):
+    def __init__(
+            self,
+            breaker: CircuitBreaker,
+            failure_codes: tuple[grpc.StatusCode, ...] = DEFAULT_GRPC_FAILURE_CODES
+    ):
+        self.breaker = breaker
+        self.failure_codes = failure_codes
+
+    async def intercept_unary_unary(
+            self,
+            continuation: Callable[[ClientCallDetails, RequestType], UnaryUnaryCall],
+            client_call_details: ClientCallDetails,
+            request: RequestType,
+    ) -> UnaryUnaryCall | ResponseType:
+        if not self.breaker.allow_request():
+            raise AioRpcError(
+                code=grpc.StatusCode.UNAVAILABLE,
+                details=f"Circuit breaker for {self.breaker.name} is open",
+                initial_metadata=Metadata(),
+                trailing_metadata=Metadata(),
+            )
+
+        try:
+            response = await continuation(client_call_details, request)
+            code = await response.code()
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+
+        if code in self.failure_codes:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+        return response
@@ -5,6 +5,8 @@ from grpc.aio import UnaryUnaryClientInterceptor, ClientCallDetails
 from grpc.aio._call import UnaryUnaryCall
 from grpc.aio._typing import RequestType, ResponseType
 
+from libs.logger import ACCESS_LOG
+
 
 class GRPCLoggerInterceptor(UnaryUnaryClientInterceptor):
     def __init__(self, logger: Logger):
@@ -16,10 +18,10 @@ class GRPCLoggerInterceptor(UnaryUnaryClientInterceptor):
             client_call_details: ClientCallDetails,
             request: RequestType,
     ) -> UnaryUnaryCall | ResponseType:
-        self.logger.info(f"REQUEST: {client_call_details.method}")
+        self.logger.info("REQUEST: %s", client_call_details.method, extra=ACCESS_LOG)
 
         response = await continuation(client_call_details, request)
 
-        self.logger.info(f"RESPONSE: {client_call_details.method}")
+        self.logger.info("RESPONSE: %s", client_call_details.method, extra=ACCESS_LOG)
 
         return response
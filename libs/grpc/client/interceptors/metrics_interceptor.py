@@ -0,0 +1,35 @@
+import time
+from typing import Callable
+
+from grpc.aio import UnaryUnaryClientInterceptor, ClientCallDetails, AioRpcError
+from grpc.aio._call import UnaryUnaryCall
+from grpc.aio._typing import RequestType, ResponseType
+
+from libs.metrics.grpc import GRPC_CLIENT_REQUESTS, GRPC_CLIENT_REQUEST_DURATION
+
+
+class GRPCMetricsInterceptor(UnaryUnaryClientInterceptor):
+    def __init__(self, downstream: str):
+        self.downstream = downstream
+
+    async def intercept_unary_unary(
+            self,
+            continuation: Callable[[ClientCallDetails, RequestType], UnaryUnaryCall],
+            client_call_details: ClientCallDetails,
+            request: RequestType,
+    ) -> UnaryUnaryCall | ResponseType:
+        method = client_call_details.method
+        method = method.decode() if isinstance(method, bytes) else method
+
+        code = 'UNKNOWN'
+        start = time.perf_counter()
+        try:
+            response = await continuation(client_call_details, request)
+            code = (await response.code()).name
+            return response
+        except AioRpcError as error:
+            code = error.code().name
+            raise
+        finally:
+            GRPC_CLIENT_REQUEST_DURATION.labels(self.downstream, method).observe(time.perf_counter() - start)
+            GRPC_CLIENT_REQUESTS.labels(self.downstream, method, code).inc()
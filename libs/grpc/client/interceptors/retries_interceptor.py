@@ -1,4 +1,5 @@
 import asyncio
+import time
 from logging import Logger
 from typing import Callable
 
@@ -7,23 +8,36 @@ from grpc.aio import UnaryUnaryClientInterceptor, ClientCallDetails
 from grpc.aio._call import UnaryUnaryCall
 from grpc.aio._typing import RequestType, ResponseType
 
+from libs.base.retry import RetryPolicy
+
 DEFAULT_GRPC_RETRY_CODES: tuple[grpc.StatusCode, ...] = (
     grpc.StatusCode.UNAVAILABLE,
     grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
 )
 
 
+async def get_retry_pushback(call: UnaryUnaryCall) -> float | None:
+    metadata = dict(await call.trailing_metadata() or ())
+    value = metadata.get("grpc-retry-pushback-ms")
+    if value is None:
+        return None
+
+    try:
+        return int(value) / 1000
+    except ValueError:
+        return -1.0
+
+
 class GRPCRetriesInterceptor(UnaryUnaryClientInterceptor):
     def __init__(
             self,
             logger: Logger,
-            max_retries: int = 5,
-            retry_delay: float = 0.5,
+            policy: RetryPolicy,
             retry_codes: tuple[grpc.StatusCode, ...] = DEFAULT_GRPC_RETRY_CODES
     ):
         self.logger = logger
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
+        self.policy = policy
         self.retry_codes = retry_codes
 
     async def intercept_unary_unary(
@@ -32,17 +46,37 @@ class GRPCRetriesInterceptor(UnaryUnaryClientInterceptor):
             client_call_details: ClientCallDetails,
             request: RequestType,
     ) -> UnaryUnaryCall | ResponseType:
-        response: UnaryUnaryCall | None = None
-        for _ in range(self.max_retries):
+        deadline = None
+        if client_call_details.timeout is not None:
+            deadline = time.monotonic() + client_call_details.timeout
+
+        attempt = 0
+        while True:
+            if deadline is not None:
+                client_call_details = client_call_details._replace(timeout=max(deadline - time.monotonic(), 0.0))
+
             response = await continuation(client_call_details, request)
             code = await response.code()
             if code not in self.retry_codes:
                 return response
 
+            pushback = await get_retry_pushback(response)
+            if pushback is not None and pushback < 0:
+                self.logger.error(f'Server pushback forbids retrying {client_call_details.method}')
+                return response
+
+            delay = self.policy.get_delay(attempt, pushback)
+            if reason := self.policy.get_stop_reason(attempt, delay, deadline):
+                self.logger.error(
+                    f'Giving up on {client_call_details.method} after {attempt + 1} attempts: '
+                    f'{reason} (last code="{code}")'
+                )
+                return response
+
             self.logger.error(
-                f'Unexpected response code: "{code}" for {client_call_details.method}, retrying'
+                f'Unexpected response code: "{code}" for {client_call_details.method}, '
+                f'retrying in {delay:.2f}s'
             )
 
-            await asyncio.sleep(self.retry_delay)
-
-        return response
+            await asyncio.sleep(delay)
+            attempt += 1
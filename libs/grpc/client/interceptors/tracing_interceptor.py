@@ -0,0 +1,51 @@
+from typing import Callable
+
+import grpc
+from grpc.aio import UnaryUnaryClientInterceptor, ClientCallDetails, AioRpcError, Metadata
+from grpc.aio._call import UnaryUnaryCall
+from grpc.aio._typing import RequestType, ResponseType
+
+from libs.tracing.base import tracer
+from libs.tracing.propagation import TRACEPARENT_HEADER, parse_traceparent, format_traceparent
+from libs.tracing.span import SpanKind, SpanStatus
+
+
+class GRPCTracingInterceptor(UnaryUnaryClientInterceptor):
+    def __init__(self, downstream: str):
+        self.downstream = downstream
+
+    async def intercept_unary_unary(
+            self,
+            continuation: Callable[[ClientCallDetails, RequestType], UnaryUnaryCall],
+            client_call_details: ClientCallDetails,
+            request: RequestType,
+    ) -> UnaryUnaryCall | ResponseType:
+        method = client_call_details.method
+        method = method.decode() if isinstance(method, bytes) else method
+        metadata = [
+            (key, value) for key, value in (client_call_details.metadata or ())
+            if key != TRACEPARENT_HEADER
+        ]
+
+        with tracer.start_span(
+                name=method,
+                kind=SpanKind.CLIENT,
+                parent=parse_traceparent(dict(client_call_details.metadata or ()).get(TRACEPARENT_HEADER)),
+                attributes={'rpc.system': 'grpc', 'rpc.method': method, 'peer.service': self.downstream}
+        ) as span:
+            metadata.append((TRACEPARENT_HEADER, format_traceparent(span.context)))
+            client_call_details = client_call_details._replace(metadata=Metadata(*metadata))
+
+            code = grpc.StatusCode.UNKNOWN
+            try:
+                response = await continuation(client_call_details, request)
+                code = await response.code()
+            except AioRpcError as error:
+                code = error.code()
+                raise
+            finally:
+                span.set_attribute('rpc.grpc.status_code', code.name)
+                if code != grpc.StatusCode.OK:
+                    span.status = SpanStatus.ERROR
+
+            return response
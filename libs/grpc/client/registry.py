@@ -0,0 +1,33 @@
+import grpc
+
+from libs.config.grpc import GRPCClientConfig
+from libs.grpc.client.base import build_grpc_channel
+from libs.grpc.client.interceptors.retries_interceptor import DEFAULT_GRPC_RETRY_CODES
+from libs.logger import get_logger
+
+
+class GRPCChannelRegistry:
+    def __init__(self) -> None:
+        self.channels: dict[str, grpc.aio.Channel] = {}
+
+    def get_channel(
+            self,
+            name: str,
+            config: GRPCClientConfig,
+            retry_codes: tuple[grpc.StatusCode, ...] = DEFAULT_GRPC_RETRY_CODES
+    ) -> grpc.aio.Channel:
+        channel = self.channels.get(name)
+        if channel is None:
+            channel = build_grpc_channel(logger=get_logger(name), config=config, retry_codes=retry_codes)
+            self.channels[name] = channel
+
+        return channel
+
+    async def close(self) -> None:
+        channels, self.channels = self.channels, {}
+        for name, channel in channels.items():
+            await channel.close()
+            get_logger(name).info("gRPC channel closed")
+
+
+grpc_channel_registry = GRPCChannelRegistry()
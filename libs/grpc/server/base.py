@@ -6,6 +6,8 @@ import grpc
 from libs.config.grpc import GRPCServerConfig
 from libs.grpc.server.interceptors.exception_interceptor import GRPCExceptionInterceptor
 from libs.grpc.server.interceptors.logger_interceptor import GRPCLoggerInterceptor
+from libs.grpc.server.interceptors.metrics_interceptor import GRPCMetricsInterceptor
+from libs.grpc.server.interceptors.tracing_interceptor import GRPCTracingInterceptor
 
 
 def build_grpc_server(config: GRPCServerConfig, logger: Logger) -> grpc.aio.Server:
@@ -14,6 +16,8 @@ def build_grpc_server(config: GRPCServerConfig, logger: Logger) -> grpc.aio.Serv
     server = grpc.aio.server(
         futures.ThreadPoolExecutor(max_workers=100),
         interceptors=[
+            GRPCTracingInterceptor(),
+            GRPCMetricsInterceptor(),
             GRPCLoggerInterceptor(logger),
             GRPCExceptionInterceptor(logger)
         ]
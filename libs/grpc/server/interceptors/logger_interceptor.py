@@ -4,6 +4,8 @@ from typing import Callable, Awaitable
 from grpc import RpcMethodHandler, HandlerCallDetails
 from grpc.aio import ServerInterceptor
 
+from libs.logger import ACCESS_LOG
+
 
 class GRPCLoggerInterceptor(ServerInterceptor):
     def __init__(self, logger: Logger):
@@ -20,9 +22,9 @@ class GRPCLoggerInterceptor(ServerInterceptor):
             original_handler = handler.unary_unary
 
             async def new_unary_unary(request, context):
-                self.logger.info(f"Request: {handler_call_details.method}")
+                self.logger.info("Request: %s", handler_call_details.method, extra=ACCESS_LOG)
                 response = await original_handler(request, context)
-                self.logger.info(f"Response: {handler_call_details.method}")
+                self.logger.info("Response: %s", handler_call_details.method, extra=ACCESS_LOG)
                 return response
 
             return handler._replace(unary_unary=new_unary_unary)
@@ -0,0 +1,55 @@
+import time
+from typing import Callable, Awaitable
+
+import grpc
+from grpc import RpcMethodHandler, HandlerCallDetails
+from grpc.aio import ServerInterceptor, ServicerContext
+
+from libs.metrics.grpc import GRPC_SERVER_REQUESTS, GRPC_SERVER_REQUEST_DURATION
+
+
+def record_grpc_server_request(method: str, context: ServicerContext, start: float, failed: bool) -> None:
+    code = context.code() or (grpc.StatusCode.UNKNOWN if failed else grpc.StatusCode.OK)
+
+    GRPC_SERVER_REQUEST_DURATION.labels(method).observe(time.perf_counter() - start)
+    GRPC_SERVER_REQUESTS.labels(method, code.name).inc()
+
+
+class GRPCMetricsInterceptor(ServerInterceptor):
+    async def intercept_service(
+            self,
+            continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+            handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        method = handler_call_details.method
+
+        if handler is None or handler.request_streaming:
+            return handler
+
+        if not handler.response_streaming:
+            original_unary_unary = handler.unary_unary
+
+            async def new_unary_unary(request, context: ServicerContext):
+                failed, start = True, time.perf_counter()
+                try:
+                    response = await original_unary_unary(request, context)
+                    failed = False
+                    return response
+                finally:
+                    record_grpc_server_request(method, context, start, failed)
+
+            return handler._replace(unary_unary=new_unary_unary)
+
+        original_unary_stream = handler.unary_stream
+
+        async def new_unary_stream(request, context: ServicerContext):
+            failed, start = True, time.perf_counter()
+            try:
+                async for response in original_unary_stream(request, context):
+                    yield response
+                failed = False
+            finally:
+                record_grpc_server_request(method, context, start, failed)
+
+        return handler._replace(unary_stream=new_unary_stream)
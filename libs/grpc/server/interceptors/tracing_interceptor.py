@@ -0,0 +1,67 @@
+from typing import Callable, Awaitable
+
+import grpc
+from grpc import RpcMethodHandler, HandlerCallDetails
+from grpc.aio import ServerInterceptor, ServicerContext
+
+from libs.tracing.base import tracer
+from libs.tracing.propagation import TRACEPARENT_HEADER, parse_traceparent
+from libs.tracing.span import Span, SpanKind, SpanStatus
+
+
+def finish_grpc_server_span(span: Span, context: ServicerContext) -> None:
+    code = context.code()
+    if code is None:
+        return
+
+    span.set_attribute('rpc.grpc.status_code', code.name)
+    if code != grpc.StatusCode.OK:
+        span.status = SpanStatus.ERROR
+
+
+class GRPCTracingInterceptor(ServerInterceptor):
+    async def intercept_service(
+            self,
+            continuation: Callable[[HandlerCallDetails], Awaitable[RpcMethodHandler]],
+            handler_call_details: HandlerCallDetails,
+    ) -> RpcMethodHandler:
+        handler = await continuation(handler_call_details)
+        if handler is None or handler.request_streaming:
+            return handler
+
+        method = handler_call_details.method
+        parent = parse_traceparent(dict(handler_call_details.invocation_metadata or ()).get(TRACEPARENT_HEADER))
+
+        if not handler.response_streaming:
+            original_unary_unary = handler.unary_unary
+
+            async def new_unary_unary(request, context: ServicerContext):
+                with tracer.start_span(
+                        name=method,
+                        kind=SpanKind.SERVER,
+                        parent=parent,
+                        attributes={'rpc.system': 'grpc', 'rpc.method': method}
+                ) as span:
+                    try:
+                        return await original_unary_unary(request, context)
+                    finally:
+                        finish_grpc_server_span(span, context)
+
+            return handler._replace(unary_unary=new_unary_unary)
+
+        original_unary_stream = handler.unary_stream
+
+        async def new_unary_stream(request, context: ServicerContext):
+            with tracer.start_span(
+                    name=method,
+                    kind=SpanKind.SERVER,
+                    parent=parent,
+                    attributes={'rpc.system': 'grpc', 'rpc.method': method}
+            ) as span:
+                try:
+                    async for response in original_unary_stream(request, context):
+                        yield response
+                finally:
+                    finish_grpc_server_span(span, context)
+
+        return handler._replace(unary_stream=new_unary_stream)
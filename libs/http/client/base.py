@@ -1,33 +1,53 @@
 from logging import Logger
 
-from httpx import AsyncClient, Response, AsyncHTTPTransport, QueryParams, Headers
+from httpx import AsyncClient, Response, AsyncHTTPTransport, QueryParams, Limits
 
+from libs.base.circuit_breaker import CircuitBreaker
+from libs.base.retry import RetryPolicy
 from libs.config.http import HTTPClientConfig
+from libs.context.base import RequestContext
+from libs.context.http import build_http_headers
 from libs.http.client.event_hooks.logger_event_hook import HTTPLoggerEventHook
+from libs.http.client.transports.circuit_breaker import CircuitBreakerTransport
+from libs.http.client.transports.metrics import MetricsTransport
 from libs.http.client.transports.retry import RetryTransport
+from libs.http.client.transports.tracing import TracingTransport
 
 
 class HTTPClient:
-    def __init__(self, client: AsyncClient) -> None:
+    def __init__(self, client: AsyncClient, context: RequestContext) -> None:
         self.client = client
+        self.context = context
 
     async def get(self, url: str, params: QueryParams | None = None) -> Response:
-        return await self.client.get(url=url, params=params)
+        return await self.client.get(url=url, params=params, headers=build_http_headers(self.context))
 
 
-def build_http_client(logger: Logger, config: HTTPClientConfig, headers: Headers) -> AsyncClient:
+def build_http_client(logger: Logger, config: HTTPClientConfig) -> AsyncClient:
     logger_event_hook = HTTPLoggerEventHook(logger=logger)
     retry_transport = RetryTransport(
         logger=logger,
-        transport=AsyncHTTPTransport(),
-        max_retries=config.retries
+        transport=AsyncHTTPTransport(
+            limits=Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry
+            )
+        ),
+        policy=RetryPolicy(config=config.retry, max_retries=config.retries),
+        timeout=config.timeout
     )
+    circuit_breaker_transport = CircuitBreakerTransport(
+        breaker=CircuitBreaker(name=logger.name, config=config.circuit_breaker, logger=logger),
+        transport=retry_transport
+    )
+    metrics_transport = MetricsTransport(downstream=logger.name, transport=circuit_breaker_transport)
+    tracing_transport = TracingTransport(downstream=logger.name, transport=metrics_transport)
 
     return AsyncClient(
-        headers=headers,
         timeout=config.timeout,
         base_url=config.url,
-        transport=retry_transport,
+        transport=tracing_transport,
         event_hooks={
             'request': [logger_event_hook.request],
             'response': [logger_event_hook.response]
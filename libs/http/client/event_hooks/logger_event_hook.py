@@ -2,14 +2,18 @@ from logging import Logger
 
 from httpx import Request, Response
 
+from libs.logger import ACCESS_LOG
+
 
 class HTTPLoggerEventHook:
     def __init__(self, logger: Logger):
         self.logger = logger
 
     async def request(self, request: Request):
-        self.logger.info(f"{request.method} {request.url} - Waiting for response")
+        self.logger.info("%s %s - Waiting for response", request.method, request.url, extra=ACCESS_LOG)
 
     async def response(self, response: Response):
         request = response.request
-        self.logger.info(f"{request.method} {request.url} - Status {response.status_code}")
+        self.logger.info(
+            "%s %s - Status %s", request.method, request.url, response.status_code, extra=ACCESS_LOG
+        )
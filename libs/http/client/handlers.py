@@ -4,6 +4,8 @@ from typing import Callable, Coroutine, Any
 
 from httpx import Response, HTTPStatusError
 
+from libs.base.circuit_breaker import CircuitBreakerOpenError
+
 APIFunc = Callable[..., Coroutine[Any, Any, Response]]
 
 
@@ -21,6 +23,12 @@ def handle_http_error(client: str, exception: type[HTTPClientError]):
         async def inner(*args, **kwargs):
             try:
                 response = await func(*args, **kwargs)
+            except CircuitBreakerOpenError as error:
+                raise exception(
+                    client=client,
+                    details=str(error),
+                    status_code=HTTPStatus.SERVICE_UNAVAILABLE
+                ) from error
             except Exception as error:
                 raise exception(
                     client=client,
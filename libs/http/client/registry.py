@@ -0,0 +1,27 @@
+from httpx import AsyncClient
+
+from libs.config.http import HTTPClientConfig
+from libs.http.client.base import build_http_client
+from libs.logger import get_logger
+
+
+class HTTPClientRegistry:
+    def __init__(self) -> None:
+        self.clients: dict[str, AsyncClient] = {}
+
+    def get_client(self, name: str, config: HTTPClientConfig) -> AsyncClient:
+        client = self.clients.get(name)
+        if client is None or client.is_closed:
+            client = build_http_client(logger=get_logger(name), config=config)
+            self.clients[name] = client
+
+        return client
+
+    async def close(self) -> None:
+        clients, self.clients = self.clients, {}
+        for name, client in clients.items():
+            await client.aclose()
+            get_logger(name).info("HTTP client closed")
+
+
+http_client_registry = HTTPClientRegistry()
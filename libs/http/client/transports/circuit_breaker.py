@@ -0,0 +1,34 @@
+from http import HTTPStatus
+
+from httpx import Request, Response, AsyncBaseTransport
+
+from libs.base.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+
+
+class CircuitBreakerTransport(AsyncBaseTransport):
+    def __init__(self, transport: AsyncBaseTransport, breaker: CircuitBreaker):
+        self.breaker = breaker
+        self.transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        if not self.breaker.allow_request():
+            raise CircuitBreakerOpenError(self.breaker.name)
+
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.release()
+            raise
+
+        if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,28 @@
+import time
+
+from httpx import Request, Response, AsyncBaseTransport
+
+from libs.metrics.http import HTTP_CLIENT_REQUESTS, HTTP_CLIENT_REQUEST_DURATION
+
+
+class MetricsTransport(AsyncBaseTransport):
+    def __init__(self, transport: AsyncBaseTransport, downstream: str):
+        self.transport = transport
+        self.downstream = downstream
+
+    async def handle_async_request(self, request: Request) -> Response:
+        status = 'ERROR'
+        start = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+            status = str(response.status_code)
+            return response
+        except Exception as error:
+            status = type(error).__name__
+            raise
+        finally:
+            HTTP_CLIENT_REQUEST_DURATION.labels(self.downstream, request.method).observe(time.perf_counter() - start)
+            HTTP_CLIENT_REQUESTS.labels(self.downstream, request.method, status).inc()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
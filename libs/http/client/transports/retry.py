@@ -1,48 +1,78 @@
 import asyncio
 import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from http import HTTPStatus
 
 from httpx import Request, Response, AsyncBaseTransport
 
+from libs.base.retry import RetryPolicy
+
+
+def get_retry_after(response: Response) -> float | None:
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
 
 class RetryTransport(AsyncBaseTransport):
     def __init__(
             self,
             logger: logging.Logger,
             transport: AsyncBaseTransport,
-            max_retries: int = 5,
-            retry_delay: float = 0.5,
+            policy: RetryPolicy,
+            timeout: float | None = None,
             retry_status_codes: tuple[HTTPStatus, ...] = (
                     HTTPStatus.BAD_GATEWAY,
                     HTTPStatus.GATEWAY_TIMEOUT,
                     HTTPStatus.SERVICE_UNAVAILABLE,
                     HTTPStatus.INTERNAL_SERVER_ERROR,
+                    HTTPStatus.TOO_MANY_REQUESTS,
             )
     ):
         self.logger = logger
+        self.policy = policy
+        self.timeout = timeout
         self.transport = transport
-        self.max_retries = max_retries
-        self.retry_delay = retry_delay
         self.retry_status_codes = retry_status_codes
 
     async def handle_async_request(self, request: Request) -> Response:
-        last_response: Response | None = None
-        for attempt in range(self.max_retries):
-            last_response = await self.transport.handle_async_request(request)
-            if last_response.status_code not in self.retry_status_codes:
-                return last_response
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+
+        attempt = 0
+        while True:
+            response = await self.transport.handle_async_request(request)
+            if response.status_code not in self.retry_status_codes:
+                return response
+
+            delay = self.policy.get_delay(attempt, get_retry_after(response))
+            if reason := self.policy.get_stop_reason(attempt, delay, deadline):
+                self.logger.error(
+                    f"Giving up on {request.method} {request.url} after {attempt + 1} attempts: "
+                    f"{reason} (last status={response.status_code})"
+                )
+                return response
 
             self.logger.warning(
-                f"Attempt {attempt + 1}/{self.max_retries} failed "
-                f"with status={last_response.status_code} for {request.method} {request.url}. "
-                f"Retrying in {self.retry_delay:.1f}s..."
+                f"Attempt {attempt + 1}/{self.policy.max_retries} failed "
+                f"with status={response.status_code} for {request.method} {request.url}. "
+                f"Retrying in {delay:.2f}s..."
             )
 
-            await asyncio.sleep(self.retry_delay)
-
-        self.logger.error(
-            f"All {self.max_retries} attempts failed for "
-            f"{request.method} {request.url} (last status={last_response.status_code})"
-        )
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
 
-        return last_response
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,36 @@
+from http import HTTPStatus
+
+from httpx import Request, Response, AsyncBaseTransport
+
+from libs.tracing.base import tracer
+from libs.tracing.propagation import TRACEPARENT_HEADER, parse_traceparent, format_traceparent
+from libs.tracing.span import SpanKind, SpanStatus
+
+
+class TracingTransport(AsyncBaseTransport):
+    def __init__(self, transport: AsyncBaseTransport, downstream: str):
+        self.transport = transport
+        self.downstream = downstream
+
+    async def handle_async_request(self, request: Request) -> Response:
+        with tracer.start_span(
+                name=f"{request.method} {self.downstream}",
+                kind=SpanKind.CLIENT,
+                parent=parse_traceparent(request.headers.get(TRACEPARENT_HEADER)),
+                attributes={
+                    'peer.service': self.downstream,
+                    'url.full': str(request.url),
+                    'http.request.method': request.method,
+                }
+        ) as span:
+            request.headers[TRACEPARENT_HEADER] = format_traceparent(span.context)
+
+            response = await self.transport.handle_async_request(request)
+            span.set_attribute('http.response.status_code', response.status_code)
+            if response.status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                span.status = SpanStatus.ERROR
+
+            return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
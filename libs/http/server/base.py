@@ -2,6 +2,8 @@ import uvicorn
 
 from libs.config.http import HTTPServerConfig
 
+HTTP_SERVER_WORKERS = 3
+
 
 def build_http_server(app: str, config: HTTPServerConfig):
-    uvicorn.run(app=app, host=str(config.host), port=config.port, workers=3)
+    uvicorn.run(app=app, host=str(config.host), port=config.port, workers=HTTP_SERVER_WORKERS)
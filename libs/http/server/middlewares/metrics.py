@@ -0,0 +1,35 @@
+import time
+from http import HTTPStatus
+
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from libs.metrics.http import HTTP_SERVER_REQUESTS, HTTP_SERVER_REQUEST_DURATION
+
+
+class HTTPMetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = HTTPStatus.INTERNAL_SERVER_ERROR
+
+        async def send_with_status(message: Message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get('route')
+            route = route.path if route else 'UNMATCHED'
+
+            HTTP_SERVER_REQUEST_DURATION.labels(scope['method'], route).observe(time.perf_counter() - start)
+            HTTP_SERVER_REQUESTS.labels(scope['method'], route, str(int(status))).inc()
@@ -0,0 +1,44 @@
+from http import HTTPStatus
+
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from libs.tracing.base import tracer
+from libs.tracing.propagation import TRACEPARENT_HEADER, parse_traceparent
+from libs.tracing.span import SpanKind, SpanStatus
+
+
+class HTTPTracingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = HTTPStatus.INTERNAL_SERVER_ERROR
+
+        async def send_with_status(message: Message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+
+            await send(message)
+
+        headers = dict(scope['headers'])
+        with tracer.start_span(
+                name=f"{scope['method']} {scope['path']}",
+                kind=SpanKind.SERVER,
+                parent=parse_traceparent(headers.get(TRACEPARENT_HEADER.encode())),
+                attributes={'http.request.method': scope['method'], 'url.path': scope['path']}
+        ) as span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                if route := scope.get('route'):
+                    span.name = f"{scope['method']} {route.path}"
+                    span.set_attribute('http.route', route.path)
+
+                span.set_attribute('http.response.status_code', int(status))
+                if status >= HTTPStatus.INTERNAL_SERVER_ERROR:
+                    span.status = SpanStatus.ERROR
@@ -1,6 +1,6 @@
 from logging import Logger
 
-from confluent_kafka.admin import AdminClient, NewTopic
+from confluent_kafka.admin import AdminClient, NewTopic, NewPartitions
 
 from libs.config.kafka import KafkaClientConfig
 
@@ -25,5 +25,19 @@ class KafkaAdminClient:
             except Exception as error:
                 if "TopicExistsError" in str(error):
                     self.logger.info(f"Topic '{topic_name}' already exists")
+                    self.create_partitions(topic_name, num_partitions)
                 else:
                     self.logger.error(f"Failed to create topic '{topic_name}': {error}")
+
+    def create_partitions(self, topic: str, num_partitions: int):
+        futures = self.admin.create_partitions([NewPartitions(topic, num_partitions)])
+
+        for topic_name, future in futures.items():
+            try:
+                future.result()
+                self.logger.info(f"Kafka topic '{topic_name}' expanded to {num_partitions} partitions")
+            except Exception as error:
+                if "INVALID_PARTITIONS" in str(error):
+                    self.logger.info(f"Topic '{topic_name}' already has at least {num_partitions} partitions")
+                else:
+                    self.logger.error(f"Failed to expand topic '{topic_name}': {error}")
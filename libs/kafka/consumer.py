@@ -1,11 +1,191 @@
+import asyncio
+import time
 from logging import Logger
 from typing import Callable, Awaitable
 
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, ConsumerRebalanceListener, ConsumerRecord, TopicPartition
+from aiokafka.errors import CommitFailedError
 
 from libs.config.kafka import KafkaClientConfig
+from libs.context.kafka import get_kafka_request_context
+from libs.kafka.dead_letter import KafkaDeadLetterPolicy
+from libs.kafka.flow_control import KafkaFlowControl, KafkaSaturationProbe
+from libs.kafka.message import KafkaMessage, build_kafka_message
+from libs.logger import ACCESS_LOG
+from libs.metrics.kafka import (
+    KAFKA_CONSUMER_LAG,
+    KAFKA_CONSUMER_MESSAGES,
+    KAFKA_CONSUMER_BATCH_SIZE,
+    KAFKA_CONSUMER_HANDLER_DURATION,
+    KAFKA_CONSUMER_BACKPRESSURE_PAUSES
+)
+from libs.tracing.base import tracer
+from libs.tracing.span import SpanKind
 
-KafkaConsumerHandler = Callable[[str], Awaitable[None]]
+KafkaConsumerHandler = Callable[[KafkaMessage], Awaitable[None]]
+KafkaConsumerBatchHandler = Callable[[list[KafkaMessage]], Awaitable[None]]
+
+
+def record_kafka_consumer_lag(
+        consumer: AIOKafkaConsumer,
+        group_id: str,
+        partition: TopicPartition,
+        offset: int
+) -> int:
+    highwater = consumer.highwater(partition)
+    if highwater is None:
+        return 0
+
+    lag = highwater - offset - 1
+    KAFKA_CONSUMER_LAG.labels(partition.topic, group_id, str(partition.partition)).set(lag)
+
+    return lag
+
+
+class KafkaPartitionWorker:
+    def __init__(
+            self,
+            topic: str,
+            group_id: str,
+            logger: Logger,
+            handler: KafkaConsumerBatchHandler,
+            consumer: AIOKafkaConsumer,
+            partition: TopicPartition,
+            semaphore: asyncio.Semaphore,
+            queue_size: int,
+            flow_control: KafkaFlowControl,
+            dead_letter: KafkaDeadLetterPolicy | None = None
+    ):
+        self.topic = topic
+        self.logger = logger
+        self.handler = handler
+        self.group_id = group_id
+        self.consumer = consumer
+        self.partition = partition
+        self.semaphore = semaphore
+        self.queue_size = queue_size
+        self.dead_letter = dead_letter
+        self.flow_control = flow_control
+
+        self.queue: asyncio.Queue[list[ConsumerRecord] | None] = asyncio.Queue()
+        self.task = asyncio.create_task(self.run())
+
+    def submit(self, records: list[ConsumerRecord]):
+        self.queue.put_nowait(records)
+        if self.queue.qsize() >= self.queue_size:
+            self.consumer.pause(self.partition)
+
+    async def run(self):
+        while (records := await self.queue.get()) is not None:
+            async with self.semaphore:
+                duration = await self.process(records)
+
+            try:
+                await self.consumer.commit({self.partition: records[-1].offset + 1})
+            except CommitFailedError as error:
+                self.logger.warning(f"Failed to commit offset for {self.partition}, batch will be redelivered: {error}")
+
+            lag = record_kafka_consumer_lag(self.consumer, self.group_id, self.partition, records[-1].offset)
+            self.flow_control.observe(len(records), duration, lag)
+
+            if self.resumable and self.partition in self.consumer.paused():
+                self.consumer.resume(self.partition)
+
+    @property
+    def resumable(self) -> bool:
+        return self.queue.qsize() < self.queue_size and not self.flow_control.paused
+
+    async def process(self, records: list[ConsumerRecord]) -> float:
+        self.logger.info(
+            "Received batch of %d messages from partition %d", len(records), self.partition.partition,
+            extra=ACCESS_LOG
+        )
+
+        start = time.perf_counter()
+        with tracer.start_span(
+                name=f"{self.topic} process",
+                kind=SpanKind.CONSUMER,
+                links=[
+                    span_context
+                    for record in records
+                    if (span_context := get_kafka_request_context(record.headers).span_context)
+                ],
+                attributes={
+                    'messaging.system': 'kafka',
+                    'messaging.destination.name': self.topic,
+                    'messaging.consumer.group.name': self.group_id,
+                    'messaging.kafka.partition': self.partition.partition,
+                    'messaging.batch.message_count': len(records),
+                }
+        ):
+            try:
+                await self.handler([build_kafka_message(record) for record in records])
+            except Exception as error:
+                if self.dead_letter is None:
+                    raise
+
+                self.logger.warning(
+                    f"Batch of {len(records)} messages from {self.partition} failed, "
+                    f"handling messages one by one: {error}"
+                )
+                await self.process_isolated(records)
+        duration = time.perf_counter() - start
+        KAFKA_CONSUMER_HANDLER_DURATION.labels(self.topic, self.group_id).observe(duration)
+        KAFKA_CONSUMER_BATCH_SIZE.labels(self.topic, self.group_id).observe(len(records))
+        KAFKA_CONSUMER_MESSAGES.labels(self.topic, self.group_id).inc(len(records))
+
+        return duration
+
+    async def process_isolated(self, records: list[ConsumerRecord]):
+        for record in records:
+            await self.dead_letter.run(
+                record,
+                self.group_id,
+                lambda: self.handler([build_kafka_message(record)])
+            )
+
+    async def stop(self, timeout: float | None = None):
+        while not self.queue.empty():
+            self.queue.get_nowait()
+
+        self.queue.put_nowait(None)
+        _, pending = await asyncio.wait({self.task}, timeout=timeout)
+        if pending:
+            self.logger.warning(
+                f"Batch from {self.partition} still in flight after {timeout:.1f}s, "
+                f"cancelling it and leaving its offset uncommitted"
+            )
+            self.task.cancel()
+
+        await asyncio.gather(self.task, return_exceptions=True)
+
+
+class KafkaPartitionRebalanceListener(ConsumerRebalanceListener):
+    def __init__(
+            self,
+            workers: dict[TopicPartition, KafkaPartitionWorker],
+            logger: Logger,
+            consumer: AIOKafkaConsumer | None = None,
+            flow_control: KafkaFlowControl | None = None,
+            stop_timeout: float | None = None
+    ):
+        self.logger = logger
+        self.workers = workers
+        self.consumer = consumer
+        self.flow_control = flow_control
+        self.stop_timeout = stop_timeout
+
+    async def on_partitions_revoked(self, revoked: set[TopicPartition]):
+        workers = [self.workers.pop(partition) for partition in revoked if partition in self.workers]
+        await asyncio.gather(*(worker.stop(self.stop_timeout) for worker in workers))
+        if revoked:
+            self.logger.info(f"Kafka partitions revoked: {sorted(partition.partition for partition in revoked)}")
+
+    async def on_partitions_assigned(self, assigned: set[TopicPartition]):
+        if assigned and self.consumer and self.flow_control and self.flow_control.paused:
+            self.consumer.pause(*assigned)
+
+        self.logger.info(f"Kafka partitions assigned: {sorted(partition.partition for partition in assigned)}")
 
 
 class KafkaConsumerClient:
@@ -13,20 +193,138 @@ class KafkaConsumerClient:
         self.config = config
         self.logger = logger
 
-    async def start(self, topic: str, group_id: str, handler: KafkaConsumerHandler):
+    async def start(
+            self,
+            topic: str,
+            group_id: str,
+            handler: KafkaConsumerHandler,
+            dead_letter: KafkaDeadLetterPolicy | None = None
+    ):
         consumer = AIOKafkaConsumer(
             topic,
             group_id=group_id,
             bootstrap_servers=self.config.bootstrap_servers,
+            enable_auto_commit=False,
         )
         await consumer.start()
         self.logger.info(f"Kafka consumer started for topic '{topic}'")
 
         try:
-            async for message in consumer:
-                message = message.value.decode("utf-8")
-                self.logger.info(f"Received message: {message}")
-                await handler(message)
+            async for record in consumer:
+                self.logger.info(
+                    "Received message: %s", record.value.decode("utf-8", errors="replace"), extra=ACCESS_LOG
+                )
+
+                start = time.perf_counter()
+                with tracer.start_span(
+                        name=f"{topic} process",
+                        kind=SpanKind.CONSUMER,
+                        parent=get_kafka_request_context(record.headers).span_context,
+                        attributes={
+                            'messaging.system': 'kafka',
+                            'messaging.destination.name': topic,
+                            'messaging.consumer.group.name': group_id,
+                            'messaging.kafka.offset': record.offset,
+                            'messaging.kafka.partition': record.partition,
+                        }
+                ):
+                    message = build_kafka_message(record)
+                    if dead_letter is None:
+                        await handler(message)
+                    else:
+                        await dead_letter.run(record, group_id, lambda: handler(message))
+                KAFKA_CONSUMER_HANDLER_DURATION.labels(topic, group_id).observe(time.perf_counter() - start)
+                KAFKA_CONSUMER_MESSAGES.labels(topic, group_id).inc()
+
+                partition = TopicPartition(record.topic, record.partition)
+                await consumer.commit({partition: record.offset + 1})
+                record_kafka_consumer_lag(consumer, group_id, partition, record.offset)
         finally:
             await consumer.stop()
             self.logger.info("Kafka consumer stopped")
+
+    async def start_batch(
+            self,
+            topic: str,
+            group_id: str,
+            handler: KafkaConsumerBatchHandler,
+            dead_letter: KafkaDeadLetterPolicy | None = None,
+            saturation_probe: KafkaSaturationProbe | None = None
+    ):
+        consumer = AIOKafkaConsumer(
+            group_id=group_id,
+            bootstrap_servers=self.config.bootstrap_servers,
+            enable_auto_commit=False,
+        )
+        workers: dict[TopicPartition, KafkaPartitionWorker] = {}
+        semaphore = asyncio.Semaphore(self.config.consumer_max_in_flight)
+        flow_control = KafkaFlowControl(topic, group_id, self.config, saturation_probe)
+        consumer.subscribe(
+            [topic],
+            listener=KafkaPartitionRebalanceListener(
+                workers,
+                self.logger,
+                consumer,
+                flow_control,
+                self.config.consumer_revoke_timeout
+            )
+        )
+
+        def dispatch(batch: dict[TopicPartition, list[ConsumerRecord]]):
+            for partition, records in batch.items():
+                if not records:
+                    continue
+
+                if partition not in workers:
+                    workers[partition] = KafkaPartitionWorker(
+                        topic=topic,
+                        group_id=group_id,
+                        logger=self.logger,
+                        handler=handler,
+                        consumer=consumer,
+                        partition=partition,
+                        semaphore=semaphore,
+                        queue_size=self.config.consumer_partition_queue_size,
+                        flow_control=flow_control,
+                        dead_letter=dead_letter
+                    )
+
+                workers[partition].submit(records)
+
+        await consumer.start()
+        self.logger.info(f"Kafka batch consumer started for topic '{topic}'")
+
+        try:
+            while True:
+                for worker in workers.values():
+                    if worker.task.done():
+                        worker.task.result()
+
+                if flow_control.is_saturated():
+                    consumer.pause(*consumer.assignment())
+                    if not flow_control.paused:
+                        flow_control.paused = True
+                        KAFKA_CONSUMER_BACKPRESSURE_PAUSES.labels(topic, group_id).inc()
+                        self.logger.warning(f"Downstream saturated, pausing Kafka consumption for topic '{topic}'")
+
+                    dispatch(
+                        await consumer.getmany(timeout_ms=int(self.config.consumer_backpressure_interval * 1000))
+                    )
+                    continue
+
+                if flow_control.paused:
+                    flow_control.paused = False
+                    consumer.resume(*[
+                        partition
+                        for partition in consumer.assignment()
+                        if partition not in workers or workers[partition].resumable
+                    ])
+                    self.logger.info(f"Downstream recovered, resuming Kafka consumption for topic '{topic}'")
+
+                dispatch(
+                    await consumer.getmany(timeout_ms=flow_control.timeout_ms, max_records=flow_control.max_records)
+                )
+        finally:
+            await asyncio.gather(*(worker.stop(self.config.consumer_revoke_timeout) for worker in workers.values()))
+            await consumer.stop()
+            self.logger.info("Kafka batch consumer stopped")
@@ -0,0 +1,174 @@
+import asyncio
+from datetime import datetime, UTC
+from logging import Logger
+from typing import Awaitable, Callable
+
+from aiokafka import AIOKafkaConsumer, ConsumerRecord, TopicPartition
+
+from libs.config.kafka import KafkaClientConfig
+from libs.context.kafka import KafkaHeaders
+from libs.kafka.producer import KafkaProducerClient
+from libs.metrics.kafka import KAFKA_CONSUMER_DEAD_LETTERS, KAFKA_CONSUMER_TRANSIENT_RETRIES
+
+DEAD_LETTER_HEADER_PREFIX = "x-dead-letter-"
+DEAD_LETTER_TOPIC_HEADER = f"{DEAD_LETTER_HEADER_PREFIX}topic"
+DEAD_LETTER_ERROR_MESSAGE_MAX_LENGTH = 1024
+
+KafkaTransientErrorProbe = Callable[[Exception], bool]
+
+
+def build_dead_letter_headers(
+        record: ConsumerRecord,
+        group_id: str,
+        error: Exception,
+        attempts: int
+) -> list[tuple[str, bytes]]:
+    headers = [(key, value) for key, value in record.headers if not key.startswith(DEAD_LETTER_HEADER_PREFIX)]
+    headers.extend([
+        (DEAD_LETTER_TOPIC_HEADER, record.topic.encode()),
+        (f"{DEAD_LETTER_HEADER_PREFIX}partition", str(record.partition).encode()),
+        (f"{DEAD_LETTER_HEADER_PREFIX}offset", str(record.offset).encode()),
+        (f"{DEAD_LETTER_HEADER_PREFIX}group-id", group_id.encode()),
+        (f"{DEAD_LETTER_HEADER_PREFIX}error-type", type(error).__name__.encode()),
+        (f"{DEAD_LETTER_HEADER_PREFIX}error-message", str(error)[:DEAD_LETTER_ERROR_MESSAGE_MAX_LENGTH].encode()),
+        (f"{DEAD_LETTER_HEADER_PREFIX}attempts", str(attempts).encode()),
+        (f"{DEAD_LETTER_HEADER_PREFIX}failed-at", datetime.now(UTC).isoformat().encode()),
+    ])
+
+    return headers
+
+
+def strip_dead_letter_headers(headers: KafkaHeaders) -> list[tuple[str, bytes]]:
+    return [(key, value) for key, value in headers if not key.startswith(DEAD_LETTER_HEADER_PREFIX)]
+
+
+class KafkaDeadLetterPolicy:
+    def __init__(
+            self,
+            topic: str,
+            logger: Logger,
+            config: KafkaClientConfig,
+            producer: KafkaProducerClient,
+            is_transient: KafkaTransientErrorProbe | None = None
+    ):
+        self.topic = topic
+        self.logger = logger
+        self.config = config
+        self.producer = producer
+        self.is_transient = is_transient
+
+    async def run(self, record: ConsumerRecord, group_id: str, handle: Callable[[], Awaitable[None]]):
+        attempts = 0
+        transient_attempts = 0
+        while True:
+            attempts += 1
+            try:
+                await handle()
+                return
+            except ValueError as error:
+                await self.publish(record, group_id, error, attempts)
+                return
+            except Exception as error:
+                if self.is_transient and self.is_transient(error):
+                    attempts -= 1
+                    transient_attempts += 1
+                    await self.wait_transient(record, group_id, error, transient_attempts)
+                    continue
+
+                if attempts > self.config.consumer_retries:
+                    await self.publish(record, group_id, error, attempts)
+                    return
+
+                await asyncio.sleep(self.config.consumer_retry_backoff * 2 ** (attempts - 1))
+
+    async def wait_transient(self, record: ConsumerRecord, group_id: str, error: Exception, attempts: int):
+        backoff = min(self.config.consumer_retry_backoff * 2 ** (attempts - 1), self.config.consumer_retry_backoff_max)
+        KAFKA_CONSUMER_TRANSIENT_RETRIES.labels(record.topic, group_id).inc()
+        self.logger.warning(
+            f"Transient error handling {record.topic}[{record.partition}]@{record.offset}, "
+            f"retrying in {backoff:.1f}s (attempt {attempts}): {type(error).__name__}: {error}"
+        )
+        await asyncio.sleep(backoff)
+
+    async def publish(self, record: ConsumerRecord, group_id: str, error: Exception, attempts: int):
+        await self.producer.send_and_wait(
+            self.topic,
+            key=record.key,
+            value=record.value,
+            headers=build_dead_letter_headers(record, group_id, error, attempts)
+        )
+        KAFKA_CONSUMER_DEAD_LETTERS.labels(record.topic, group_id).inc()
+        self.logger.warning(
+            f"Message {record.topic}[{record.partition}]@{record.offset} moved to '{self.topic}' "
+            f"after {attempts} attempts: {type(error).__name__}: {error}"
+        )
+
+
+async def replay_dead_letters(
+        topic: str,
+        group_id: str,
+        logger: Logger,
+        config: KafkaClientConfig,
+        producer: KafkaProducerClient,
+        limit: int | None = None,
+        idle_timeout: float = 5.0,
+        target_topic: str | None = None
+) -> int:
+    consumer = AIOKafkaConsumer(
+        topic,
+        group_id=group_id,
+        bootstrap_servers=config.bootstrap_servers,
+        auto_offset_reset="earliest",
+        enable_auto_commit=False,
+    )
+    await consumer.start()
+    logger.info(f"Replaying dead letters from '{topic}'")
+
+    replayed = 0
+    try:
+        while limit is None or replayed < limit:
+            max_records = config.batch_max_records
+            if limit is not None:
+                max_records = min(max_records, limit - replayed)
+
+            batch = await consumer.getmany(timeout_ms=int(idle_timeout * 1000), max_records=max_records)
+            if not any(batch.values()):
+                break
+
+            deliveries = []
+            offsets: dict[TopicPartition, int] = {}
+            unroutable: list[ConsumerRecord] = []
+            for partition, records in batch.items():
+                for record in records:
+                    destination = target_topic or dict(record.headers).get(DEAD_LETTER_TOPIC_HEADER, b"").decode()
+                    if not destination:
+                        unroutable.append(record)
+                        break
+
+                    deliveries.append(
+                        await producer.send(
+                            destination,
+                            key=record.key,
+                            value=record.value,
+                            headers=strip_dead_letter_headers(record.headers)
+                        )
+                    )
+                    offsets[partition] = record.offset + 1
+
+            await asyncio.gather(*deliveries)
+            replayed += len(deliveries)
+            if offsets:
+                await consumer.commit(offsets)
+
+            logger.info(f"Replayed {replayed} dead letters")
+            if unroutable:
+                logger.error(
+                    "Dead letters without an original topic header, replay stopped before them and left them "
+                    f"uncommitted (re-run with a target topic to re-inject them): "
+                    f"{', '.join(f'{record.partition}@{record.offset}' for record in unroutable)}"
+                )
+                break
+    finally:
+        await consumer.stop()
+
+    return replayed
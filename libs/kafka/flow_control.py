@@ -0,0 +1,41 @@
+from typing import Callable
+
+from libs.config.kafka import KafkaClientConfig
+from libs.metrics.kafka import KAFKA_CONSUMER_BATCH_LIMIT
+
+KafkaSaturationProbe = Callable[[], bool]
+
+
+class KafkaFlowControl:
+    def __init__(
+            self,
+            topic: str,
+            group_id: str,
+            config: KafkaClientConfig,
+            saturation_probe: KafkaSaturationProbe | None = None
+    ):
+        self.topic = topic
+        self.config = config
+        self.group_id = group_id
+        self.saturation_probe = saturation_probe
+
+        self.paused = False
+        self.max_wait = config.batch_max_wait
+        self.max_records = config.batch_max_records
+        KAFKA_CONSUMER_BATCH_LIMIT.labels(topic, group_id).set(self.max_records)
+
+    @property
+    def timeout_ms(self) -> int:
+        return int(self.max_wait * 1000)
+
+    def is_saturated(self) -> bool:
+        return self.saturation_probe is not None and self.saturation_probe()
+
+    def observe(self, records: int, duration: float, lag: int):
+        if duration > self.config.batch_target_latency:
+            self.max_records = max(self.config.batch_min_records, self.max_records // 2)
+        elif lag > 0 and records >= self.max_records:
+            self.max_records = min(self.config.batch_max_records, self.max_records + max(self.max_records // 4, 1))
+
+        self.max_wait = self.config.batch_min_wait if lag > 0 else self.config.batch_max_wait
+        KAFKA_CONSUMER_BATCH_LIMIT.labels(self.topic, self.group_id).set(self.max_records)
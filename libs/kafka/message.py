@@ -0,0 +1,57 @@
+from enum import StrEnum
+from functools import lru_cache
+from typing import NamedTuple
+
+from aiokafka import ConsumerRecord
+from google.protobuf.message import Message
+
+from libs.context.kafka import KafkaHeaders
+
+CONTENT_TYPE_HEADER = "content-type"
+CONTENT_TYPE_MESSAGE_TYPE_PARAMETER = "messageType"
+
+
+class KafkaContentType(StrEnum):
+    JSON = "application/json"
+    PROTOBUF = "application/x-protobuf"
+
+
+class KafkaMessage(NamedTuple):
+    value: bytes
+    content_type: str
+    message_type: str | None = None
+
+
+@lru_cache(maxsize=64)
+def parse_kafka_content_type(value: bytes | None) -> tuple[str, str | None]:
+    if not value:
+        return KafkaContentType.JSON, None
+
+    media_type, *parameters = value.decode().split(';')
+    message_type = None
+    for parameter in parameters:
+        name, _, parameter_value = parameter.strip().partition('=')
+        if name == CONTENT_TYPE_MESSAGE_TYPE_PARAMETER:
+            message_type = parameter_value
+
+    return media_type.strip().lower(), message_type
+
+
+def get_kafka_content_type_header(headers: KafkaHeaders | None) -> bytes | None:
+    for key, value in headers or ():
+        if key == CONTENT_TYPE_HEADER:
+            return value
+
+    return None
+
+
+def build_kafka_message(record: ConsumerRecord) -> KafkaMessage:
+    content_type, message_type = parse_kafka_content_type(get_kafka_content_type_header(record.headers))
+    return KafkaMessage(value=record.value, content_type=content_type, message_type=message_type)
+
+
+def build_protobuf_content_type_header(message: type[Message]) -> tuple[str, bytes]:
+    return (
+        CONTENT_TYPE_HEADER,
+        f"{KafkaContentType.PROTOBUF}; {CONTENT_TYPE_MESSAGE_TYPE_PARAMETER}={message.DESCRIPTOR.full_name}".encode()
+    )
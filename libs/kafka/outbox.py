@@ -0,0 +1,61 @@
+import asyncio
+from logging import Logger
+from typing import Awaitable, Callable, Protocol, Sequence
+
+from libs.config.kafka import KafkaClientConfig
+from libs.kafka.producer import KafkaProducerClient
+from libs.metrics.kafka import KAFKA_OUTBOX_BATCH_SIZE, KAFKA_OUTBOX_RELAY_ERRORS
+
+
+class KafkaOutboxMessage(Protocol):
+    key: str | None
+    topic: str
+    value: bytes
+
+
+KafkaOutboxPublish = Callable[[Sequence[KafkaOutboxMessage]], Awaitable[None]]
+KafkaOutboxClaim = Callable[[int, KafkaOutboxPublish], Awaitable[int]]
+
+
+class KafkaOutboxRelay:
+    def __init__(
+            self,
+            claim: KafkaOutboxClaim,
+            logger: Logger,
+            config: KafkaClientConfig,
+            producer: KafkaProducerClient
+    ):
+        self.claim = claim
+        self.logger = logger
+        self.config = config
+        self.producer = producer
+
+    async def publish(self, messages: Sequence[KafkaOutboxMessage]):
+        deliveries = [
+            await self.producer.send(message.topic, value=message.value, key=message.key)
+            for message in messages
+        ]
+        await asyncio.gather(*deliveries)
+
+    async def run_worker(self, index: int):
+        worker = str(index)
+        while True:
+            try:
+                relayed = await self.claim(self.config.outbox_batch_size, self.publish)
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                KAFKA_OUTBOX_RELAY_ERRORS.labels(worker).inc()
+                self.logger.error(f"Outbox relay worker {index} failed: {type(error).__name__}: {error}")
+                await asyncio.sleep(self.config.outbox_retry_backoff)
+                continue
+
+            if relayed:
+                KAFKA_OUTBOX_BATCH_SIZE.labels(worker).observe(relayed)
+
+            if relayed < self.config.outbox_batch_size:
+                await asyncio.sleep(self.config.outbox_poll_interval)
+
+    async def run(self):
+        self.logger.info(f"Starting {self.config.outbox_workers} outbox relay workers")
+        await asyncio.gather(*(self.run_worker(index) for index in range(self.config.outbox_workers)))
@@ -0,0 +1,131 @@
+import asyncio
+import time
+from logging import Logger
+
+from aiokafka import AIOKafkaProducer
+from aiokafka.structs import RecordMetadata
+
+from libs.config.kafka import KafkaClientConfig
+from libs.context.base import RequestContext, build_request_context
+from libs.context.kafka import KafkaHeaders, build_kafka_headers
+from libs.metrics.kafka import (
+    KAFKA_PRODUCER_ERRORS,
+    KAFKA_PRODUCER_MESSAGES,
+    KAFKA_PRODUCER_DELIVERY_DURATION
+)
+from libs.tracing.base import tracer
+from libs.tracing.span import Span, SpanKind
+
+KafkaDeliveryFuture = asyncio.Future[RecordMetadata]
+
+
+def merge_kafka_headers(headers: KafkaHeaders, defaults: KafkaHeaders) -> list[tuple[str, bytes]]:
+    keys = {key for key, _ in headers}
+    return [*headers, *((key, value) for key, value in defaults if key not in keys)]
+
+
+class KafkaProducerClient:
+    def __init__(self, config: KafkaClientConfig, logger: Logger):
+        self.config = config
+        self.logger = logger
+        self.producer: AIOKafkaProducer | None = None
+
+    async def start(self):
+        self.producer = AIOKafkaProducer(
+            bootstrap_servers=self.config.bootstrap_servers,
+            linger_ms=int(self.config.producer_linger * 1000),
+            max_batch_size=self.config.producer_max_batch_size,
+            compression_type=self.config.producer_compression,
+            enable_idempotence=self.config.producer_enable_idempotence,
+        )
+        await self.producer.start()
+        self.logger.info(f"Kafka producer started with {self.config.producer_compression or 'no'} compression")
+
+    async def stop(self):
+        if self.producer is None:
+            return
+
+        try:
+            await self.flush(self.config.producer_flush_timeout)
+        except TimeoutError:
+            self.logger.warning(f"Kafka producer flush timed out after {self.config.producer_flush_timeout}s")
+
+        await self.producer.stop()
+        self.producer = None
+        self.logger.info("Kafka producer stopped")
+
+    async def flush(self, timeout: float | None = None):
+        await asyncio.wait_for(self.producer.flush(), timeout)
+
+    async def send(
+            self,
+            topic: str,
+            value: bytes,
+            key: str | bytes | None = None,
+            headers: KafkaHeaders | None = None,
+            context: RequestContext | None = None
+    ) -> KafkaDeliveryFuture:
+        span = tracer.create_span(
+            name=f"{topic} publish",
+            kind=SpanKind.PRODUCER,
+            parent=context.span_context if context else None,
+            attributes={
+                'messaging.system': 'kafka',
+                'messaging.destination.name': topic,
+                'messaging.message.body.size': len(value),
+            }
+        )
+        span_request_context = build_request_context(
+            test_scenario=context.test_scenario if context else None,
+            span_context=span.context
+        )
+        headers = merge_kafka_headers(headers or (), build_kafka_headers(span_request_context))
+
+        start = time.perf_counter()
+        try:
+            future = await self.producer.send(
+                topic,
+                key=key.encode() if isinstance(key, str) else key,
+                value=value,
+                headers=headers
+            )
+        except Exception as error:
+            self.on_delivery_error(topic, span, error)
+            raise
+
+        future.add_done_callback(lambda delivery: self.on_delivery(topic, span, start, delivery))
+        return future
+
+    async def send_and_wait(
+            self,
+            topic: str,
+            value: bytes,
+            key: str | bytes | None = None,
+            headers: KafkaHeaders | None = None,
+            context: RequestContext | None = None
+    ) -> RecordMetadata:
+        return await (await self.send(topic, value=value, key=key, headers=headers, context=context))
+
+    def on_delivery(self, topic: str, span: Span, start: float, delivery: KafkaDeliveryFuture):
+        if delivery.cancelled():
+            self.on_delivery_error(topic, span, asyncio.CancelledError())
+            return
+
+        if error := delivery.exception():
+            self.on_delivery_error(topic, span, error)
+            return
+
+        metadata = delivery.result()
+        span.set_attribute('messaging.kafka.offset', metadata.offset)
+        span.set_attribute('messaging.kafka.partition', metadata.partition)
+        tracer.end_span(span)
+
+        KAFKA_PRODUCER_MESSAGES.labels(topic).inc()
+        KAFKA_PRODUCER_DELIVERY_DURATION.labels(topic).observe(time.perf_counter() - start)
+
+    def on_delivery_error(self, topic: str, span: Span, error: BaseException):
+        span.record_error(error)
+        tracer.end_span(span)
+
+        KAFKA_PRODUCER_ERRORS.labels(topic).inc()
+        self.logger.error(f"Kafka delivery to '{topic}' failed: {type(error).__name__}: {error}")
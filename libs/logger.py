@@ -1,18 +1,120 @@
+import atexit
+import json
 import logging
+import random
+import sys
 from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import TextIO
 
+from libs.config.logger import LoggerConfig, LogFormat
+from libs.tracing.span import get_current_span_context
+
+ACCESS_LOG = {'access_log': True}
+
+TEXT_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            'timestamp': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        if trace_id := getattr(record, 'trace_id', None):
+            payload['trace_id'] = trace_id
+            payload['span_id'] = record.span_id
+        if record.exc_info:
+            payload['exception'] = self.formatException(record.exc_info)
+
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class TraceContextFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        if span_context := get_current_span_context():
+            record.trace_id, record.span_id = span_context
+
+        return True
+
+
+class AccessLogSamplingFilter(logging.Filter):
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not getattr(record, 'access_log', False):
+            return True
+
+        return random.random() < self.rate
+
+
+class DeferredQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
-@lru_cache(maxsize=None)
-def get_logger(name: str) -> logging.Logger:
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
 
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.DEBUG)
+class LoggingPipeline:
+    def __init__(self) -> None:
+        self.levels: dict[str, str] = {}
+        self.listener: QueueListener | None = None
 
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    console_handler.setFormatter(formatter)
+    def configure(self, config: LoggerConfig, stream: TextIO | None = None) -> None:
+        self.stop()
 
-    logger.addHandler(console_handler)
+        stream_handler = logging.StreamHandler(stream or sys.stderr)
+        stream_handler.setFormatter(
+            JSONFormatter() if config.format == LogFormat.JSON else logging.Formatter(TEXT_LOG_FORMAT)
+        )
+
+        queue: SimpleQueue[logging.LogRecord] = SimpleQueue()
+        queue_handler = DeferredQueueHandler(queue)
+        queue_handler.addFilter(TraceContextFilter())
+        if config.access_sample_rate < 1.0:
+            queue_handler.addFilter(AccessLogSamplingFilter(config.access_sample_rate))
+
+        root = logging.getLogger()
+        for handler in [handler for handler in root.handlers if isinstance(handler, DeferredQueueHandler)]:
+            root.removeHandler(handler)
+
+        root.addHandler(queue_handler)
+        root.setLevel(config.level.upper())
+
+        self.levels = {name.lower(): level.upper() for name, level in config.levels.items()}
+        for name in [*config.levels, *logging.root.manager.loggerDict]:
+            self.apply_level(logging.getLogger(name))
+
+        self.listener = QueueListener(queue, stream_handler, respect_handler_level=True)
+        self.listener.start()
+
+    def apply_level(self, logger: logging.Logger) -> None:
+        if level := self.levels.get(logger.name.lower()):
+            logger.setLevel(level)
+
+    def stop(self) -> None:
+        if self.listener:
+            self.listener.stop()
+            self.listener = None
+
+
+logging_pipeline = LoggingPipeline()
+atexit.register(logging_pipeline.stop)
+
+
+def configure_logging(config: LoggerConfig, stream: TextIO | None = None) -> None:
+    logging_pipeline.configure(config, stream)
+
+
+@lru_cache(maxsize=None)
+def get_logger(name: str) -> logging.Logger:
+    if logging_pipeline.listener is None:
+        logging_pipeline.configure(LoggerConfig())
+
+    logger = logging.getLogger(name)
+    logging_pipeline.apply_level(logger)
 
     return logger
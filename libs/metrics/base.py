@@ -0,0 +1,164 @@
+from bisect import bisect_left
+from typing import Callable, Generic, TypeVar
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0
+)
+
+
+def format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+
+    return repr(float(value))
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ''
+
+    labels = ','.join(f'{name}="{escape_label_value(value)}"' for name, value in zip(names, values))
+    return f'{{{labels}}}'
+
+
+class CounterValue:
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def collect(self, name: str, labels: str) -> list[str]:
+        return [f'{name}{labels} {format_value(self.value)}']
+
+
+class GaugeValue:
+    def __init__(self) -> None:
+        self.value = 0.0
+        self.function: Callable[[], float] | None = None
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self.function = function
+
+    def collect(self, name: str, labels: str) -> list[str]:
+        value = self.function() if self.function else self.value
+        return [f'{name}{labels} {format_value(value)}']
+
+
+class HistogramValue:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.sum = 0.0
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.sum += value
+        self.counts[bisect_left(self.buckets, value)] += 1
+
+    def collect(self, name: str, labels: str) -> list[str]:
+        lines, total = [], 0
+        prefix = f'{labels[:-1]},' if labels else '{'
+        for bound, count in zip((*self.buckets, float('inf')), self.counts):
+            total += count
+            lines.append(f'{name}_bucket{prefix}le="{format_value(bound)}"}} {total}')
+
+        lines.append(f'{name}_sum{labels} {format_value(self.sum)}')
+        lines.append(f'{name}_count{labels} {total}')
+        return lines
+
+
+MetricValue = TypeVar('MetricValue', CounterValue, GaugeValue, HistogramValue)
+
+
+class Metric(Generic[MetricValue]):
+    type: str
+
+    def __init__(self, name: str, description: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.labels_names = labels
+        self.description = description
+        self.values: dict[tuple[str, ...], MetricValue] = {}
+
+        metrics_registry.register(self)
+
+    def build_value(self) -> MetricValue:
+        ...
+
+    def labels(self, *values: str) -> MetricValue:
+        value = self.values.get(values)
+        if value is None:
+            if len(values) != len(self.labels_names):
+                raise ValueError(f"Metric {self.name} expects labels {self.labels_names}, got {values}")
+
+            value = self.values.setdefault(values, self.build_value())
+
+        return value
+
+    def collect(self) -> list[str]:
+        lines = [f'# HELP {self.name} {self.description}', f'# TYPE {self.name} {self.type}']
+        for values, value in list(self.values.items()):
+            lines.extend(value.collect(self.name, format_labels(self.labels_names, values)))
+
+        return lines
+
+
+class Counter(Metric[CounterValue]):
+    type = 'counter'
+
+    def build_value(self) -> CounterValue:
+        return CounterValue()
+
+
+class Gauge(Metric[GaugeValue]):
+    type = 'gauge'
+
+    def build_value(self) -> GaugeValue:
+        return GaugeValue()
+
+
+class Histogram(Metric[HistogramValue]):
+    type = 'histogram'
+
+    def __init__(
+            self,
+            name: str,
+            description: str,
+            labels: tuple[str, ...] = (),
+            buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name=name, description=description, labels=labels)
+
+    def build_value(self) -> HistogramValue:
+        return HistogramValue(self.buckets)
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self.metrics: dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+
+        self.metrics[metric.name] = metric
+
+    def render(self) -> str:
+        lines = [line for metric in self.metrics.values() for line in metric.collect()]
+        return '\n'.join(lines) + '\n'
+
+
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,23 @@
+from libs.metrics.base import Counter, Histogram
+
+GRPC_SERVER_REQUESTS = Counter(
+    name='grpc_server_requests_total',
+    labels=('method', 'code'),
+    description='gRPC calls handled by the server',
+)
+GRPC_SERVER_REQUEST_DURATION = Histogram(
+    name='grpc_server_request_duration_seconds',
+    labels=('method',),
+    description='gRPC call handling latency',
+)
+
+GRPC_CLIENT_REQUESTS = Counter(
+    name='grpc_client_requests_total',
+    labels=('downstream', 'method', 'code'),
+    description='gRPC calls sent to downstream services',
+)
+GRPC_CLIENT_REQUEST_DURATION = Histogram(
+    name='grpc_client_request_duration_seconds',
+    labels=('downstream', 'method'),
+    description='gRPC downstream call latency including retries',
+)
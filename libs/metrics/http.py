@@ -0,0 +1,23 @@
+from libs.metrics.base import Counter, Histogram
+
+HTTP_SERVER_REQUESTS = Counter(
+    name='http_server_requests_total',
+    labels=('method', 'route', 'status'),
+    description='HTTP requests handled by the server',
+)
+HTTP_SERVER_REQUEST_DURATION = Histogram(
+    name='http_server_request_duration_seconds',
+    labels=('method', 'route'),
+    description='HTTP request handling latency',
+)
+
+HTTP_CLIENT_REQUESTS = Counter(
+    name='http_client_requests_total',
+    labels=('downstream', 'method', 'status'),
+    description='HTTP requests sent to downstream services',
+)
+HTTP_CLIENT_REQUEST_DURATION = Histogram(
+    name='http_client_request_duration_seconds',
+    labels=('downstream', 'method'),
+    description='HTTP downstream request latency including retries',
+)
@@ -0,0 +1,69 @@
+from libs.metrics.base import Counter, Histogram, Gauge
+
+KAFKA_CONSUMER_MESSAGES = Counter(
+    name='kafka_consumer_messages_total',
+    labels=('topic', 'group_id'),
+    description='Kafka messages consumed',
+)
+KAFKA_CONSUMER_BATCH_SIZE = Histogram(
+    name='kafka_consumer_batch_size',
+    labels=('topic', 'group_id'),
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+    description='Kafka messages handled per batch',
+)
+KAFKA_CONSUMER_HANDLER_DURATION = Histogram(
+    name='kafka_consumer_handler_duration_seconds',
+    labels=('topic', 'group_id'),
+    description='Kafka message or batch handling latency',
+)
+KAFKA_CONSUMER_LAG = Gauge(
+    name='kafka_consumer_lag',
+    labels=('topic', 'group_id', 'partition'),
+    description='Messages between the last handled offset and the partition high watermark',
+)
+KAFKA_CONSUMER_DEAD_LETTERS = Counter(
+    name='kafka_consumer_dead_letters_total',
+    labels=('topic', 'group_id'),
+    description='Kafka messages moved to a dead letter topic after failed handling',
+)
+KAFKA_CONSUMER_TRANSIENT_RETRIES = Counter(
+    name='kafka_consumer_transient_retries_total',
+    labels=('topic', 'group_id'),
+    description='Kafka message handling retries after transient downstream errors',
+)
+KAFKA_CONSUMER_BATCH_LIMIT = Gauge(
+    name='kafka_consumer_batch_limit',
+    labels=('topic', 'group_id'),
+    description='Current adaptive max records per Kafka fetch',
+)
+KAFKA_CONSUMER_BACKPRESSURE_PAUSES = Counter(
+    name='kafka_consumer_backpressure_pauses_total',
+    labels=('topic', 'group_id'),
+    description='Times the consumer paused fetching because downstream was saturated',
+)
+KAFKA_PRODUCER_MESSAGES = Counter(
+    name='kafka_producer_messages_total',
+    labels=('topic',),
+    description='Kafka messages acknowledged by the broker',
+)
+KAFKA_PRODUCER_ERRORS = Counter(
+    name='kafka_producer_errors_total',
+    labels=('topic',),
+    description='Kafka messages that failed to be delivered',
+)
+KAFKA_PRODUCER_DELIVERY_DURATION = Histogram(
+    name='kafka_producer_delivery_duration_seconds',
+    labels=('topic',),
+    description='Latency from enqueueing a Kafka message to its broker acknowledgement',
+)
+KAFKA_OUTBOX_BATCH_SIZE = Histogram(
+    name='kafka_outbox_batch_size',
+    labels=('worker',),
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+    description='Outbox rows claimed and published per relay batch',
+)
+KAFKA_OUTBOX_RELAY_ERRORS = Counter(
+    name='kafka_outbox_relay_errors_total',
+    labels=('worker',),
+    description='Outbox relay batches rolled back after a failure',
+)
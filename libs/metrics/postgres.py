@@ -0,0 +1,13 @@
+from libs.metrics.base import Histogram, Gauge
+
+POSTGRES_POOL_CONNECTIONS = Gauge(
+    name='postgres_pool_connections',
+    labels=('pool', 'state'),
+    description='Connections held by the SQLAlchemy pool',
+)
+POSTGRES_POOL_CHECKOUT_DURATION = Histogram(
+    name='postgres_pool_checkout_duration_seconds',
+    labels=('pool',),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    description='Time spent waiting for a connection from the SQLAlchemy pool',
+)
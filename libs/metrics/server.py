@@ -0,0 +1,54 @@
+import asyncio
+import errno
+from logging import Logger
+
+from libs.config.http import HTTPServerConfig
+from libs.metrics.base import metrics_registry
+
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+async def handle_metrics_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        request_line = await reader.readline()
+        while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+            pass
+
+        method, path, *_ = request_line.decode('latin-1').split(' ')
+        if method == 'GET' and path.split('?')[0] == '/metrics':
+            status, content_type, body = '200 OK', METRICS_CONTENT_TYPE, metrics_registry.render().encode()
+        else:
+            status, content_type, body = '404 Not Found', 'text/plain', b'Not Found'
+
+        writer.write(
+            f'HTTP/1.1 {status}\r\n'
+            f'Content-Type: {content_type}\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            f'Connection: close\r\n\r\n'.encode('latin-1') + body
+        )
+        await writer.drain()
+    except (ValueError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(config: HTTPServerConfig, logger: Logger) -> asyncio.Server:
+    server = await asyncio.start_server(handle_metrics_connection, host=str(config.host), port=config.port)
+    logger.info(f'Metrics server started at {config.host}:{config.port}')
+
+    return server
+
+
+async def start_worker_metrics_server(config: HTTPServerConfig, workers: int, logger: Logger) -> asyncio.Server:
+    for index in range(workers):
+        try:
+            return await start_metrics_server(config.model_copy(update={'port': config.port + index}), logger)
+        except OSError as error:
+            if error.errno != errno.EADDRINUSE:
+                raise
+
+    raise OSError(
+        errno.EADDRINUSE,
+        f'All metrics ports {config.port}-{config.port + workers - 1} at {config.host} are in use'
+    )
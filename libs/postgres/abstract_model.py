@@ -1,6 +1,6 @@
-from typing import Self, Sequence
+from typing import Any, AsyncIterator, Self, Sequence
 
-from sqlalchemy import Table
+from sqlalchemy import Table, ColumnExpressionArgument
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.base import ExecutableOption
 
@@ -13,7 +13,44 @@ class AbstractModel(Base):
     __abstract__ = True
 
     @classmethod
-    async def create(cls, session: AsyncSession, **kwargs) -> Self:
+    async def create(
+            cls,
+            session: AsyncSession,
+            conflict_columns: tuple[str, ...] | None = None,
+            **kwargs
+    ) -> Self | None:
+        ...
+
+    @classmethod
+    async def create_many(
+            cls,
+            session: AsyncSession,
+            values: Sequence[dict[str, Any]],
+            chunk_size: int = 1000,
+            ignore_conflicts: bool = False,
+            conflict_columns: tuple[str, ...] | None = None,
+            returning_ids: bool = False
+    ) -> list[Any] | None:
+        ...
+
+    @classmethod
+    async def upsert_many(
+            cls,
+            session: AsyncSession,
+            values: Sequence[dict[str, Any]],
+            chunk_size: int = 1000,
+            returning_ids: bool = False
+    ) -> list[Any] | None:
+        ...
+
+    @classmethod
+    async def accumulate_many(
+            cls,
+            session: AsyncSession,
+            values: Sequence[dict[str, Any]],
+            columns: tuple[str, ...],
+            chunk_size: int = 1000
+    ) -> None:
         ...
 
     @classmethod
@@ -56,3 +93,29 @@ class AbstractModel(Base):
             **kwargs
     ) -> Sequence[Self]:
         ...
+
+    @classmethod
+    async def stream_partitions(
+            cls,
+            session: AsyncSession,
+            yield_per: int,
+            options: tuple[ExecutableOption, ...] | None = None,
+            order_by: ColumnExpressionType | None = None,
+            clause_filter: ColumnExpressionType | None = None,
+            **kwargs
+    ) -> AsyncIterator[Sequence[Self]]:
+        ...
+
+    @classmethod
+    async def filter_keyset(
+            cls,
+            session: AsyncSession,
+            keyset: tuple[ColumnExpressionArgument[Any], ...],
+            limit: int | None,
+            after: tuple[Any, ...] | None = None,
+            descending: bool = True,
+            options: tuple[ExecutableOption, ...] | None = None,
+            clause_filter: ColumnExpressionType | None = None,
+            **kwargs
+    ) -> Sequence[Self]:
+        ...
@@ -1,16 +1,111 @@
-from typing import Self
+from typing import Any, Callable, Self, Sequence
 
 from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as postgres_insert, Insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from libs.postgres.abstract_model import AbstractModel
 
+MAX_QUERY_PARAMETERS = 32767
+
 
 class CreateModel(AbstractModel):
     __abstract__ = True
 
     @classmethod
-    async def create(cls, session: AsyncSession, **kwargs) -> Self:
-        query = insert(cls).values(**kwargs).returning(cls)
-        result = await session.execute(query)
+    async def create(
+            cls,
+            session: AsyncSession,
+            conflict_columns: tuple[str, ...] | None = None,
+            **kwargs
+    ) -> Self | None:
+        query = insert(cls).values(**kwargs)
+        if conflict_columns:
+            query = postgres_insert(cls).values(**kwargs).on_conflict_do_nothing(index_elements=conflict_columns)
+
+        result = await session.execute(query.returning(cls))
         return result.scalars().first()
+
+    @classmethod
+    async def create_many(
+            cls,
+            session: AsyncSession,
+            values: Sequence[dict[str, Any]],
+            chunk_size: int = 1000,
+            ignore_conflicts: bool = False,
+            conflict_columns: tuple[str, ...] | None = None,
+            returning_ids: bool = False
+    ) -> list[Any] | None:
+        def build(query: Insert) -> Insert:
+            if ignore_conflicts:
+                return query.on_conflict_do_nothing(
+                    index_elements=conflict_columns or cls.__table__.primary_key.columns
+                )
+
+            return query
+
+        return await cls._insert_chunks(session, values, build, chunk_size, returning_ids)
+
+    @classmethod
+    async def upsert_many(
+            cls,
+            session: AsyncSession,
+            values: Sequence[dict[str, Any]],
+            chunk_size: int = 1000,
+            returning_ids: bool = False
+    ) -> list[Any] | None:
+        primary_key = cls.__table__.primary_key.columns
+
+        def build(query: Insert) -> Insert:
+            return query.on_conflict_do_update(
+                index_elements=primary_key,
+                set_={
+                    column.name: query.excluded[column.name]
+                    for column in cls.__table__.columns
+                    if column.name not in primary_key
+                }
+            )
+
+        return await cls._insert_chunks(session, values, build, chunk_size, returning_ids)
+
+    @classmethod
+    async def accumulate_many(
+            cls,
+            session: AsyncSession,
+            values: Sequence[dict[str, Any]],
+            columns: tuple[str, ...],
+            chunk_size: int = 1000
+    ) -> None:
+        primary_key = cls.__table__.primary_key.columns
+
+        def build(query: Insert) -> Insert:
+            return query.on_conflict_do_update(
+                index_elements=primary_key,
+                set_={column: cls.__table__.columns[column] + query.excluded[column] for column in columns}
+            )
+
+        await cls._insert_chunks(session, values, build, chunk_size, returning_ids=False)
+
+    @classmethod
+    async def _insert_chunks(
+            cls,
+            session: AsyncSession,
+            values: Sequence[dict[str, Any]],
+            build: Callable[[Insert], Insert],
+            chunk_size: int,
+            returning_ids: bool
+    ) -> list[Any] | None:
+        chunk_size = max(1, min(chunk_size, MAX_QUERY_PARAMETERS // len(cls.__table__.columns)))
+        primary_key = cls.__table__.primary_key.columns
+
+        ids: list[Any] = []
+        for start in range(0, len(values), chunk_size):
+            query = build(postgres_insert(cls).values(list(values[start:start + chunk_size])))
+            if not returning_ids:
+                await session.execute(query)
+                continue
+
+            result = await session.execute(query.returning(*primary_key))
+            ids.extend(result.scalars().all())
+
+        return ids if returning_ids else None
@@ -1,18 +1,56 @@
 from functools import lru_cache
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker, AsyncEngine
 
-from libs.config.postgres import PostgresConfig
+from libs.config.postgres import PostgresConfig, PostgresPingStrategy
+from libs.logger import get_logger
+from libs.postgres.pool import MetricsAsyncAdaptedQueuePool, register_pool_metrics
+from libs.postgres.router import PostgresReadRouter, PostgresReplica
+from libs.postgres.tracing import register_query_tracing
 
 
-@lru_cache(maxsize=True)
-def get_postgres_session_factory(config: PostgresConfig) -> async_sessionmaker[AsyncSession]:
+def build_connect_args(config: PostgresConfig) -> dict[str, float]:
+    if 'asyncpg' in config.driver:
+        return {'timeout': config.connect_timeout, 'prepared_statement_cache_size': config.statement_cache_size}
+
+    return {}
+
+
+@lru_cache(maxsize=None)
+def get_postgres_engine(config: PostgresConfig) -> AsyncEngine:
     engine = create_async_engine(
         config.url,
         echo=False,
         future=True,
-        pool_size=30,
-        max_overflow=50,
-        pool_pre_ping=True,
+        poolclass=MetricsAsyncAdaptedQueuePool,
+        pool_size=config.pool_size,
+        max_overflow=config.max_overflow,
+        pool_recycle=config.pool_recycle,
+        pool_timeout=config.pool_timeout,
+        pool_pre_ping=config.ping_strategy == PostgresPingStrategy.PESSIMISTIC,
+        pool_logging_name=config.pool_name,
+        connect_args=build_connect_args(config),
+    )
+    register_pool_metrics(engine, config.pool_name)
+    register_query_tracing(engine, config)
+
+    return engine
+
+
+@lru_cache(maxsize=None)
+def get_postgres_session_factory(config: PostgresConfig) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(get_postgres_engine(config), expire_on_commit=False, class_=AsyncSession)
+
+
+@lru_cache(maxsize=None)
+def get_postgres_read_router(config: PostgresConfig) -> PostgresReadRouter:
+    return PostgresReadRouter(
+        logger=get_logger("POSTGRES_READ_ROUTER"),
+        primary=get_postgres_session_factory(config),
+        replicas=[
+            PostgresReplica(name=replica.pool_name, session_factory=get_postgres_session_factory(replica))
+            for replica in config.build_replica_configs()
+        ],
+        cool_down=config.replica_cool_down,
+        task_read_your_writes_window=config.task_read_your_writes_window
     )
-    return async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
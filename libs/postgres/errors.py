@@ -0,0 +1,21 @@
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
+
+POSTGRES_TRANSIENT_SQLSTATE_PREFIXES = ('08', '53', '57P', '40001', '40P01')
+
+
+def get_postgres_sqlstate(error: BaseException) -> str | None:
+    if isinstance(error, DBAPIError):
+        error = error.orig
+
+    return getattr(error, 'sqlstate', None)
+
+
+def is_postgres_transient_error(error: BaseException) -> bool:
+    if isinstance(error, (OSError, TimeoutError, PoolTimeoutError)):
+        return True
+
+    if isinstance(error, DBAPIError) and error.connection_invalidated:
+        return True
+
+    sqlstate = get_postgres_sqlstate(error)
+    return sqlstate is not None and sqlstate.startswith(POSTGRES_TRANSIENT_SQLSTATE_PREFIXES)
@@ -1,11 +1,11 @@
-from typing import Self, Sequence
+from typing import Any, AsyncIterator, Self, Sequence
 
-from sqlalchemy import select
+from sqlalchemy import select, ColumnExpressionArgument
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.base import ExecutableOption
 
 from libs.postgres.abstract_model import AbstractModel
-from libs.postgres.query import build_query
+from libs.postgres.query import build_query, build_keyset_filter, build_keyset_order_by
 from libs.postgres.types import ColumnExpressionType
 
 
@@ -52,3 +52,45 @@ class FilterModel(AbstractModel):
         result = await session.execute(query)
 
         return result.scalars().all()
+
+    @classmethod
+    async def stream_partitions(
+            cls,
+            session: AsyncSession,
+            yield_per: int,
+            options: tuple[ExecutableOption, ...] | None = None,
+            order_by: ColumnExpressionType | None = None,
+            clause_filter: ColumnExpressionType | None = None,
+            **kwargs
+    ) -> AsyncIterator[Sequence[Self]]:
+        query = select(cls).filter_by(**kwargs)
+        query = await build_query(query, options=options, order_by=order_by, clause_filter=clause_filter)
+
+        result = await session.stream_scalars(query.execution_options(yield_per=yield_per))
+        async for partition in result.partitions():
+            yield partition
+
+    @classmethod
+    async def filter_keyset(
+            cls,
+            session: AsyncSession,
+            keyset: tuple[ColumnExpressionArgument[Any], ...],
+            limit: int | None,
+            after: tuple[Any, ...] | None = None,
+            descending: bool = True,
+            options: tuple[ExecutableOption, ...] | None = None,
+            clause_filter: ColumnExpressionType | None = None,
+            **kwargs
+    ) -> Sequence[Self]:
+        clause_filter = clause_filter or ()
+        if after:
+            clause_filter += build_keyset_filter(keyset, after, descending)
+
+        return await cls.filter(
+            session,
+            limit=limit,
+            options=options,
+            order_by=build_keyset_order_by(keyset, descending),
+            clause_filter=clause_filter,
+            **kwargs
+        )
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from logging import Logger
+
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from libs.config.postgres import PostgresConfig
+from libs.metrics.postgres import POSTGRES_POOL_CONNECTIONS, POSTGRES_POOL_CHECKOUT_DURATION
+from libs.schema.postgres import PostgresPoolStatsSchema
+
+
+class MetricsAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.waiting = 0
+        self.timeouts = 0
+        self.checkout_count = 0
+        self.checkout_wait_max = 0.0
+        self.checkout_wait_total = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        self.waiting += 1
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.waiting -= 1
+            wait = time.perf_counter() - start
+
+            self.checkout_count += 1
+            self.checkout_wait_max = max(self.checkout_wait_max, wait)
+            self.checkout_wait_total += wait
+            POSTGRES_POOL_CHECKOUT_DURATION.labels(self.logging_name).observe(wait)
+
+
+def get_engine_pool(engine: AsyncEngine) -> MetricsAsyncAdaptedQueuePool:
+    return engine.sync_engine.pool
+
+
+def get_pool_stats(engine: AsyncEngine, config: PostgresConfig) -> PostgresPoolStatsSchema:
+    pool = get_engine_pool(engine)
+    return PostgresPoolStatsSchema(
+        size=pool.size(),
+        idle=pool.checkedin(),
+        waiting=pool.waiting,
+        overflow=max(pool.overflow(), 0),
+        timeouts=pool.timeouts,
+        checked_out=pool.checkedout(),
+        max_overflow=config.max_overflow,
+        checkout_count=pool.checkout_count,
+        checkout_wait_max=pool.checkout_wait_max,
+        checkout_wait_total=pool.checkout_wait_total,
+        checkout_wait_average=pool.checkout_wait_total / pool.checkout_count if pool.checkout_count else 0.0,
+    )
+
+
+def is_pool_saturated(engine: AsyncEngine, config: PostgresConfig) -> bool:
+    pool = get_engine_pool(engine)
+    if pool.waiting > 0:
+        return True
+
+    return pool.checkedout() >= config.pool_saturation_threshold * (config.pool_size + max(config.max_overflow, 0))
+
+
+def register_pool_metrics(engine: AsyncEngine, pool_name: str) -> None:
+    POSTGRES_POOL_CONNECTIONS.labels(pool_name, 'in_use').set_function(
+        lambda: get_engine_pool(engine).checkedout()
+    )
+    POSTGRES_POOL_CONNECTIONS.labels(pool_name, 'idle').set_function(
+        lambda: get_engine_pool(engine).checkedin()
+    )
+    POSTGRES_POOL_CONNECTIONS.labels(pool_name, 'overflow').set_function(
+        lambda: max(get_engine_pool(engine).overflow(), 0)
+    )
+
+
+async def warm_up_pool(engine: AsyncEngine, connections: int, logger: Logger) -> None:
+    connections = min(connections, get_engine_pool(engine).size())
+    if connections <= 0:
+        return
+
+    async def open_connection():
+        connection = await engine.connect()
+        await connection.execute(text("SELECT 1"))
+        return connection
+
+    start = time.perf_counter()
+    opened = await asyncio.gather(*(open_connection() for _ in range(connections)), return_exceptions=True)
+    for connection in opened:
+        if not isinstance(connection, BaseException):
+            await connection.close()
+
+    failed = [error for error in opened if isinstance(error, BaseException)]
+    if failed:
+        logger.warning(f"Postgres pool warm-up failed for {len(failed)}/{connections} connections: {failed[0]}")
+
+    logger.info(
+        f"Postgres pool warmed up with {connections - len(failed)} connections "
+        f"in {(time.perf_counter() - start) * 1000:.1f}ms"
+    )
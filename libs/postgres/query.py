@@ -1,3 +1,6 @@
+from typing import Any
+
+from sqlalchemy import tuple_, ColumnExpressionArgument
 from sqlalchemy.sql.base import ExecutableOption
 
 from libs.postgres.types import ColumnExpressionType, QueryType
@@ -31,3 +34,24 @@ async def build_query(
         query = query.filter(*clause_filter)
 
     return query
+
+
+def build_keyset_filter(
+        keyset: tuple[ColumnExpressionArgument[Any], ...],
+        after: tuple[Any, ...],
+        descending: bool = True
+) -> ColumnExpressionType:
+    if descending:
+        return (tuple_(*keyset) < tuple_(*after),)
+
+    return (tuple_(*keyset) > tuple_(*after),)
+
+
+def build_keyset_order_by(
+        keyset: tuple[ColumnExpressionArgument[Any], ...],
+        descending: bool = True
+) -> ColumnExpressionType:
+    if descending:
+        return tuple(column.desc() for column in keyset)
+
+    return tuple(column.asc() for column in keyset)
@@ -4,17 +4,24 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from libs.postgres.mixin_model import MixinModel
+from libs.postgres.router import PostgresReadRouter
 
 
 class BasePostgresRepository:
     model: type[MixinModel]
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+    def __init__(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+            read_router: PostgresReadRouter | None = None
+    ):
+        self.read_router = read_router
         self.session_factory = session_factory
 
     @asynccontextmanager
     async def session_read(self) -> AsyncGenerator[AsyncSession, None]:
-        async with self.session_factory() as session:
+        session = await self.read_router.open_read_session() if self.read_router else self.session_factory()
+        async with session:
             yield session
 
     @asynccontextmanager
@@ -26,3 +33,6 @@ class BasePostgresRepository:
             except Exception:
                 await session.rollback()
                 raise
+
+        if self.read_router:
+            self.read_router.mark_write()
@@ -0,0 +1,68 @@
+import time
+from contextvars import ContextVar
+from itertools import count
+from logging import Logger
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+task_last_write_at: ContextVar[float] = ContextVar('postgres_task_last_write_at', default=float('-inf'))
+
+
+class PostgresReplica:
+    def __init__(self, name: str, session_factory: async_sessionmaker[AsyncSession]):
+        self.name = name
+        self.unhealthy_until = 0.0
+        self.session_factory = session_factory
+
+
+class PostgresReadRouter:
+    def __init__(
+            self,
+            logger: Logger,
+            primary: async_sessionmaker[AsyncSession],
+            replicas: list[PostgresReplica],
+            cool_down: float,
+            task_read_your_writes_window: float
+    ):
+        self.logger = logger
+        self.primary = primary
+        self.replicas = replicas
+        self.cool_down = cool_down
+        self.task_read_your_writes_window = task_read_your_writes_window
+
+        self.counter = count()
+
+    def mark_write(self) -> None:
+        if self.task_read_your_writes_window > 0:
+            task_last_write_at.set(time.monotonic())
+
+    def get_replicas(self) -> list[PostgresReplica]:
+        if not self.replicas:
+            return []
+
+        now = time.monotonic()
+        if now - task_last_write_at.get() < self.task_read_your_writes_window:
+            return []
+
+        offset = next(self.counter) % len(self.replicas)
+        replicas = self.replicas[offset:] + self.replicas[:offset]
+
+        return [replica for replica in replicas if replica.unhealthy_until <= now]
+
+    async def open_read_session(self) -> AsyncSession:
+        for replica in self.get_replicas():
+            session = replica.session_factory()
+            try:
+                await session.connection()
+                return session
+            except (DBAPIError, OSError) as error:
+                await session.close()
+
+                replica.unhealthy_until = time.monotonic() + self.cool_down
+                self.logger.warning(
+                    f"Postgres replica {replica.name} is unavailable, "
+                    f"routing reads elsewhere for {self.cool_down}s: {error}"
+                )
+
+        return self.primary()
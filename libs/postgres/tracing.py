@@ -0,0 +1,44 @@
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from libs.config.postgres import PostgresConfig
+from libs.tracing.base import tracer
+from libs.tracing.span import SpanKind, get_current_span_context
+
+MAX_TRACED_STATEMENT_LENGTH = 2048
+
+
+def register_query_tracing(engine: AsyncEngine, config: PostgresConfig) -> None:
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(connection: Connection, cursor, statement: str, parameters, context, executemany):
+        if get_current_span_context() is None:
+            return
+
+        operation = statement.lstrip().split(maxsplit=1)[0].upper() if statement.strip() else 'QUERY'
+        span = tracer.create_span(
+            name=f"{operation} {config.database}",
+            kind=SpanKind.CLIENT,
+            attributes={
+                'db.system': 'postgresql',
+                'db.name': config.database,
+                'server.address': config.host,
+                'db.operation': operation,
+                'db.statement': statement[:MAX_TRACED_STATEMENT_LENGTH],
+            }
+        )
+        connection.info.setdefault('tracing_spans', []).append(span)
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(connection: Connection, cursor, statement: str, parameters, context, executemany):
+        if spans := connection.info.get('tracing_spans'):
+            span = spans.pop()
+            span.set_attribute('db.response.rows', cursor.rowcount)
+            tracer.end_span(span)
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(context: ExceptionContext):
+        if context.connection is not None and (spans := context.connection.info.get('tracing_spans')):
+            span = spans.pop()
+            span.record_error(context.original_exception)
+            tracer.end_span(span)
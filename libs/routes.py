@@ -4,6 +4,7 @@ from enum import StrEnum
 class APIRoutes(StrEnum):
     USERS = '/api/v1/users'
     CARDS = '/api/v1/cards'
+    HEALTH = '/api/v1/health'
     GATEWAY = '/api/v1/gateway'
     ACCOUNTS = '/api/v1/accounts'
     OPERATIONS = '/api/v1/operations'
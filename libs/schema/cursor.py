@@ -0,0 +1,13 @@
+from base64 import urlsafe_b64encode, urlsafe_b64decode
+from typing import Self
+
+from pydantic import BaseModel
+
+
+class CursorSchema(BaseModel):
+    def encode(self) -> str:
+        return urlsafe_b64encode(self.model_dump_json().encode()).decode()
+
+    @classmethod
+    def decode(cls, value: str) -> Self:
+        return cls.model_validate_json(urlsafe_b64decode(value.encode()))
@@ -0,0 +1,15 @@
+from libs.schema.base import BaseSchema
+
+
+class PostgresPoolStatsSchema(BaseSchema):
+    size: int
+    idle: int
+    waiting: int
+    overflow: int
+    timeouts: int
+    checked_out: int
+    max_overflow: int
+    checkout_count: int
+    checkout_wait_max: float
+    checkout_wait_total: float
+    checkout_wait_average: float
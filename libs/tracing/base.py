@@ -0,0 +1,90 @@
+import random
+from contextlib import contextmanager
+from typing import Iterator, Any
+
+from libs.config.tracing import TracingConfig, TracingExporterType
+from libs.logger import get_logger
+from libs.tracing.exporters import FileSpanExporter, OTLPSpanExporter
+from libs.tracing.processor import BatchSpanProcessor
+from libs.tracing.propagation import SpanContext
+from libs.tracing.span import Span, SpanKind, current_span, get_current_span_context
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self.processor: BatchSpanProcessor | None = None
+
+    def configure(self, service_name: str, config: TracingConfig) -> None:
+        logger = get_logger("TRACING")
+
+        match config.exporter:
+            case TracingExporterType.FILE:
+                exporter = FileSpanExporter(path=config.file_path)
+            case TracingExporterType.OTLP:
+                exporter = OTLPSpanExporter(endpoint=config.otlp_endpoint)
+            case _:
+                self.processor = None
+                return
+
+        self.processor = BatchSpanProcessor(
+            config=config,
+            logger=logger,
+            exporter=exporter,
+            service_name=service_name
+        )
+        logger.info(f"Exporting spans of {service_name} with {config.exporter} exporter")
+
+    def create_span(
+            self,
+            name: str,
+            kind: SpanKind = SpanKind.INTERNAL,
+            parent: SpanContext | None = None,
+            attributes: dict[str, Any] | None = None,
+            links: list[SpanContext] | None = None
+    ) -> Span:
+        parent = parent or get_current_span_context()
+        context = SpanContext(
+            trace_id=parent.trace_id if parent else f'{random.getrandbits(128):032x}',
+            span_id=f'{random.getrandbits(64):016x}'
+        )
+        return Span(
+            name=name,
+            kind=kind,
+            links=links or [],
+            context=context,
+            attributes=attributes or {},
+            parent_span_id=parent.span_id if parent else None
+        )
+
+    @contextmanager
+    def start_span(
+            self,
+            name: str,
+            kind: SpanKind = SpanKind.INTERNAL,
+            parent: SpanContext | None = None,
+            attributes: dict[str, Any] | None = None,
+            links: list[SpanContext] | None = None
+    ) -> Iterator[Span]:
+        span = self.create_span(name=name, kind=kind, parent=parent, attributes=attributes, links=links)
+
+        token = current_span.set(span)
+        try:
+            yield span
+        except BaseException as error:
+            span.record_error(error)
+            raise
+        finally:
+            current_span.reset(token)
+            self.end_span(span)
+
+    def end_span(self, span: Span) -> None:
+        span.end()
+        if self.processor:
+            self.processor.on_end(span)
+
+    async def shutdown(self) -> None:
+        if self.processor:
+            await self.processor.shutdown()
+
+
+tracer = Tracer()
@@ -0,0 +1,97 @@
+import json
+import os
+from typing import Any, Protocol
+
+import aiofiles
+from httpx import AsyncClient
+
+from libs.tracing.span import Span
+
+
+def build_otlp_attributes(attributes: dict[str, Any]) -> list[dict[str, Any]]:
+    result = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            result.append({'key': key, 'value': {'boolValue': value}})
+        elif isinstance(value, int):
+            result.append({'key': key, 'value': {'intValue': str(value)}})
+        elif isinstance(value, float):
+            result.append({'key': key, 'value': {'doubleValue': value}})
+        else:
+            result.append({'key': key, 'value': {'stringValue': str(value)}})
+
+    return result
+
+
+def build_otlp_span(span: Span) -> dict[str, Any]:
+    payload = {
+        'name': span.name,
+        'kind': int(span.kind),
+        'traceId': span.context.trace_id,
+        'spanId': span.context.span_id,
+        'startTimeUnixNano': str(span.start_time),
+        'endTimeUnixNano': str(span.end_time),
+        'attributes': build_otlp_attributes(span.attributes),
+        'status': {'code': int(span.status)},
+    }
+    if span.parent_span_id:
+        payload['parentSpanId'] = span.parent_span_id
+    if span.links:
+        payload['links'] = [{'traceId': link.trace_id, 'spanId': link.span_id} for link in span.links]
+
+    return payload
+
+
+def build_otlp_payload(service_name: str, spans: list[Span]) -> dict[str, Any]:
+    return {
+        'resourceSpans': [
+            {
+                'resource': {'attributes': build_otlp_attributes({'service.name': service_name})},
+                'scopeSpans': [
+                    {
+                        'scope': {'name': 'libs.tracing'},
+                        'spans': [build_otlp_span(span) for span in spans]
+                    }
+                ]
+            }
+        ]
+    }
+
+
+class SpanExporter(Protocol):
+    async def export(self, service_name: str, spans: list[Span]) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class FileSpanExporter:
+    def __init__(self, path: str):
+        root, extension = os.path.splitext(path)
+        self.path = f'{root}.{os.getpid()}{extension}'
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    async def export(self, service_name: str, spans: list[Span]) -> None:
+        line = json.dumps(build_otlp_payload(service_name, spans), separators=(',', ':'))
+        async with aiofiles.open(self.path, mode='a', encoding='utf-8') as file:
+            await file.write(f'{line}\n')
+
+    async def close(self) -> None:
+        pass
+
+
+class OTLPSpanExporter:
+    def __init__(self, endpoint: str, timeout: float = 10.0):
+        self.client = AsyncClient(timeout=timeout)
+        self.endpoint = endpoint
+
+    async def export(self, service_name: str, spans: list[Span]) -> None:
+        response = await self.client.post(self.endpoint, json=build_otlp_payload(service_name, spans))
+        response.raise_for_status()
+
+    async def close(self) -> None:
+        await self.client.aclose()
@@ -0,0 +1,54 @@
+import asyncio
+from logging import Logger
+
+from libs.config.tracing import TracingConfig
+from libs.tracing.exporters import SpanExporter
+from libs.tracing.span import Span
+
+
+class BatchSpanProcessor:
+    def __init__(self, config: TracingConfig, logger: Logger, exporter: SpanExporter, service_name: str):
+        self.config = config
+        self.logger = logger
+        self.exporter = exporter
+        self.service_name = service_name
+
+        self.spans: list[Span] = []
+        self.dropped = 0
+        self.flush_task: asyncio.Task | None = None
+
+    def on_end(self, span: Span) -> None:
+        if len(self.spans) >= self.config.max_queue_size:
+            self.dropped += 1
+            return
+
+        self.spans.append(span)
+        if self.flush_task is None or self.flush_task.done():
+            try:
+                self.flush_task = asyncio.get_running_loop().create_task(self.flush_later())
+            except RuntimeError:
+                pass
+
+    async def flush_later(self) -> None:
+        await asyncio.sleep(self.config.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        spans, self.spans = self.spans, []
+        if self.dropped:
+            self.logger.warning(f"Dropped {self.dropped} spans, export queue is full")
+            self.dropped = 0
+
+        for index in range(0, len(spans), self.config.max_batch_size):
+            batch = spans[index:index + self.config.max_batch_size]
+            try:
+                await self.exporter.export(self.service_name, batch)
+            except Exception as error:
+                self.logger.warning(f"Failed to export {len(batch)} spans: {error}")
+
+    async def shutdown(self) -> None:
+        if self.flush_task and not self.flush_task.done():
+            self.flush_task.cancel()
+
+        await self.flush()
+        await self.exporter.close()
@@ -0,0 +1,32 @@
+from typing import NamedTuple
+
+TRACEPARENT_HEADER = "traceparent"
+
+
+class SpanContext(NamedTuple):
+    trace_id: str
+    span_id: str
+
+
+def format_traceparent(context: SpanContext) -> str:
+    return f"00-{context.trace_id}-{context.span_id}-01"
+
+
+def parse_traceparent(value: str | bytes | None) -> SpanContext | None:
+    if not value:
+        return None
+
+    if isinstance(value, bytes):
+        value = value.decode("latin-1")
+
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+
+    try:
+        if int(parts[1], 16) == 0 or int(parts[2], 16) == 0:
+            return None
+    except ValueError:
+        return None
+
+    return SpanContext(trace_id=parts[1].lower(), span_id=parts[2].lower())
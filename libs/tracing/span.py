@@ -0,0 +1,65 @@
+import time
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any
+
+from libs.tracing.propagation import SpanContext
+
+
+class SpanKind(IntEnum):
+    INTERNAL = 1
+    SERVER = 2
+    CLIENT = 3
+    PRODUCER = 4
+    CONSUMER = 5
+
+
+class SpanStatus(IntEnum):
+    UNSET = 0
+    OK = 1
+    ERROR = 2
+
+
+class Span:
+    __slots__ = (
+        'name', 'kind', 'context', 'parent_span_id', 'attributes', 'links', 'status', 'start_time', 'end_time'
+    )
+
+    def __init__(
+            self,
+            name: str,
+            kind: SpanKind,
+            context: SpanContext,
+            parent_span_id: str | None,
+            attributes: dict[str, Any],
+            links: list[SpanContext]
+    ):
+        self.name = name
+        self.kind = kind
+        self.links = links
+        self.status = SpanStatus.UNSET
+        self.context = context
+        self.attributes = attributes
+        self.parent_span_id = parent_span_id
+
+        self.end_time = 0
+        self.start_time = time.time_ns()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        self.end_time = time.time_ns()
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = SpanStatus.ERROR
+        self.attributes['error.type'] = type(error).__name__
+        self.attributes['error.message'] = str(error)
+
+
+current_span: ContextVar[Span | None] = ContextVar('current_span', default=None)
+
+
+def get_current_span_context() -> SpanContext | None:
+    span = current_span.get()
+    return span.context if span else None
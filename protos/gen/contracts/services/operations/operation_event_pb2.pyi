@@ -0,0 +1,51 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+import builtins
+import contracts.services.operations.operation_pb2
+import google.protobuf.descriptor
+import google.protobuf.message
+import typing
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing.final
+class OperationEvent(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    EVENT_ID_FIELD_NUMBER: builtins.int
+    TYPE_FIELD_NUMBER: builtins.int
+    STATUS_FIELD_NUMBER: builtins.int
+    AMOUNT_FIELD_NUMBER: builtins.int
+    USER_ID_FIELD_NUMBER: builtins.int
+    CARD_ID_FIELD_NUMBER: builtins.int
+    CATEGORY_FIELD_NUMBER: builtins.int
+    CREATED_AT_FIELD_NUMBER: builtins.int
+    ACCOUNT_ID_FIELD_NUMBER: builtins.int
+    event_id: builtins.bytes
+    type: contracts.services.operations.operation_pb2.OperationType.ValueType
+    status: contracts.services.operations.operation_pb2.OperationStatus.ValueType
+    amount: builtins.float
+    user_id: builtins.bytes
+    card_id: builtins.bytes
+    category: builtins.str
+    created_at: builtins.str
+    account_id: builtins.bytes
+    def __init__(
+        self,
+        *,
+        event_id: builtins.bytes = ...,
+        type: contracts.services.operations.operation_pb2.OperationType.ValueType = ...,
+        status: contracts.services.operations.operation_pb2.OperationStatus.ValueType = ...,
+        amount: builtins.float = ...,
+        user_id: builtins.bytes = ...,
+        card_id: builtins.bytes = ...,
+        category: builtins.str = ...,
+        created_at: builtins.str = ...,
+        account_id: builtins.bytes = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["account_id", b"account_id", "amount", b"amount", "card_id", b"card_id", "category", b"category", "created_at", b"created_at", "event_id", b"event_id", "status", b"status", "type", b"type", "user_id", b"user_id"]) -> None: ...
+
+global___OperationEvent = OperationEvent
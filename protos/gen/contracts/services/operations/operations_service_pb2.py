@@ -24,15 +24,18 @@ _sym_db = _symbol_database.Default()
 
 from contracts.services.operations import rpc_get_operation_pb2 as contracts_dot_services_dot_operations_dot_rpc__get__operation__pb2
 from contracts.services.operations import rpc_get_operations_pb2 as contracts_dot_services_dot_operations_dot_rpc__get__operations__pb2
+from contracts.services.operations import rpc_get_operations_summary_pb2 as contracts_dot_services_dot_operations_dot_rpc__get__operations__summary__pb2
+from contracts.services.operations import rpc_stream_operations_pb2 as contracts_dot_services_dot_operations_dot_rpc__stream__operations__pb2
+from contracts.services.operations import rpc_export_operations_pb2 as contracts_dot_services_dot_operations_dot_rpc__export__operations__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n6contracts/services/operations/operations_service.proto\x12\x1d\x63ontracts.services.operations\x1a\x35\x63ontracts/services/operations/rpc_get_operation.proto\x1a\x36\x63ontracts/services/operations/rpc_get_operations.proto2\x88\x02\n\x11OperationsService\x12w\n\x0cGetOperation\x12\x32.contracts.services.operations.GetOperationRequest\x1a\x33.contracts.services.operations.GetOperationResponse\x12z\n\rGetOperations\x12\x33.contracts.services.operations.GetOperationsRequest\x1a\x34.contracts.services.operations.GetOperationsResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n6contracts/services/operations/operations_service.proto\x12\x1d\x63ontracts.services.operations\x1a\x35\x63ontracts/services/operations/rpc_get_operation.proto\x1a\x36\x63ontracts/services/operations/rpc_get_operations.proto\x1a>contracts/services/operations/rpc_get_operations_summary.proto\x1a\x39\x63ontracts/services/operations/rpc_stream_operations.proto\x1a\x39\x63ontracts/services/operations/rpc_export_operations.proto2\xaa\x05\n\x11OperationsService\x12w\n\x0cGetOperation\x12\x32.contracts.services.operations.GetOperationRequest\x1a\x33.contracts.services.operations.GetOperationResponse\x12z\n\rGetOperations\x12\x33.contracts.services.operations.GetOperationsRequest\x1a\x34.contracts.services.operations.GetOperationsResponse\x12\x8f\x01\n\x14GetOperationsSummary\x12:.contracts.services.operations.GetOperationsSummaryRequest\x1a;.contracts.services.operations.GetOperationsSummaryResponse\x12\x85\x01\n\x10StreamOperations\x12\x36.contracts.services.operations.StreamOperationsRequest\x1a\x37.contracts.services.operations.StreamOperationsResponse0\x01\x12\x85\x01\n\x10\x45xportOperations\x12\x36.contracts.services.operations.ExportOperationsRequest\x1a\x37.contracts.services.operations.ExportOperationsResponse0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'contracts.services.operations.operations_service_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_OPERATIONSSERVICE']._serialized_start=201
-  _globals['_OPERATIONSSERVICE']._serialized_end=465
+  _globals['_OPERATIONSSERVICE']._serialized_start=383
+  _globals['_OPERATIONSSERVICE']._serialized_end=1065
 # @@protoc_insertion_point(module_scope)
@@ -3,8 +3,11 @@
 import grpc
 import warnings
 
+from contracts.services.operations import rpc_export_operations_pb2 as contracts_dot_services_dot_operations_dot_rpc__export__operations__pb2
 from contracts.services.operations import rpc_get_operation_pb2 as contracts_dot_services_dot_operations_dot_rpc__get__operation__pb2
 from contracts.services.operations import rpc_get_operations_pb2 as contracts_dot_services_dot_operations_dot_rpc__get__operations__pb2
+from contracts.services.operations import rpc_get_operations_summary_pb2 as contracts_dot_services_dot_operations_dot_rpc__get__operations__summary__pb2
+from contracts.services.operations import rpc_stream_operations_pb2 as contracts_dot_services_dot_operations_dot_rpc__stream__operations__pb2
 
 GRPC_GENERATED_VERSION = '1.71.0'
 GRPC_VERSION = grpc.__version__
@@ -45,6 +48,21 @@ class OperationsServiceStub(object):
                 request_serializer=contracts_dot_services_dot_operations_dot_rpc__get__operations__pb2.GetOperationsRequest.SerializeToString,
                 response_deserializer=contracts_dot_services_dot_operations_dot_rpc__get__operations__pb2.GetOperationsResponse.FromString,
                 _registered_method=True)
+        self.GetOperationsSummary = channel.unary_unary(
+                '/contracts.services.operations.OperationsService/GetOperationsSummary',
+                request_serializer=contracts_dot_services_dot_operations_dot_rpc__get__operations__summary__pb2.GetOperationsSummaryRequest.SerializeToString,
+                response_deserializer=contracts_dot_services_dot_operations_dot_rpc__get__operations__summary__pb2.GetOperationsSummaryResponse.FromString,
+                _registered_method=True)
+        self.StreamOperations = channel.unary_stream(
+                '/contracts.services.operations.OperationsService/StreamOperations',
+                request_serializer=contracts_dot_services_dot_operations_dot_rpc__stream__operations__pb2.StreamOperationsRequest.SerializeToString,
+                response_deserializer=contracts_dot_services_dot_operations_dot_rpc__stream__operations__pb2.StreamOperationsResponse.FromString,
+                _registered_method=True)
+        self.ExportOperations = channel.unary_stream(
+                '/contracts.services.operations.OperationsService/ExportOperations',
+                request_serializer=contracts_dot_services_dot_operations_dot_rpc__export__operations__pb2.ExportOperationsRequest.SerializeToString,
+                response_deserializer=contracts_dot_services_dot_operations_dot_rpc__export__operations__pb2.ExportOperationsResponse.FromString,
+                _registered_method=True)
 
 
 class OperationsServiceServicer(object):
@@ -62,6 +80,24 @@ class OperationsServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetOperationsSummary(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamOperations(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ExportOperations(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_OperationsServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -75,6 +111,21 @@ def add_OperationsServiceServicer_to_server(servicer, server):
                     request_deserializer=contracts_dot_services_dot_operations_dot_rpc__get__operations__pb2.GetOperationsRequest.FromString,
                     response_serializer=contracts_dot_services_dot_operations_dot_rpc__get__operations__pb2.GetOperationsResponse.SerializeToString,
             ),
+            'GetOperationsSummary': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetOperationsSummary,
+                    request_deserializer=contracts_dot_services_dot_operations_dot_rpc__get__operations__summary__pb2.GetOperationsSummaryRequest.FromString,
+                    response_serializer=contracts_dot_services_dot_operations_dot_rpc__get__operations__summary__pb2.GetOperationsSummaryResponse.SerializeToString,
+            ),
+            'StreamOperations': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamOperations,
+                    request_deserializer=contracts_dot_services_dot_operations_dot_rpc__stream__operations__pb2.StreamOperationsRequest.FromString,
+                    response_serializer=contracts_dot_services_dot_operations_dot_rpc__stream__operations__pb2.StreamOperationsResponse.SerializeToString,
+            ),
+            'ExportOperations': grpc.unary_stream_rpc_method_handler(
+                    servicer.ExportOperations,
+                    request_deserializer=contracts_dot_services_dot_operations_dot_rpc__export__operations__pb2.ExportOperationsRequest.FromString,
+                    response_serializer=contracts_dot_services_dot_operations_dot_rpc__export__operations__pb2.ExportOperationsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'contracts.services.operations.OperationsService', rpc_method_handlers)
@@ -139,3 +190,84 @@ class OperationsService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetOperationsSummary(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/contracts.services.operations.OperationsService/GetOperationsSummary',
+            contracts_dot_services_dot_operations_dot_rpc__get__operations__summary__pb2.GetOperationsSummaryRequest.SerializeToString,
+            contracts_dot_services_dot_operations_dot_rpc__get__operations__summary__pb2.GetOperationsSummaryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamOperations(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/contracts.services.operations.OperationsService/StreamOperations',
+            contracts_dot_services_dot_operations_dot_rpc__stream__operations__pb2.StreamOperationsRequest.SerializeToString,
+            contracts_dot_services_dot_operations_dot_rpc__stream__operations__pb2.StreamOperationsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ExportOperations(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/contracts.services.operations.OperationsService/ExportOperations',
+            contracts_dot_services_dot_operations_dot_rpc__export__operations__pb2.ExportOperationsRequest.SerializeToString,
+            contracts_dot_services_dot_operations_dot_rpc__export__operations__pb2.ExportOperationsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
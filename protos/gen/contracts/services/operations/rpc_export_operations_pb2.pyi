@@ -0,0 +1,61 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+import builtins
+import collections.abc
+import contracts.services.operations.operation_pb2
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.message
+import typing
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing.final
+class ExportOperationsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    USER_ID_FIELD_NUMBER: builtins.int
+    CARD_ID_FIELD_NUMBER: builtins.int
+    ACCOUNT_ID_FIELD_NUMBER: builtins.int
+    CHUNK_SIZE_FIELD_NUMBER: builtins.int
+    user_id: builtins.str
+    card_id: builtins.str
+    account_id: builtins.str
+    chunk_size: builtins.int
+    def __init__(
+        self,
+        *,
+        user_id: builtins.str = ...,
+        card_id: builtins.str | None = ...,
+        account_id: builtins.str | None = ...,
+        chunk_size: builtins.int | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["_account_id", b"_account_id", "_card_id", b"_card_id", "_chunk_size", b"_chunk_size", "account_id", b"account_id", "card_id", b"card_id", "chunk_size", b"chunk_size"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["_account_id", b"_account_id", "_card_id", b"_card_id", "_chunk_size", b"_chunk_size", "account_id", b"account_id", "card_id", b"card_id", "chunk_size", b"chunk_size", "user_id", b"user_id"]) -> None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_account_id", b"_account_id"]) -> typing.Literal["account_id"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_card_id", b"_card_id"]) -> typing.Literal["card_id"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_chunk_size", b"_chunk_size"]) -> typing.Literal["chunk_size"] | None: ...
+
+global___ExportOperationsRequest = ExportOperationsRequest
+
+@typing.final
+class ExportOperationsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    OPERATIONS_FIELD_NUMBER: builtins.int
+    @property
+    def operations(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[contracts.services.operations.operation_pb2.Operation]: ...
+    def __init__(
+        self,
+        *,
+        operations: collections.abc.Iterable[contracts.services.operations.operation_pb2.Operation] | None = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["operations", b"operations"]) -> None: ...
+
+global___ExportOperationsResponse = ExportOperationsResponse
@@ -25,15 +25,15 @@ _sym_db = _symbol_database.Default()
 from contracts.services.operations import operation_pb2 as contracts_dot_services_dot_operations_dot_operation__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n6contracts/services/operations/rpc_get_operations.proto\x12\x1d\x63ontracts.services.operations\x1a-contracts/services/operations/operation.proto\"q\n\x14GetOperationsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x14\n\x07\x63\x61rd_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x17\n\naccount_id\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\n\n\x08_card_idB\r\n\x0b_account_id\"U\n\x15GetOperationsResponse\x12<\n\noperations\x18\x01 \x03(\x0b\x32(.contracts.services.operations.Operationb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n6contracts/services/operations/rpc_get_operations.proto\x12\x1d\x63ontracts.services.operations\x1a-contracts/services/operations/operation.proto\"\xbf\x01\n\x14GetOperationsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x14\n\x07\x63\x61rd_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x17\n\naccount_id\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\tpage_size\x18\x04 \x01(\x05H\x02\x88\x01\x01\x12\x17\n\npage_token\x18\x05 \x01(\tH\x03\x88\x01\x01\x42\n\n\x08_card_idB\r\n\x0b_account_idB\x0c\n\n_page_sizeB\r\n\x0b_page_token\"n\n\x15GetOperationsResponse\x12<\n\noperations\x18\x01 \x03(\x0b\x32(.contracts.services.operations.Operation\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\tb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'contracts.services.operations.rpc_get_operations_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_GETOPERATIONSREQUEST']._serialized_start=136
-  _globals['_GETOPERATIONSREQUEST']._serialized_end=249
-  _globals['_GETOPERATIONSRESPONSE']._serialized_start=251
-  _globals['_GETOPERATIONSRESPONSE']._serialized_end=336
+  _globals['_GETOPERATIONSREQUEST']._serialized_start=137
+  _globals['_GETOPERATIONSREQUEST']._serialized_end=328
+  _globals['_GETOPERATIONSRESPONSE']._serialized_start=330
+  _globals['_GETOPERATIONSRESPONSE']._serialized_end=440
 # @@protoc_insertion_point(module_scope)
@@ -20,22 +20,32 @@ class GetOperationsRequest(google.protobuf.message.Message):
     USER_ID_FIELD_NUMBER: builtins.int
     CARD_ID_FIELD_NUMBER: builtins.int
     ACCOUNT_ID_FIELD_NUMBER: builtins.int
+    PAGE_SIZE_FIELD_NUMBER: builtins.int
+    PAGE_TOKEN_FIELD_NUMBER: builtins.int
     user_id: builtins.str
     card_id: builtins.str
     account_id: builtins.str
+    page_size: builtins.int
+    page_token: builtins.str
     def __init__(
         self,
         *,
         user_id: builtins.str = ...,
         card_id: builtins.str | None = ...,
         account_id: builtins.str | None = ...,
+        page_size: builtins.int | None = ...,
+        page_token: builtins.str | None = ...,
     ) -> None: ...
-    def HasField(self, field_name: typing.Literal["_account_id", b"_account_id", "_card_id", b"_card_id", "account_id", b"account_id", "card_id", b"card_id"]) -> builtins.bool: ...
-    def ClearField(self, field_name: typing.Literal["_account_id", b"_account_id", "_card_id", b"_card_id", "account_id", b"account_id", "card_id", b"card_id", "user_id", b"user_id"]) -> None: ...
+    def HasField(self, field_name: typing.Literal["_account_id", b"_account_id", "_card_id", b"_card_id", "_page_size", b"_page_size", "_page_token", b"_page_token", "account_id", b"account_id", "card_id", b"card_id", "page_size", b"page_size", "page_token", b"page_token"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["_account_id", b"_account_id", "_card_id", b"_card_id", "_page_size", b"_page_size", "_page_token", b"_page_token", "account_id", b"account_id", "card_id", b"card_id", "page_size", b"page_size", "page_token", b"page_token", "user_id", b"user_id"]) -> None: ...
     @typing.overload
     def WhichOneof(self, oneof_group: typing.Literal["_account_id", b"_account_id"]) -> typing.Literal["account_id"] | None: ...
     @typing.overload
     def WhichOneof(self, oneof_group: typing.Literal["_card_id", b"_card_id"]) -> typing.Literal["card_id"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_page_size", b"_page_size"]) -> typing.Literal["page_size"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_page_token", b"_page_token"]) -> typing.Literal["page_token"] | None: ...
 
 global___GetOperationsRequest = GetOperationsRequest
 
@@ -44,13 +54,16 @@ class GetOperationsResponse(google.protobuf.message.Message):
     DESCRIPTOR: google.protobuf.descriptor.Descriptor
 
     OPERATIONS_FIELD_NUMBER: builtins.int
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: builtins.int
+    next_page_token: builtins.str
     @property
     def operations(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[contracts.services.operations.operation_pb2.Operation]: ...
     def __init__(
         self,
         *,
         operations: collections.abc.Iterable[contracts.services.operations.operation_pb2.Operation] | None = ...,
+        next_page_token: builtins.str = ...,
     ) -> None: ...
-    def ClearField(self, field_name: typing.Literal["operations", b"operations"]) -> None: ...
+    def ClearField(self, field_name: typing.Literal["next_page_token", b"next_page_token", "operations", b"operations"]) -> None: ...
 
 global___GetOperationsResponse = GetOperationsResponse
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: contracts/services/operations/rpc_get_operations_summary.proto
+# Protobuf Python Version: 5.29.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    0,
+    '',
+    'contracts/services/operations/rpc_get_operations_summary.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from contracts.services.operations import operation_pb2 as contracts_dot_services_dot_operations_dot_operation__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n>contracts/services/operations/rpc_get_operations_summary.proto\x12\x1d\x63ontracts.services.operations\x1a-contracts/services/operations/operation.proto\"\xc4\x01\n\x1bGetOperationsSummaryRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x14\n\x07\x63\x61rd_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x17\n\naccount_id\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x17\n\nstart_date\x18\x04 \x01(\tH\x02\x88\x01\x01\x12\x15\n\x08\x65nd_date\x18\x05 \x01(\tH\x03\x88\x01\x01\x42\n\n\x08_card_idB\r\n\x0b_account_idB\r\n\x0b_start_dateB\x0b\n\t_end_date\"\xcb\x01\n\x16OperationsSummaryGroup\x12:\n\x04type\x18\x01 \x01(\x0e\x32,.contracts.services.operations.OperationType\x12>\n\x06status\x18\x02 \x01(\x0e\x32..contracts.services.operations.OperationStatus\x12\x10\n\x08\x63\x61tegory\x18\x03 \x01(\t\x12\x14\n\x0ctotal_amount\x18\x04 \x01(\x01\x12\r\n\x05\x63ount\x18\x05 \x01(\x03\"\x90\x01\n\x1cGetOperationsSummaryResponse\x12\x45\n\x06groups\x18\x01 \x03(\x0b\x32\x35.contracts.services.operations.OperationsSummaryGroup\x12\x14\n\x0ctotal_amount\x18\x02 \x01(\x01\x12\x13\n\x0btotal_count\x18\x03 \x01(\x03\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'contracts.services.operations.rpc_get_operations_summary_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_GETOPERATIONSSUMMARYREQUEST']._serialized_start=145
+  _globals['_GETOPERATIONSSUMMARYREQUEST']._serialized_end=341
+  _globals['_OPERATIONSSUMMARYGROUP']._serialized_start=344
+  _globals['_OPERATIONSSUMMARYGROUP']._serialized_end=547
+  _globals['_GETOPERATIONSSUMMARYRESPONSE']._serialized_start=550
+  _globals['_GETOPERATIONSSUMMARYRESPONSE']._serialized_end=694
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,99 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+import builtins
+import collections.abc
+import contracts.services.operations.operation_pb2
+import google.protobuf.descriptor
+import google.protobuf.internal.containers
+import google.protobuf.message
+import typing
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing.final
+class GetOperationsSummaryRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    USER_ID_FIELD_NUMBER: builtins.int
+    CARD_ID_FIELD_NUMBER: builtins.int
+    ACCOUNT_ID_FIELD_NUMBER: builtins.int
+    START_DATE_FIELD_NUMBER: builtins.int
+    END_DATE_FIELD_NUMBER: builtins.int
+    user_id: builtins.str
+    card_id: builtins.str
+    account_id: builtins.str
+    start_date: builtins.str
+    end_date: builtins.str
+    def __init__(
+        self,
+        *,
+        user_id: builtins.str = ...,
+        card_id: builtins.str | None = ...,
+        account_id: builtins.str | None = ...,
+        start_date: builtins.str | None = ...,
+        end_date: builtins.str | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["_account_id", b"_account_id", "_card_id", b"_card_id", "_end_date", b"_end_date", "_start_date", b"_start_date", "account_id", b"account_id", "card_id", b"card_id", "end_date", b"end_date", "start_date", b"start_date"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["_account_id", b"_account_id", "_card_id", b"_card_id", "_end_date", b"_end_date", "_start_date", b"_start_date", "account_id", b"account_id", "card_id", b"card_id", "end_date", b"end_date", "start_date", b"start_date", "user_id", b"user_id"]) -> None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_account_id", b"_account_id"]) -> typing.Literal["account_id"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_card_id", b"_card_id"]) -> typing.Literal["card_id"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_end_date", b"_end_date"]) -> typing.Literal["end_date"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_start_date", b"_start_date"]) -> typing.Literal["start_date"] | None: ...
+
+global___GetOperationsSummaryRequest = GetOperationsSummaryRequest
+
+@typing.final
+class OperationsSummaryGroup(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    TYPE_FIELD_NUMBER: builtins.int
+    STATUS_FIELD_NUMBER: builtins.int
+    CATEGORY_FIELD_NUMBER: builtins.int
+    TOTAL_AMOUNT_FIELD_NUMBER: builtins.int
+    COUNT_FIELD_NUMBER: builtins.int
+    type: contracts.services.operations.operation_pb2.OperationType.ValueType
+    status: contracts.services.operations.operation_pb2.OperationStatus.ValueType
+    category: builtins.str
+    total_amount: builtins.float
+    count: builtins.int
+    def __init__(
+        self,
+        *,
+        type: contracts.services.operations.operation_pb2.OperationType.ValueType = ...,
+        status: contracts.services.operations.operation_pb2.OperationStatus.ValueType = ...,
+        category: builtins.str = ...,
+        total_amount: builtins.float = ...,
+        count: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["category", b"category", "count", b"count", "status", b"status", "total_amount", b"total_amount", "type", b"type"]) -> None: ...
+
+global___OperationsSummaryGroup = OperationsSummaryGroup
+
+@typing.final
+class GetOperationsSummaryResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    GROUPS_FIELD_NUMBER: builtins.int
+    TOTAL_AMOUNT_FIELD_NUMBER: builtins.int
+    TOTAL_COUNT_FIELD_NUMBER: builtins.int
+    total_amount: builtins.float
+    total_count: builtins.int
+    @property
+    def groups(self) -> google.protobuf.internal.containers.RepeatedCompositeFieldContainer[global___OperationsSummaryGroup]: ...
+    def __init__(
+        self,
+        *,
+        groups: collections.abc.Iterable[global___OperationsSummaryGroup] | None = ...,
+        total_amount: builtins.float = ...,
+        total_count: builtins.int = ...,
+    ) -> None: ...
+    def ClearField(self, field_name: typing.Literal["groups", b"groups", "total_amount", b"total_amount", "total_count", b"total_count"]) -> None: ...
+
+global___GetOperationsSummaryResponse = GetOperationsSummaryResponse
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: contracts/services/operations/rpc_stream_operations.proto
+# Protobuf Python Version: 5.29.0
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    29,
+    0,
+    '',
+    'contracts/services/operations/rpc_stream_operations.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from contracts.services.operations import operation_pb2 as contracts_dot_services_dot_operations_dot_operation__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n9contracts/services/operations/rpc_stream_operations.proto\x12\x1d\x63ontracts.services.operations\x1a-contracts/services/operations/operation.proto\"\x9a\x01\n\x17StreamOperationsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x14\n\x07\x63\x61rd_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x17\n\naccount_id\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\tpage_size\x18\x04 \x01(\x05H\x02\x88\x01\x01\x42\n\n\x08_card_idB\r\n\x0b_account_idB\x0c\n\n_page_size\"W\n\x18StreamOperationsResponse\x12;\n\toperation\x18\x01 \x01(\x0b\x32(.contracts.services.operations.Operationb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'contracts.services.operations.rpc_stream_operations_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_STREAMOPERATIONSREQUEST']._serialized_start=140
+  _globals['_STREAMOPERATIONSREQUEST']._serialized_end=294
+  _globals['_STREAMOPERATIONSRESPONSE']._serialized_start=296
+  _globals['_STREAMOPERATIONSRESPONSE']._serialized_end=383
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,60 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+import builtins
+import contracts.services.operations.operation_pb2
+import google.protobuf.descriptor
+import google.protobuf.message
+import typing
+
+DESCRIPTOR: google.protobuf.descriptor.FileDescriptor
+
+@typing.final
+class StreamOperationsRequest(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    USER_ID_FIELD_NUMBER: builtins.int
+    CARD_ID_FIELD_NUMBER: builtins.int
+    ACCOUNT_ID_FIELD_NUMBER: builtins.int
+    PAGE_SIZE_FIELD_NUMBER: builtins.int
+    user_id: builtins.str
+    card_id: builtins.str
+    account_id: builtins.str
+    page_size: builtins.int
+    def __init__(
+        self,
+        *,
+        user_id: builtins.str = ...,
+        card_id: builtins.str | None = ...,
+        account_id: builtins.str | None = ...,
+        page_size: builtins.int | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["_account_id", b"_account_id", "_card_id", b"_card_id", "_page_size", b"_page_size", "account_id", b"account_id", "card_id", b"card_id", "page_size", b"page_size"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["_account_id", b"_account_id", "_card_id", b"_card_id", "_page_size", b"_page_size", "account_id", b"account_id", "card_id", b"card_id", "page_size", b"page_size", "user_id", b"user_id"]) -> None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_account_id", b"_account_id"]) -> typing.Literal["account_id"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_card_id", b"_card_id"]) -> typing.Literal["card_id"] | None: ...
+    @typing.overload
+    def WhichOneof(self, oneof_group: typing.Literal["_page_size", b"_page_size"]) -> typing.Literal["page_size"] | None: ...
+
+global___StreamOperationsRequest = StreamOperationsRequest
+
+@typing.final
+class StreamOperationsResponse(google.protobuf.message.Message):
+    DESCRIPTOR: google.protobuf.descriptor.Descriptor
+
+    OPERATION_FIELD_NUMBER: builtins.int
+    @property
+    def operation(self) -> contracts.services.operations.operation_pb2.Operation: ...
+    def __init__(
+        self,
+        *,
+        operation: contracts.services.operations.operation_pb2.Operation | None = ...,
+    ) -> None: ...
+    def HasField(self, field_name: typing.Literal["operation", b"operation"]) -> builtins.bool: ...
+    def ClearField(self, field_name: typing.Literal["operation", b"operation"]) -> None: ...
+
+global___StreamOperationsResponse = StreamOperationsResponse
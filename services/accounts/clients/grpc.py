@@ -4,10 +4,13 @@ from config import settings
 from contracts.services.accounts.accounts_service_pb2_grpc import AccountsServiceStub
 from contracts.services.accounts.rpc_get_account_pb2 import GetAccountRequest, GetAccountResponse
 from contracts.services.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
+from libs.cache.base import get_response_cache
+from libs.cache.decorators import cache_response
+from libs.cache.serializers import ProtobufCacheSerializer
 from libs.context.base import RequestContext
 from libs.context.grpc import build_grpc_metadata
-from libs.grpc.client.base import GRPCClient, build_grpc_channel
-from libs.logger import get_logger
+from libs.grpc.client.base import GRPCClient
+from libs.grpc.client.registry import grpc_channel_registry
 
 
 class AccountsGRPCClient(GRPCClient):
@@ -22,18 +25,28 @@ class AccountsGRPCClient(GRPCClient):
     async def get_accounts_api(self, request: GetAccountsRequest, context: RequestContext) -> GetAccountsResponse:
         return await self.stub.GetAccounts(request, metadata=build_grpc_metadata(context))
 
+    @cache_response(
+        cache=get_response_cache(settings.downstream_cache),
+        name='accounts:grpc:get_account',
+        serializer=ProtobufCacheSerializer(GetAccountResponse)
+    )
     async def get_account(self, account_id: str, context: RequestContext) -> GetAccountResponse:
         request = GetAccountRequest(id=account_id)
         return await self.get_account_api(request, context)
 
+    @cache_response(
+        cache=get_response_cache(settings.downstream_cache),
+        name='accounts:grpc:get_accounts',
+        serializer=ProtobufCacheSerializer(GetAccountsResponse)
+    )
     async def get_accounts(self, user_id: str, context: RequestContext) -> GetAccountsResponse:
         request = GetAccountsRequest(user_id=user_id)
         return await self.get_accounts_api(request, context)
 
 
 def get_accounts_grpc_client() -> AccountsGRPCClient:
-    channel = build_grpc_channel(
-        logger=get_logger("ACCOUNTS_SERVICE_GRPC_CLIENT"),
+    channel = grpc_channel_registry.get_channel(
+        name="ACCOUNTS_SERVICE_GRPC_CLIENT",
         config=settings.accounts_grpc_client
     )
     return AccountsGRPCClient(channel=channel)
@@ -1,14 +1,17 @@
 import uuid
 
 from fastapi import Depends
-from httpx import Response, QueryParams, Headers
+from httpx import Response, QueryParams
 
 from config import settings
+from libs.cache.base import get_response_cache
+from libs.cache.decorators import cache_response
+from libs.cache.serializers import PydanticCacheSerializer
 from libs.context.base import RequestContext
 from libs.context.http import get_http_request_context
-from libs.http.client.base import HTTPClient, build_http_client
+from libs.http.client.base import HTTPClient
 from libs.http.client.handlers import handle_http_error, HTTPClientError
-from libs.logger import get_logger
+from libs.http.client.registry import http_client_registry
 from libs.routes import APIRoutes
 from services.accounts.schema import (
     GetAccountResponseSchema,
@@ -33,10 +36,20 @@ class AccountsHTTPClient(HTTPClient):
             params=QueryParams(**query.model_dump(mode='json', by_alias=True))
         )
 
+    @cache_response(
+        cache=get_response_cache(settings.downstream_cache),
+        name='accounts:http:get_account',
+        serializer=PydanticCacheSerializer(GetAccountResponseSchema)
+    )
     async def get_account(self, account_id: uuid.UUID) -> GetAccountResponseSchema:
         response = await self.get_account_api(account_id)
         return GetAccountResponseSchema.model_validate_json(response.text)
 
+    @cache_response(
+        cache=get_response_cache(settings.downstream_cache),
+        name='accounts:http:get_accounts',
+        serializer=PydanticCacheSerializer(GetAccountsResponseSchema)
+    )
     async def get_accounts(self, user_id: uuid.UUID) -> GetAccountsResponseSchema:
         query = GetAccountsQuerySchema(user_id=user_id)
         response = await self.get_accounts_api(query)
@@ -44,9 +57,8 @@ class AccountsHTTPClient(HTTPClient):
 
 
 def get_accounts_http_client(context: RequestContext = Depends(get_http_request_context)) -> AccountsHTTPClient:
-    client = build_http_client(
-        logger=get_logger("ACCOUNTS_SERVICE_HTTP_CLIENT"),
-        config=settings.accounts_http_client,
-        headers=Headers({"x-test-scenario": context.test_scenario})
+    client = http_client_registry.get_client(
+        name="ACCOUNTS_SERVICE_HTTP_CLIENT",
+        config=settings.accounts_http_client
     )
-    return AccountsHTTPClient(client=client)
+    return AccountsHTTPClient(client=client, context=context)
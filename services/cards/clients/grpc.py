@@ -4,10 +4,13 @@ from config import settings
 from contracts.services.cards.cards_service_pb2_grpc import CardsServiceStub
 from contracts.services.cards.rpc_get_card_pb2 import GetCardRequest, GetCardResponse
 from contracts.services.cards.rpc_get_cards_pb2 import GetCardsRequest, GetCardsResponse
+from libs.cache.base import get_response_cache
+from libs.cache.decorators import cache_response
+from libs.cache.serializers import ProtobufCacheSerializer
 from libs.context.base import RequestContext
 from libs.context.grpc import build_grpc_metadata
-from libs.grpc.client.base import GRPCClient, build_grpc_channel
-from libs.logger import get_logger
+from libs.grpc.client.base import GRPCClient
+from libs.grpc.client.registry import grpc_channel_registry
 
 
 class CardsGRPCClient(GRPCClient):
@@ -22,18 +25,28 @@ class CardsGRPCClient(GRPCClient):
     async def get_cards_api(self, request: GetCardsRequest, context: RequestContext) -> GetCardsResponse:
         return await self.stub.GetCards(request, metadata=build_grpc_metadata(context))
 
+    @cache_response(
+        cache=get_response_cache(settings.downstream_cache),
+        name='cards:grpc:get_card',
+        serializer=ProtobufCacheSerializer(GetCardResponse)
+    )
     async def get_card(self, card_id: str, context: RequestContext) -> GetCardResponse:
         request = GetCardRequest(id=card_id)
         return await self.get_card_api(request, context)
 
+    @cache_response(
+        cache=get_response_cache(settings.downstream_cache),
+        name='cards:grpc:get_cards',
+        serializer=ProtobufCacheSerializer(GetCardsResponse)
+    )
     async def get_cards(self, account_id: str, context: RequestContext) -> GetCardsResponse:
         request = GetCardsRequest(account_id=account_id)
         return await self.get_cards_api(request, context)
 
 
 def get_cards_grpc_client() -> CardsGRPCClient:
-    channel = build_grpc_channel(
-        logger=get_logger("CARDS_SERVICE_GRPC_CLIENT"),
+    channel = grpc_channel_registry.get_channel(
+        name="CARDS_SERVICE_GRPC_CLIENT",
         config=settings.cards_grpc_client
     )
     return CardsGRPCClient(channel=channel)
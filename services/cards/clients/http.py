@@ -1,14 +1,17 @@
 import uuid
 
 from fastapi import Depends
-from httpx import Response, QueryParams, Headers
+from httpx import Response, QueryParams
 
 from config import settings
+from libs.cache.base import get_response_cache
+from libs.cache.decorators import cache_response
+from libs.cache.serializers import PydanticCacheSerializer
 from libs.context.base import RequestContext
 from libs.context.http import get_http_request_context
-from libs.http.client.base import HTTPClient, build_http_client
+from libs.http.client.base import HTTPClient
 from libs.http.client.handlers import handle_http_error, HTTPClientError
-from libs.logger import get_logger
+from libs.http.client.registry import http_client_registry
 from libs.routes import APIRoutes
 from services.cards.schema import (
     GetCardResponseSchema,
@@ -33,10 +36,20 @@ class CardsHTTPClient(HTTPClient):
             params=QueryParams(**query.model_dump(mode='json', by_alias=True))
         )
 
+    @cache_response(
+        cache=get_response_cache(settings.downstream_cache),
+        name='cards:http:get_card',
+        serializer=PydanticCacheSerializer(GetCardResponseSchema)
+    )
     async def get_card(self, card_id: uuid.UUID) -> GetCardResponseSchema:
         response = await self.get_card_api(card_id)
         return GetCardResponseSchema.model_validate_json(response.text)
 
+    @cache_response(
+        cache=get_response_cache(settings.downstream_cache),
+        name='cards:http:get_cards',
+        serializer=PydanticCacheSerializer(GetCardsResponseSchema)
+    )
     async def get_cards(self, account_id: uuid.UUID) -> GetCardsResponseSchema:
         query = GetCardsQuerySchema(account_id=account_id)
         response = await self.get_cards_api(query)
@@ -44,9 +57,8 @@ class CardsHTTPClient(HTTPClient):
 
 
 def get_cards_http_client(context: RequestContext = Depends(get_http_request_context)) -> CardsHTTPClient:
-    client = build_http_client(
-        logger=get_logger("CARDS_SERVICE_HTTP_CLIENT"),
-        config=settings.cards_http_client,
-        headers=Headers({"x-test-scenario": context.test_scenario})
+    client = http_client_registry.get_client(
+        name="CARDS_SERVICE_HTTP_CLIENT",
+        config=settings.cards_http_client
     )
-    return CardsHTTPClient(client=client)
+    return CardsHTTPClient(client=client, context=context)
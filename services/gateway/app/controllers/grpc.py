@@ -10,6 +10,7 @@ from contracts.services.gateway.rpc_get_user_details_pb2 import (
     GetUserDetailsResponse
 )
 from contracts.services.gateway.user_details_pb2 import UserDetails
+from libs.base.fanout import fan_out
 from libs.context.base import RequestContext
 from services.accounts.clients.grpc import AccountsGRPCClient
 from services.cards.clients.grpc import CardsGRPCClient
@@ -24,20 +25,9 @@ async def get_user_details(
         accounts_grpc_client: AccountsGRPCClient
 ) -> GetUserDetailsResponse:
     try:
-        get_user_response = await users_grpc_client.get_user(
-            user_id=request.id,
-            context=request_context
-        )
-    except AioRpcError as error:
-        await context.abort(
-            code=error.code(),
-            details=f"Get user details: {error.details()}"
-        )
-
-    try:
-        get_accounts_response = await accounts_grpc_client.get_accounts(
-            user_id=request.id,
-            context=request_context
+        get_user_response, get_accounts_response = await fan_out(
+            users_grpc_client.get_user(user_id=request.id, context=request_context),
+            accounts_grpc_client.get_accounts(user_id=request.id, context=request_context)
         )
     except AioRpcError as error:
         await context.abort(
@@ -61,20 +51,9 @@ async def get_account_details(
         accounts_grpc_client: AccountsGRPCClient
 ) -> GetAccountDetailsResponse:
     try:
-        get_cards_response = await cards_grpc_client.get_cards(
-            account_id=request.id,
-            context=request_context
-        )
-    except AioRpcError as error:
-        await context.abort(
-            code=error.code(),
-            details=f"Get account details: {error.details()}"
-        )
-
-    try:
-        get_accounts_response = await accounts_grpc_client.get_account(
-            account_id=request.id,
-            context=request_context
+        get_cards_response, get_accounts_response = await fan_out(
+            cards_grpc_client.get_cards(account_id=request.id, context=request_context),
+            accounts_grpc_client.get_account(account_id=request.id, context=request_context)
         )
     except AioRpcError as error:
         await context.abort(
@@ -2,6 +2,7 @@ import uuid
 
 from fastapi import HTTPException
 
+from libs.base.fanout import fan_out
 from services.accounts.clients.http import AccountsHTTPClient, AccountsHTTPClientError
 from services.cards.clients.http import CardsHTTPClient, CardsHTTPClientError
 from services.gateway.app.schema.accounts import (
@@ -21,16 +22,11 @@ async def get_user_details(
         accounts_http_client: AccountsHTTPClient
 ) -> GetUserDetailsResponseSchema:
     try:
-        get_user_response = await users_http_client.get_user(user_id=user_id)
-    except UsersHTTPClientError as error:
-        raise HTTPException(
-            detail=f"Get user details: {error.details}",
-            status_code=error.status_code
+        get_user_response, get_accounts_response = await fan_out(
+            users_http_client.get_user(user_id=user_id),
+            accounts_http_client.get_accounts(user_id=user_id)
         )
-
-    try:
-        get_accounts_response = await accounts_http_client.get_accounts(user_id=user_id)
-    except AccountsHTTPClientError as error:
+    except (UsersHTTPClientError, AccountsHTTPClientError) as error:
         raise HTTPException(
             detail=f"Get user details: {error.details}",
             status_code=error.status_code
@@ -50,16 +46,11 @@ async def get_account_details(
         accounts_http_client: AccountsHTTPClient
 ) -> GetAccountDetailsResponseSchema:
     try:
-        get_cards_response = await cards_http_client.get_cards(account_id=account_id)
-    except CardsHTTPClientError as error:
-        raise HTTPException(
-            detail=f"Get account details: {error.details}",
-            status_code=error.status_code
+        get_cards_response, get_accounts_response = await fan_out(
+            cards_http_client.get_cards(account_id=account_id),
+            accounts_http_client.get_account(account_id=account_id)
         )
-
-    try:
-        get_accounts_response = await accounts_http_client.get_account(account_id=account_id)
-    except AccountsHTTPClientError as error:
+    except (CardsHTTPClientError, AccountsHTTPClientError) as error:
         raise HTTPException(
             detail=f"Get account details: {error.details}",
             status_code=error.status_code
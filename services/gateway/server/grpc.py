@@ -4,13 +4,19 @@ from grpc_reflection.v1alpha import reflection
 
 from config import settings
 from contracts.services.gateway import gateway_service_pb2, gateway_service_pb2_grpc
+from libs.cache.base import get_response_cache
+from libs.grpc.client.registry import grpc_channel_registry
 from libs.grpc.server.base import build_grpc_server
-from libs.logger import get_logger
+from libs.logger import get_logger, configure_logging
+from libs.metrics.server import start_metrics_server
+from libs.tracing.base import tracer
 from services.gateway.app.api.grpc import GatewayService
 
 
 async def serve():
+    configure_logging(settings.logger)
     logger = get_logger("GATEWAY_SERVICE_GRPC_SERVER")
+    tracer.configure(service_name="gateway-grpc", config=settings.tracing)
     server = build_grpc_server(settings.gateway_grpc_server, logger)
 
     gateway_service_pb2_grpc.add_GatewayServiceServicer_to_server(GatewayService(), server)
@@ -24,7 +30,14 @@ async def serve():
     )
 
     await server.start()
-    await server.wait_for_termination()
+    metrics_server = await start_metrics_server(settings.gateway_grpc_metrics_server, logger)
+    try:
+        await server.wait_for_termination()
+    finally:
+        metrics_server.close()
+        await grpc_channel_registry.close()
+        await get_response_cache(settings.downstream_cache).close()
+        await tracer.shutdown()
 
 
 if __name__ == '__main__':
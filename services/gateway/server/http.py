@@ -1,10 +1,39 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from config import settings
-from libs.http.server.base import build_http_server
+from libs.cache.base import get_response_cache
+from libs.http.client.registry import http_client_registry
+from libs.http.server.base import build_http_server, HTTP_SERVER_WORKERS
+from libs.http.server.middlewares.metrics import HTTPMetricsMiddleware
+from libs.http.server.middlewares.tracing import HTTPTracingMiddleware
+from libs.logger import configure_logging, get_logger
+from libs.metrics.server import start_worker_metrics_server
+from libs.tracing.base import tracer
 from services.gateway.app.api.http import gateway_router
 
-app = FastAPI(title="gateway-service")
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    configure_logging(settings.logger)
+    tracer.configure(service_name="gateway-http", config=settings.tracing)
+    metrics_server = await start_worker_metrics_server(
+        settings.gateway_http_metrics_server,
+        HTTP_SERVER_WORKERS,
+        get_logger("GATEWAY_SERVICE_HTTP_SERVER")
+    )
+    yield
+    metrics_server.close()
+    await http_client_registry.close()
+    await get_response_cache(settings.downstream_cache).close()
+    await tracer.shutdown()
+
+
+app = FastAPI(title="gateway-service", lifespan=lifespan)
+
+app.add_middleware(HTTPMetricsMiddleware)
+app.add_middleware(HTTPTracingMiddleware)
 
 app.include_router(gateway_router)
 
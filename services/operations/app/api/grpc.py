@@ -1,9 +1,29 @@
+from typing import AsyncIterator
+
 from grpc.aio import ServicerContext
 
 from contracts.services.operations.operations_service_pb2_grpc import OperationsServiceServicer
+from contracts.services.operations.rpc_export_operations_pb2 import (
+    ExportOperationsRequest,
+    ExportOperationsResponse
+)
 from contracts.services.operations.rpc_get_operation_pb2 import GetOperationRequest, GetOperationResponse
 from contracts.services.operations.rpc_get_operations_pb2 import GetOperationsRequest, GetOperationsResponse
-from services.operations.app.controllers.grpc import get_operation, get_operations
+from contracts.services.operations.rpc_get_operations_summary_pb2 import (
+    GetOperationsSummaryRequest,
+    GetOperationsSummaryResponse
+)
+from contracts.services.operations.rpc_stream_operations_pb2 import (
+    StreamOperationsRequest,
+    StreamOperationsResponse
+)
+from services.operations.app.controllers.grpc import (
+    get_operation,
+    get_operations,
+    stream_operations,
+    get_operations_summary,
+    export_operations
+)
 from services.operations.services.postgres.repositories.operations import get_operations_repository
 
 
@@ -17,6 +37,40 @@ class OperationsService(OperationsServiceServicer):
 
     async def GetOperations(self, request: GetOperationsRequest, context: ServicerContext) -> GetOperationsResponse:
         return await get_operations(
+            context=context,
             request=request,
             operations_repository=get_operations_repository()
         )
+
+    async def GetOperationsSummary(
+            self,
+            request: GetOperationsSummaryRequest,
+            context: ServicerContext
+    ) -> GetOperationsSummaryResponse:
+        return await get_operations_summary(
+            context=context,
+            request=request,
+            operations_repository=get_operations_repository()
+        )
+
+    async def StreamOperations(
+            self,
+            request: StreamOperationsRequest,
+            context: ServicerContext
+    ) -> AsyncIterator[StreamOperationsResponse]:
+        async for response in stream_operations(
+                request=request,
+                operations_repository=get_operations_repository()
+        ):
+            yield response
+
+    async def ExportOperations(
+            self,
+            request: ExportOperationsRequest,
+            context: ServicerContext
+    ) -> AsyncIterator[ExportOperationsResponse]:
+        async for response in export_operations(
+                request=request,
+                operations_repository=get_operations_repository()
+        ):
+            yield response
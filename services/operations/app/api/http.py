@@ -2,14 +2,27 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
 
+from config import settings
+from libs.postgres.pool import get_pool_stats
 from libs.routes import APIRoutes
-from services.operations.app.controllers.http import get_operation, get_operations
+from libs.schema.postgres import PostgresPoolStatsSchema
+from services.operations.app.controllers.http import (
+    get_operation,
+    get_operations,
+    export_operations,
+    get_operations_summary
+)
 from services.operations.app.schema.base import (
+    ExportOperationsQuerySchema,
     GetOperationResponseSchema,
     GetOperationsQuerySchema,
     GetOperationsResponseSchema,
+    GetOperationsSummaryQuerySchema,
+    GetOperationsSummaryResponseSchema,
 )
+from services.operations.services.postgres.client import postgres_engine
 from services.operations.services.postgres.repositories.operations import (
     OperationsRepository,
     get_operations_repository
@@ -19,6 +32,10 @@ operations_router = APIRouter(
     prefix=APIRoutes.OPERATIONS,
     tags=[APIRoutes.OPERATIONS.as_tag()]
 )
+health_router = APIRouter(
+    prefix=APIRoutes.HEALTH,
+    tags=[APIRoutes.HEALTH.as_tag()]
+)
 
 
 @operations_router.get('', response_model=GetOperationsResponseSchema)
@@ -29,9 +46,33 @@ async def get_operations_view(
     return await get_operations(query, operations_repository)
 
 
+@operations_router.get('/summary', response_model=GetOperationsSummaryResponseSchema)
+async def get_operations_summary_view(
+        query: Annotated[GetOperationsSummaryQuerySchema, Depends(GetOperationsSummaryQuerySchema.as_query)],
+        operations_repository: Annotated[OperationsRepository, Depends(get_operations_repository)],
+):
+    return await get_operations_summary(query, operations_repository)
+
+
+@operations_router.get('/export', response_class=StreamingResponse)
+async def export_operations_view(
+        query: Annotated[ExportOperationsQuerySchema, Depends(ExportOperationsQuerySchema.as_query)],
+        operations_repository: Annotated[OperationsRepository, Depends(get_operations_repository)],
+):
+    return StreamingResponse(
+        export_operations(query, operations_repository),
+        media_type='application/x-ndjson'
+    )
+
+
 @operations_router.get('/{operation_id}', response_model=GetOperationResponseSchema)
 async def get_operation_view(
         operation_id: uuid.UUID,
         operations_repository: Annotated[OperationsRepository, Depends(get_operations_repository)],
 ):
     return await get_operation(operation_id, operations_repository)
+
+
+@health_router.get('/postgres', response_model=PostgresPoolStatsSchema)
+async def get_postgres_pool_stats_view():
+    return get_pool_stats(postgres_engine, settings.operations_postgres_database)
@@ -1,4 +1,5 @@
 import uuid
+from typing import AsyncIterator, Sequence
 
 from grpc import StatusCode
 from grpc.aio import ServicerContext
@@ -8,31 +9,59 @@ from contracts.services.operations.operation_pb2 import (
     OperationType as ProtoOperationType,
     OperationStatus as ProtoOperationStatus
 )
+from contracts.services.operations.rpc_export_operations_pb2 import (
+    ExportOperationsRequest,
+    ExportOperationsResponse
+)
 from contracts.services.operations.rpc_get_operation_pb2 import GetOperationRequest, GetOperationResponse
 from contracts.services.operations.rpc_get_operations_pb2 import GetOperationsRequest, GetOperationsResponse
-from libs.base.date import to_proto_datetime
+from contracts.services.operations.rpc_get_operations_summary_pb2 import (
+    OperationsSummaryGroup,
+    GetOperationsSummaryRequest,
+    GetOperationsSummaryResponse
+)
+from contracts.services.operations.rpc_stream_operations_pb2 import (
+    StreamOperationsRequest,
+    StreamOperationsResponse
+)
+from libs.base.date import to_proto_datetime, from_proto_datetime
+from services.operations.app.schema.base import (
+    DEFAULT_OPERATIONS_PAGE_SIZE,
+    MAX_OPERATIONS_PAGE_SIZE,
+    DEFAULT_OPERATIONS_EXPORT_CHUNK_SIZE,
+    MAX_OPERATIONS_EXPORT_CHUNK_SIZE
+)
+from services.operations.app.schema.cursor import OperationsCursorSchema
 from services.operations.services.postgres.models import OperationsModel
 from services.operations.services.postgres.repositories.operations import OperationsRepository
 from services.operations.types.operations import OperationType, OperationStatus
 
-MAP_OPERATION_TYPE_TO_PROTO = OperationType.to_proto_map(ProtoOperationType)
-MAP_OPERATION_TYPE_FROM_PROTO = OperationType.from_proto_map(ProtoOperationType)
-MAP_OPERATION_STATUS_TO_PROTO = OperationStatus.to_proto_map(ProtoOperationStatus)
-MAP_OPERATION_STATUS_FROM_PROTO = OperationStatus.from_proto_map(ProtoOperationStatus)
+OPERATION_TYPE_PROTO_MAP = OperationType.proto_map(ProtoOperationType)
+OPERATION_STATUS_PROTO_MAP = OperationStatus.proto_map(ProtoOperationStatus)
+
+
+def build_operations_from_models(models: Sequence[OperationsModel]) -> list[Operation]:
+    proto_types = OPERATION_TYPE_PROTO_MAP.to_proto_many(model.type for model in models)
+    proto_statuses = OPERATION_STATUS_PROTO_MAP.to_proto_many(model.status for model in models)
+
+    return [
+        Operation(
+            id=str(model.id),
+            type=proto_type,
+            status=proto_status,
+            amount=model.amount,
+            card_id=str(model.card_id),
+            user_id=str(model.user_id),
+            category=model.category,
+            created_at=to_proto_datetime(model.created_at),
+            account_id=str(model.account_id)
+        )
+        for model, proto_type, proto_status in zip(models, proto_types, proto_statuses)
+    ]
 
 
 def build_operation_from_model(model: OperationsModel) -> Operation:
-    return Operation(
-        id=str(model.id),
-        type=MAP_OPERATION_TYPE_TO_PROTO[model.type],
-        status=MAP_OPERATION_STATUS_TO_PROTO[model.status],
-        amount=model.amount,
-        card_id=str(model.card_id),
-        user_id=str(model.user_id),
-        category=model.category,
-        created_at=to_proto_datetime(model.created_at),
-        account_id=str(model.account_id)
-    )
+    return build_operations_from_models([model])[0]
 
 
 async def get_operation(
@@ -50,16 +79,126 @@ async def get_operation(
     return GetOperationResponse(operation=build_operation_from_model(operation))
 
 
+def get_page_size(request: GetOperationsRequest | StreamOperationsRequest) -> int:
+    if not request.HasField('page_size') or request.page_size <= 0:
+        return DEFAULT_OPERATIONS_PAGE_SIZE
+
+    return min(request.page_size, MAX_OPERATIONS_PAGE_SIZE)
+
+
+def get_operations_limit(request: GetOperationsRequest) -> int | None:
+    if not request.HasField('page_size'):
+        return None
+
+    return get_page_size(request)
+
+
 async def get_operations(
+        context: ServicerContext,
         request: GetOperationsRequest,
         operations_repository: OperationsRepository
 ) -> GetOperationsResponse:
+    after = None
+    if request.page_token:
+        try:
+            after = OperationsCursorSchema.decode(request.page_token).as_keyset()
+        except ValueError:
+            await context.abort(
+                code=StatusCode.INVALID_ARGUMENT,
+                details=f"Invalid page token {request.page_token}"
+            )
+
+    page_size = get_operations_limit(request)
     operations = await operations_repository.filter(
         user_id=uuid.UUID(request.user_id),
+        limit=page_size + 1 if page_size else None,
         card_id=uuid.UUID(request.card_id) if request.card_id else None,
-        account_id=uuid.UUID(request.account_id) if request.account_id else None
+        account_id=uuid.UUID(request.account_id) if request.account_id else None,
+        after=after
     )
 
+    next_page_token = ''
+    if page_size and len(operations) > page_size:
+        operations = operations[:page_size]
+        next_page_token = OperationsCursorSchema.from_model(operations[-1]).encode()
+
     return GetOperationsResponse(
-        operations=[build_operation_from_model(operation) for operation in operations]
+        operations=build_operations_from_models(operations),
+        next_page_token=next_page_token
+    )
+
+
+async def get_operations_summary(
+        context: ServicerContext,
+        request: GetOperationsSummaryRequest,
+        operations_repository: OperationsRepository
+) -> GetOperationsSummaryResponse:
+    try:
+        start_date = from_proto_datetime(request.start_date) if request.start_date else None
+        end_date = from_proto_datetime(request.end_date) if request.end_date else None
+    except ValueError:
+        await context.abort(
+            code=StatusCode.INVALID_ARGUMENT,
+            details=f"Invalid summary window {request.start_date} - {request.end_date}"
+        )
+
+    groups = await operations_repository.summarize(
+        user_id=uuid.UUID(request.user_id),
+        card_id=uuid.UUID(request.card_id) if request.card_id else None,
+        account_id=uuid.UUID(request.account_id) if request.account_id else None,
+        start_date=start_date,
+        end_date=end_date
+    )
+
+    proto_types = OPERATION_TYPE_PROTO_MAP.to_proto_many(group['type'] for group in groups)
+    proto_statuses = OPERATION_STATUS_PROTO_MAP.to_proto_many(group['status'] for group in groups)
+
+    return GetOperationsSummaryResponse(
+        groups=[
+            OperationsSummaryGroup(
+                type=proto_type,
+                status=proto_status,
+                count=group['count'],
+                category=group['category'],
+                total_amount=group['total_amount']
+            )
+            for group, proto_type, proto_status in zip(groups, proto_types, proto_statuses)
+        ],
+        total_count=sum(group['count'] for group in groups),
+        total_amount=sum(group['total_amount'] for group in groups)
+    )
+
+
+async def stream_operations(
+        request: StreamOperationsRequest,
+        operations_repository: OperationsRepository
+) -> AsyncIterator[StreamOperationsResponse]:
+    operations = operations_repository.stream(
+        user_id=uuid.UUID(request.user_id),
+        page_size=get_page_size(request),
+        card_id=uuid.UUID(request.card_id) if request.card_id else None,
+        account_id=uuid.UUID(request.account_id) if request.account_id else None
+    )
+    async for operation in operations:
+        yield StreamOperationsResponse(operation=build_operation_from_model(operation))
+
+
+def get_export_chunk_size(request: ExportOperationsRequest) -> int:
+    if not request.HasField('chunk_size') or request.chunk_size <= 0:
+        return DEFAULT_OPERATIONS_EXPORT_CHUNK_SIZE
+
+    return min(request.chunk_size, MAX_OPERATIONS_EXPORT_CHUNK_SIZE)
+
+
+async def export_operations(
+        request: ExportOperationsRequest,
+        operations_repository: OperationsRepository
+) -> AsyncIterator[ExportOperationsResponse]:
+    partitions = operations_repository.export(
+        user_id=uuid.UUID(request.user_id),
+        chunk_size=get_export_chunk_size(request),
+        card_id=uuid.UUID(request.card_id) if request.card_id else None,
+        account_id=uuid.UUID(request.account_id) if request.account_id else None
     )
+    async for operations in partitions:
+        yield ExportOperationsResponse(operations=build_operations_from_models(operations))
@@ -1,13 +1,19 @@
 import uuid
+from typing import AsyncIterator
 
 from fastapi import HTTPException, status
 
 from services.operations.app.schema.base import (
+    ExportOperationsQuerySchema,
     GetOperationResponseSchema,
     GetOperationsQuerySchema,
     GetOperationsResponseSchema,
+    GetOperationsSummaryQuerySchema,
+    GetOperationsSummaryResponseSchema,
 )
+from services.operations.app.schema.cursor import OperationsCursorSchema
 from services.operations.app.schema.operation import OperationSchema
+from services.operations.app.schema.summary import OperationsSummaryGroupSchema
 from services.operations.services.postgres.repositories.operations import OperationsRepository
 
 
@@ -29,12 +35,66 @@ async def get_operations(
         query: GetOperationsQuerySchema,
         operations_repository: OperationsRepository
 ) -> GetOperationsResponseSchema:
+    after = None
+    if query.cursor:
+        try:
+            after = OperationsCursorSchema.decode(query.cursor).as_keyset()
+        except ValueError:
+            raise HTTPException(
+                detail=f"Invalid cursor {query.cursor}",
+                status_code=status.HTTP_400_BAD_REQUEST
+            )
+
     operations = await operations_repository.filter(
         user_id=query.user_id,
+        limit=query.limit + 1 if query.limit else None,
         card_id=query.card_id,
-        account_id=query.account_id
+        account_id=query.account_id,
+        after=after
     )
 
+    next_cursor = None
+    if query.limit and len(operations) > query.limit:
+        operations = operations[:query.limit]
+        next_cursor = OperationsCursorSchema.from_model(operations[-1]).encode()
+
     return GetOperationsResponseSchema(
-        operations=[OperationSchema.model_validate(operation) for operation in operations]
+        operations=[OperationSchema.model_validate(operation) for operation in operations],
+        next_cursor=next_cursor
+    )
+
+
+async def get_operations_summary(
+        query: GetOperationsSummaryQuerySchema,
+        operations_repository: OperationsRepository
+) -> GetOperationsSummaryResponseSchema:
+    groups = await operations_repository.summarize(
+        user_id=query.user_id,
+        card_id=query.card_id,
+        account_id=query.account_id,
+        start_date=query.start_date,
+        end_date=query.end_date
     )
+
+    return GetOperationsSummaryResponseSchema(
+        groups=[OperationsSummaryGroupSchema.model_validate(group) for group in groups],
+        total_count=sum(group['count'] for group in groups),
+        total_amount=sum(group['total_amount'] for group in groups)
+    )
+
+
+async def export_operations(
+        query: ExportOperationsQuerySchema,
+        operations_repository: OperationsRepository
+) -> AsyncIterator[bytes]:
+    partitions = operations_repository.export(
+        user_id=query.user_id,
+        chunk_size=query.chunk_size,
+        card_id=query.card_id,
+        account_id=query.account_id
+    )
+    async for operations in partitions:
+        yield b''.join(
+            OperationSchema.model_validate(operation).model_dump_json(by_alias=True).encode() + b'\n'
+            for operation in operations
+        )
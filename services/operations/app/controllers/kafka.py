@@ -1,24 +1,106 @@
+import uuid
+from datetime import datetime
+
+from google.protobuf.message import DecodeError
+
+from contracts.services.operations.operation_event_pb2 import OperationEvent
+from contracts.services.operations.operation_pb2 import (
+    OperationType as ProtoOperationType,
+    OperationStatus as ProtoOperationStatus
+)
+from libs.base.recent_keys import RecentKeys
+from libs.kafka.message import KafkaMessage, KafkaContentType
 from services.operations.app.schema.operation import OperationEventSchema
 from services.operations.services.postgres.repositories.operations import (
     CreateOperationDict,
     OperationsRepository,
 )
+from services.operations.types.operations import OperationType, OperationStatus
+
+OPERATION_EVENT_ID_NAMESPACE = uuid.UUID('0b7c2f4e-5d1a-4c8e-9f3b-6a2d8e1c4b70')
+OPERATION_EVENT_MESSAGE_TYPE = OperationEvent.DESCRIPTOR.full_name
+
+OPERATION_TYPE_PROTO_MAP = OperationType.proto_map(ProtoOperationType)
+OPERATION_STATUS_PROTO_MAP = OperationStatus.proto_map(ProtoOperationStatus)
+
 
+def build_create_operation_dict(event: OperationEventSchema, message: str) -> CreateOperationDict:
+    return CreateOperationDict(
+        type=event.type,
+        status=event.status,
+        amount=event.amount,
+        user_id=event.user_id,
+        card_id=event.card_id,
+        category=event.category,
+        event_id=event.event_id or uuid.uuid5(OPERATION_EVENT_ID_NAMESPACE, message),
+        account_id=event.account_id,
+        created_at=event.created_at,
+    )
 
-def handle_operation_events(operations_repository: OperationsRepository):
-    async def handle(message: str) -> None:
-        event = OperationEventSchema.model_validate_json(message)
-        await operations_repository.create(
-            CreateOperationDict(
-                type=event.type,
-                status=event.status,
-                amount=event.amount,
-                user_id=event.user_id,
-                card_id=event.card_id,
-                category=event.category,
-                account_id=event.account_id,
-                created_at=event.created_at,
-            )
+
+def decode_protobuf_operation_event(message: KafkaMessage) -> CreateOperationDict:
+    if message.message_type not in (None, OPERATION_EVENT_MESSAGE_TYPE):
+        raise ValueError(f"Unexpected protobuf message type '{message.message_type}' for operation event")
+
+    try:
+        event = OperationEvent.FromString(message.value)
+        return CreateOperationDict(
+            type=OPERATION_TYPE_PROTO_MAP.from_proto(event.type),
+            status=OPERATION_STATUS_PROTO_MAP.from_proto(event.status),
+            amount=event.amount,
+            user_id=uuid.UUID(bytes=event.user_id),
+            card_id=uuid.UUID(bytes=event.card_id),
+            category=event.category,
+            event_id=(
+                uuid.UUID(bytes=event.event_id)
+                if event.event_id
+                else uuid.uuid5(OPERATION_EVENT_ID_NAMESPACE, message.value.hex())
+            ),
+            account_id=uuid.UUID(bytes=event.account_id),
+            created_at=datetime.fromisoformat(event.created_at),
         )
+    except (KeyError, DecodeError) as error:
+        raise ValueError(f"Invalid protobuf operation event: {type(error).__name__}: {error}") from error
+
+
+def decode_operation_event(message: KafkaMessage) -> CreateOperationDict:
+    if message.content_type == KafkaContentType.PROTOBUF:
+        return decode_protobuf_operation_event(message)
+
+    if message.content_type == KafkaContentType.JSON:
+        value = message.value.decode("utf-8")
+        return build_create_operation_dict(OperationEventSchema.model_validate_json(value), value)
+
+    raise ValueError(f"Unsupported operation event content type '{message.content_type}'")
+
+
+def handle_operation_events(operations_repository: OperationsRepository, recent_event_ids: RecentKeys[uuid.UUID]):
+    async def handle(message: KafkaMessage) -> None:
+        operation = decode_operation_event(message)
+        if operation['event_id'] in recent_event_ids:
+            return
+
+        await operations_repository.create(operation)
+        recent_event_ids.add(operation['event_id'])
+
+    return handle
+
+
+def handle_operation_events_batch(
+        operations_repository: OperationsRepository,
+        recent_event_ids: RecentKeys[uuid.UUID]
+):
+    async def handle(messages: list[KafkaMessage]) -> None:
+        operations: dict[uuid.UUID, CreateOperationDict] = {}
+        for message in messages:
+            operation = decode_operation_event(message)
+            if operation['event_id'] not in recent_event_ids:
+                operations.setdefault(operation['event_id'], operation)
+
+        if not operations:
+            return
+
+        await operations_repository.create_many(list(operations.values()))
+        recent_event_ids.update(operations)
 
     return handle
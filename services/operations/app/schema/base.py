@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Self
 
 from fastapi import Query
@@ -6,6 +7,12 @@ from pydantic import UUID4
 from libs.schema.base import BaseSchema
 from libs.schema.query import QuerySchema
 from services.operations.app.schema.operation import OperationSchema
+from services.operations.app.schema.summary import OperationsSummaryGroupSchema
+
+DEFAULT_OPERATIONS_PAGE_SIZE = 100
+MAX_OPERATIONS_PAGE_SIZE = 1000
+DEFAULT_OPERATIONS_EXPORT_CHUNK_SIZE = 500
+MAX_OPERATIONS_EXPORT_CHUNK_SIZE = 5000
 
 
 class GetOperationResponseSchema(BaseSchema):
@@ -16,20 +23,85 @@ class GetOperationsQuerySchema(QuerySchema):
     user_id: UUID4
     card_id: UUID4 | None = None
     account_id: UUID4 | None = None
+    limit: int | None = None
+    cursor: str | None = None
 
     @classmethod
     def as_query(
             cls,
             user_id: UUID4 = Query(alias="userId"),
             card_id: UUID4 | None = Query(alias="cardId", default=None),
-            account_id: UUID4 | None = Query(alias="accountId", default=None)
+            account_id: UUID4 | None = Query(alias="accountId", default=None),
+            limit: int | None = Query(default=None, ge=1, le=MAX_OPERATIONS_PAGE_SIZE),
+            cursor: str | None = Query(default=None)
     ) -> Self:
         return GetOperationsQuerySchema(
             user_id=user_id,
             card_id=card_id,
-            account_id=account_id
+            account_id=account_id,
+            limit=limit,
+            cursor=cursor
         )
 
 
 class GetOperationsResponseSchema(BaseSchema):
     operations: list[OperationSchema]
+    next_cursor: str | None = None
+
+
+class ExportOperationsQuerySchema(QuerySchema):
+    user_id: UUID4
+    card_id: UUID4 | None = None
+    account_id: UUID4 | None = None
+    chunk_size: int = DEFAULT_OPERATIONS_EXPORT_CHUNK_SIZE
+
+    @classmethod
+    def as_query(
+            cls,
+            user_id: UUID4 = Query(alias="userId"),
+            card_id: UUID4 | None = Query(alias="cardId", default=None),
+            account_id: UUID4 | None = Query(alias="accountId", default=None),
+            chunk_size: int = Query(
+                alias="chunkSize",
+                default=DEFAULT_OPERATIONS_EXPORT_CHUNK_SIZE,
+                ge=1,
+                le=MAX_OPERATIONS_EXPORT_CHUNK_SIZE
+            )
+    ) -> Self:
+        return ExportOperationsQuerySchema(
+            user_id=user_id,
+            card_id=card_id,
+            account_id=account_id,
+            chunk_size=chunk_size
+        )
+
+
+class GetOperationsSummaryQuerySchema(QuerySchema):
+    user_id: UUID4
+    card_id: UUID4 | None = None
+    account_id: UUID4 | None = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+
+    @classmethod
+    def as_query(
+            cls,
+            user_id: UUID4 = Query(alias="userId"),
+            card_id: UUID4 | None = Query(alias="cardId", default=None),
+            account_id: UUID4 | None = Query(alias="accountId", default=None),
+            start_date: datetime | None = Query(alias="startDate", default=None),
+            end_date: datetime | None = Query(alias="endDate", default=None)
+    ) -> Self:
+        return GetOperationsSummaryQuerySchema(
+            user_id=user_id,
+            card_id=card_id,
+            account_id=account_id,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+
+class GetOperationsSummaryResponseSchema(BaseSchema):
+    groups: list[OperationsSummaryGroupSchema]
+    total_count: int
+    total_amount: float
@@ -0,0 +1,20 @@
+import uuid
+from datetime import datetime
+from typing import Self
+
+from pydantic import UUID4
+
+from libs.schema.cursor import CursorSchema
+from services.operations.services.postgres.models import OperationsModel
+
+
+class OperationsCursorSchema(CursorSchema):
+    id: UUID4
+    created_at: datetime
+
+    @classmethod
+    def from_model(cls, model: OperationsModel) -> Self:
+        return cls(id=model.id, created_at=model.created_at)
+
+    def as_keyset(self) -> tuple[datetime, uuid.UUID]:
+        return self.created_at, self.id
@@ -1,3 +1,4 @@
+import uuid
 from datetime import datetime
 
 from pydantic import UUID4
@@ -22,4 +23,4 @@ class OperationSchema(BaseOperationSchema):
 
 
 class OperationEventSchema(BaseOperationSchema):
-    pass
+    event_id: uuid.UUID | None = None
@@ -0,0 +1,10 @@
+from libs.schema.base import BaseSchema
+from services.operations.types.operations import OperationType, OperationStatus
+
+
+class OperationsSummaryGroupSchema(BaseSchema):
+    type: OperationType
+    status: OperationStatus
+    count: int
+    category: str
+    total_amount: float
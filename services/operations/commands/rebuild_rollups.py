@@ -0,0 +1,26 @@
+import argparse
+import asyncio
+
+from config import settings
+from libs.logger import get_logger, configure_logging
+from services.operations.services.postgres.repositories.operations import get_operations_repository
+
+
+async def rebuild(batch_size: int):
+    configure_logging(settings.logger)
+    logger = get_logger("OPERATIONS_ROLLUPS_REBUILD")
+    operations_repository = get_operations_repository()
+
+    users = 0
+    async for rebuilt in operations_repository.rebuild_daily_rollups(batch_size):
+        users += rebuilt
+        logger.info(f"Rebuilt daily rollups for {users} users")
+
+    logger.info(f"Daily rollups rebuild finished, {users} users processed")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Recompute operations daily rollups from the operations table")
+    parser.add_argument('--batch-size', type=int, default=500)
+
+    asyncio.run(rebuild(parser.parse_args().batch_size))
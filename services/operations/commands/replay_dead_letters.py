@@ -0,0 +1,41 @@
+import argparse
+import asyncio
+
+from config import settings
+from libs.kafka.dead_letter import replay_dead_letters
+from libs.logger import get_logger, configure_logging
+from services.operations.services.kafka.producer import get_operations_kafka_producer_client
+from services.operations.services.kafka.topics import OperationsKafkaTopic
+
+
+async def replay(limit: int | None, idle_timeout: float, target_topic: str | None):
+    configure_logging(settings.logger)
+    logger = get_logger("OPERATIONS_DEAD_LETTERS_REPLAY")
+    operations_kafka_producer_client = get_operations_kafka_producer_client()
+
+    await operations_kafka_producer_client.start()
+    try:
+        replayed = await replay_dead_letters(
+            topic=OperationsKafkaTopic.OPERATION_EVENTS_DLQ,
+            group_id="operation-events-dlq-replay-group",
+            logger=logger,
+            config=settings.operations_kafka_client,
+            producer=operations_kafka_producer_client,
+            limit=limit,
+            idle_timeout=idle_timeout,
+            target_topic=target_topic
+        )
+    finally:
+        await operations_kafka_producer_client.stop()
+
+    logger.info(f"Dead letters replay finished, {replayed} messages re-injected")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Re-inject operation events from the dead letter topic")
+    parser.add_argument('--limit', type=int, default=None)
+    parser.add_argument('--idle-timeout', type=float, default=5.0)
+    parser.add_argument('--target-topic', default=None)
+
+    arguments = parser.parse_args()
+    asyncio.run(replay(arguments.limit, arguments.idle_timeout, arguments.target_topic))
@@ -0,0 +1,35 @@
+"""operations outbox
+
+Revision ID: 4b7e9d1f3a6c
+Revises: c31f9a6d2e58
+Create Date: 2026-10-18 17:12:44.861930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e9d1f3a6c'
+down_revision: Union[str, None] = 'c31f9a6d2e58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('operations_outbox',
+    sa.Column('id', sa.BigInteger(), sa.Identity(always=True), nullable=False),
+    sa.Column('key', sa.String(length=255), nullable=True),
+    sa.Column('topic', sa.String(length=255), nullable=False),
+    sa.Column('value', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('operations_outbox')
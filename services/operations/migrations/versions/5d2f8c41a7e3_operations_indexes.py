@@ -0,0 +1,50 @@
+"""operations indexes
+
+Revision ID: 5d2f8c41a7e3
+Revises: 1bc209aeb6b8
+Create Date: 2026-10-18 12:04:51.318402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8c41a7e3'
+down_revision: Union[str, None] = '1bc209aeb6b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES: dict[str, list[str]] = {
+    'ix_operations_user_id_created_at_id': ['user_id', 'created_at', 'id'],
+    'ix_operations_user_id_card_id_created_at_id': ['user_id', 'card_id', 'created_at', 'id'],
+    'ix_operations_user_id_account_id_created_at_id': ['user_id', 'account_id', 'created_at', 'id'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(
+                name,
+                'operations',
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(
+                name,
+                table_name='operations',
+                if_exists=True,
+                postgresql_concurrently=True
+            )
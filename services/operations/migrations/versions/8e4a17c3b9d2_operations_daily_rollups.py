@@ -0,0 +1,45 @@
+"""operations daily rollups
+
+Revision ID: 8e4a17c3b9d2
+Revises: 5d2f8c41a7e3
+Create Date: 2026-10-18 15:02:37.514206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4a17c3b9d2'
+down_revision: Union[str, None] = '5d2f8c41a7e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('operations_daily_rollups',
+    sa.Column('account_id', sa.UUID(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('total_amount', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('account_id', 'day', 'type', 'status', 'category')
+    )
+    op.create_index(
+        'ix_operations_daily_rollups_user_id_day',
+        'operations_daily_rollups',
+        ['user_id', 'day'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_operations_daily_rollups_user_id_day', table_name='operations_daily_rollups')
+    op.drop_table('operations_daily_rollups')
@@ -0,0 +1,46 @@
+"""operations event id
+
+Revision ID: c31f9a6d2e58
+Revises: 8e4a17c3b9d2
+Create Date: 2026-10-18 15:41:09.207614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c31f9a6d2e58'
+down_revision: Union[str, None] = '8e4a17c3b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('operations', sa.Column('event_id', sa.UUID(), nullable=True))
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ux_operations_event_id',
+            'operations',
+            ['event_id'],
+            unique=True,
+            if_not_exists=True,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ux_operations_event_id',
+            table_name='operations',
+            if_exists=True,
+            postgresql_concurrently=True
+        )
+
+    op.drop_column('operations', 'event_id')
@@ -5,12 +5,18 @@ from grpc_reflection.v1alpha import reflection
 from config import settings
 from contracts.services.operations import operations_service_pb2, operations_service_pb2_grpc
 from libs.grpc.server.base import build_grpc_server
-from libs.logger import get_logger
+from libs.logger import get_logger, configure_logging
+from libs.metrics.server import start_metrics_server
+from libs.postgres.pool import warm_up_pool
+from libs.tracing.base import tracer
 from services.operations.app.api.grpc import OperationsService
+from services.operations.services.postgres.client import postgres_engine
 
 
 async def serve():
+    configure_logging(settings.logger)
     logger = get_logger("OPERATIONS_SERVICE_GRPC_SERVER")
+    tracer.configure(service_name="operations-grpc", config=settings.tracing)
     server = build_grpc_server(settings.operations_grpc_server, logger)
 
     operations_service_pb2_grpc.add_OperationsServiceServicer_to_server(OperationsService(), server)
@@ -23,8 +29,18 @@ async def serve():
         server
     )
 
+    await warm_up_pool(
+        engine=postgres_engine,
+        logger=logger,
+        connections=settings.operations_postgres_database.pool_warmup
+    )
     await server.start()
-    await server.wait_for_termination()
+    metrics_server = await start_metrics_server(settings.operations_grpc_metrics_server, logger)
+    try:
+        await server.wait_for_termination()
+    finally:
+        metrics_server.close()
+        await tracer.shutdown()
 
 
 if __name__ == '__main__':
@@ -1,11 +1,45 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from config import settings
-from libs.http.server.base import build_http_server
-from services.operations.app.api.http import operations_router
+from libs.http.server.base import build_http_server, HTTP_SERVER_WORKERS
+from libs.http.server.middlewares.metrics import HTTPMetricsMiddleware
+from libs.http.server.middlewares.tracing import HTTPTracingMiddleware
+from libs.logger import configure_logging, get_logger
+from libs.metrics.server import start_worker_metrics_server
+from libs.postgres.pool import warm_up_pool
+from libs.tracing.base import tracer
+from services.operations.app.api.http import operations_router, health_router
+from services.operations.services.postgres.client import postgres_engine
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    configure_logging(settings.logger)
+    logger = get_logger("OPERATIONS_SERVICE_HTTP_SERVER")
+    tracer.configure(service_name="operations-http", config=settings.tracing)
+    await warm_up_pool(
+        engine=postgres_engine,
+        logger=logger,
+        connections=settings.operations_postgres_database.pool_warmup
+    )
+    metrics_server = await start_worker_metrics_server(
+        settings.operations_http_metrics_server,
+        HTTP_SERVER_WORKERS,
+        logger
+    )
+    yield
+    metrics_server.close()
+    await tracer.shutdown()
+
+
+app = FastAPI(title="operations-service", lifespan=lifespan)
 
-app = FastAPI(title="operations-service")
+app.add_middleware(HTTPMetricsMiddleware)
+app.add_middleware(HTTPTracingMiddleware)
 
+app.include_router(health_router)
 app.include_router(operations_router)
 
 if __name__ == "__main__":
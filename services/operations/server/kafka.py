@@ -1,32 +1,108 @@
 import asyncio
+import multiprocessing
+import signal
 
-from services.operations.app.controllers.kafka import handle_operation_events
+from config import settings
+from libs.base.recent_keys import RecentKeys
+from libs.logger import get_logger, configure_logging
+from libs.metrics.server import start_metrics_server
+from libs.postgres.pool import warm_up_pool, is_pool_saturated
+from libs.tracing.base import tracer
+from services.operations.app.controllers.kafka import handle_operation_events_batch
 from services.operations.services.kafka.consumer import (
     get_operations_kafka_admin_client,
     get_operations_kafka_consumer_client,
 )
+from services.operations.services.kafka.producer import get_operations_kafka_producer_client
 from services.operations.services.kafka.topics import OperationsKafkaTopic
+from services.operations.services.postgres.client import postgres_engine
 from services.operations.services.postgres.repositories.operations import get_operations_repository
 
 
-async def consume():
-    operations_repository = get_operations_repository()
+def provision_topics():
     operations_kafka_admin_client = get_operations_kafka_admin_client()
-    operations_kafka_consumer_client = get_operations_kafka_consumer_client()
 
     for topic in OperationsKafkaTopic:
         operations_kafka_admin_client.create_topic(
             topic=topic,
-            num_partitions=1,
-            replication_factor=1
+            num_partitions=settings.operations_kafka_client.topic_partitions,
+            replication_factor=settings.operations_kafka_client.topic_replication_factor
         )
 
-    await asyncio.gather(
-        operations_kafka_consumer_client.consume_operation_events(
-            handler=handle_operation_events(operations_repository)
+
+async def consume(process_index: int = 0):
+    configure_logging(settings.logger)
+    logger = get_logger("OPERATIONS_SERVICE_KAFKA_SERVER")
+    tracer.configure(service_name="operations-kafka", config=settings.tracing)
+    operations_repository = get_operations_repository()
+    operations_kafka_consumer_client = get_operations_kafka_consumer_client()
+    operations_kafka_producer_client = get_operations_kafka_producer_client()
+
+    await warm_up_pool(
+        engine=postgres_engine,
+        logger=logger,
+        connections=settings.operations_postgres_database.pool_warmup
+    )
+    metrics_server = await start_metrics_server(
+        settings.operations_kafka_metrics_server.model_copy(
+            update={'port': settings.operations_kafka_metrics_server.port + process_index}
         ),
+        logger
     )
+    await operations_kafka_producer_client.start()
+    try:
+        await asyncio.gather(
+            operations_kafka_consumer_client.consume_operation_events(
+                handler=handle_operation_events_batch(
+                    operations_repository=operations_repository,
+                    recent_event_ids=RecentKeys(max_size=settings.operations_kafka_client.consumer_dedup_cache_size)
+                ),
+                producer=operations_kafka_producer_client,
+                saturation_probe=lambda: is_pool_saturated(
+                    engine=postgres_engine,
+                    config=settings.operations_postgres_database
+                )
+            ),
+        )
+    finally:
+        await operations_kafka_producer_client.stop()
+        metrics_server.close()
+        await tracer.shutdown()
+
+
+def run_consumer(process_index: int):
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    asyncio.run(consume(process_index))
+
+
+def launch():
+    configure_logging(settings.logger)
+    logger = get_logger("OPERATIONS_SERVICE_KAFKA_LAUNCHER")
+
+    provision_topics()
+
+    processes = settings.operations_kafka_client.consumer_processes
+    if processes <= 1:
+        run_consumer(0)
+        return
+
+    context = multiprocessing.get_context('spawn')
+    workers = [
+        context.Process(target=run_consumer, args=(index,), name=f"operations-kafka-consumer-{index}")
+        for index in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+
+    logger.info(f"Started {processes} Kafka consumer processes")
+    signal.signal(signal.SIGTERM, lambda *_: [worker.terminate() for worker in workers])
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.join()
 
 
 if __name__ == '__main__':
-    asyncio.run(consume())
+    launch()
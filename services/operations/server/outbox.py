@@ -0,0 +1,44 @@
+import asyncio
+
+from config import settings
+from libs.kafka.outbox import KafkaOutboxRelay
+from libs.logger import get_logger, configure_logging
+from libs.metrics.server import start_metrics_server
+from libs.postgres.pool import warm_up_pool
+from libs.tracing.base import tracer
+from services.operations.server.kafka import provision_topics
+from services.operations.services.kafka.producer import get_operations_kafka_producer_client
+from services.operations.services.postgres.client import postgres_engine
+from services.operations.services.postgres.repositories.outbox import get_operations_outbox_repository
+
+
+async def relay():
+    configure_logging(settings.logger)
+    logger = get_logger("OPERATIONS_SERVICE_OUTBOX_RELAY")
+    tracer.configure(service_name="operations-outbox", config=settings.tracing)
+    operations_outbox_repository = get_operations_outbox_repository()
+    operations_kafka_producer_client = get_operations_kafka_producer_client()
+
+    provision_topics()
+    await warm_up_pool(
+        engine=postgres_engine,
+        logger=logger,
+        connections=min(settings.operations_kafka_client.outbox_workers, settings.operations_postgres_database.pool_size)
+    )
+    metrics_server = await start_metrics_server(settings.operations_outbox_metrics_server, logger)
+    await operations_kafka_producer_client.start()
+    try:
+        await KafkaOutboxRelay(
+            claim=operations_outbox_repository.relay,
+            logger=logger,
+            config=settings.operations_kafka_client,
+            producer=operations_kafka_producer_client
+        ).run()
+    finally:
+        await operations_kafka_producer_client.stop()
+        metrics_server.close()
+        await tracer.shutdown()
+
+
+if __name__ == '__main__':
+    asyncio.run(relay())
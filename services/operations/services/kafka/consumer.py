@@ -1,16 +1,35 @@
 from config import settings
 from libs.kafka.admin import KafkaAdminClient
-from libs.kafka.consumer import KafkaConsumerClient, KafkaConsumerHandler
+from libs.kafka.consumer import KafkaConsumerClient, KafkaConsumerBatchHandler
+from libs.kafka.dead_letter import KafkaDeadLetterPolicy
+from libs.kafka.flow_control import KafkaSaturationProbe
+from libs.kafka.producer import KafkaProducerClient
 from libs.logger import get_logger
+from libs.postgres.errors import is_postgres_transient_error
 from services.operations.services.kafka.topics import OperationsKafkaTopic
 
+OPERATION_EVENTS_GROUP_ID = "operation-events-group"
+
 
 class OperationsKafkaConsumerClient(KafkaConsumerClient):
-    async def consume_operation_events(self, handler: KafkaConsumerHandler):
-        await self.start(
+    async def consume_operation_events(
+            self,
+            handler: KafkaConsumerBatchHandler,
+            producer: KafkaProducerClient,
+            saturation_probe: KafkaSaturationProbe | None = None
+    ):
+        await self.start_batch(
             topic=OperationsKafkaTopic.OPERATION_EVENTS_INBOX,
-            group_id="operation-events-group",
-            handler=handler
+            group_id=OPERATION_EVENTS_GROUP_ID,
+            handler=handler,
+            dead_letter=KafkaDeadLetterPolicy(
+                topic=OperationsKafkaTopic.OPERATION_EVENTS_DLQ,
+                logger=self.logger,
+                config=self.config,
+                producer=producer,
+                is_transient=is_postgres_transient_error
+            ),
+            saturation_probe=saturation_probe
         )
 
 
@@ -0,0 +1,8 @@
+from config import settings
+from libs.kafka.producer import KafkaProducerClient
+from libs.logger import get_logger
+
+
+def get_operations_kafka_producer_client() -> KafkaProducerClient:
+    logger = get_logger("OPERATIONS_KAFKA_PRODUCER_CLIENT")
+    return KafkaProducerClient(config=settings.operations_kafka_client, logger=logger)
@@ -2,4 +2,6 @@ from enum import StrEnum
 
 
 class OperationsKafkaTopic(StrEnum):
+    OPERATION_EVENTS_DLQ = "operations-service.operation-event.dlq"
     OPERATION_EVENTS_INBOX = "operations-service.operation-event.inbox"
+    OPERATION_STATUS_CHANGES = "operations-service.operation-status.changes"
@@ -1,4 +1,6 @@
 from config import settings
-from libs.postgres.engine import get_postgres_session_factory
+from libs.postgres.engine import get_postgres_session_factory, get_postgres_engine, get_postgres_read_router
 
+postgres_engine = get_postgres_engine(settings.operations_postgres_database)
+postgres_read_router = get_postgres_read_router(settings.operations_postgres_database)
 postgres_session_factory = get_postgres_session_factory(settings.operations_postgres_database)
@@ -1 +1,3 @@
 from services.operations.services.postgres.models.operations import OperationsModel
+from services.operations.services.postgres.models.operations_daily_rollups import OperationsDailyRollupsModel
+from services.operations.services.postgres.models.operations_outbox import OperationsOutboxModel
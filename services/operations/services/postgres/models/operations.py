@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, UUID, DateTime, Float, String
+from sqlalchemy import Column, UUID, DateTime, Float, String, Index
 from sqlalchemy.orm import Mapped
 
 from libs.postgres.mixin_model import MixinModel
@@ -9,6 +9,12 @@ from libs.postgres.mixin_model import MixinModel
 
 class OperationsModel(MixinModel):
     __tablename__ = "operations"
+    __table_args__ = (
+        Index("ix_operations_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_operations_user_id_card_id_created_at_id", "user_id", "card_id", "created_at", "id"),
+        Index("ix_operations_user_id_account_id_created_at_id", "user_id", "account_id", "created_at", "id"),
+        Index("ux_operations_event_id", "event_id", unique=True),
+    )
 
     id: Mapped[uuid.UUID] = Column(UUID, nullable=False, primary_key=True, default=uuid.uuid4)
     type: Mapped[str] = Column(String(length=50), nullable=False)
@@ -19,3 +25,4 @@ class OperationsModel(MixinModel):
     category: Mapped[str] = Column(String(length=50), nullable=False)
     created_at: Mapped[datetime] = Column(DateTime, nullable=False)
     account_id: Mapped[uuid.UUID] = Column(UUID, nullable=False)
+    event_id: Mapped[uuid.UUID | None] = Column(UUID, nullable=True)
@@ -0,0 +1,23 @@
+import uuid
+from datetime import date
+
+from sqlalchemy import Column, UUID, Date, Float, String, Integer, Index
+from sqlalchemy.orm import Mapped
+
+from libs.postgres.mixin_model import MixinModel
+
+
+class OperationsDailyRollupsModel(MixinModel):
+    __tablename__ = "operations_daily_rollups"
+    __table_args__ = (
+        Index("ix_operations_daily_rollups_user_id_day", "user_id", "day"),
+    )
+
+    account_id: Mapped[uuid.UUID] = Column(UUID, nullable=False, primary_key=True)
+    day: Mapped[date] = Column(Date, nullable=False, primary_key=True)
+    type: Mapped[str] = Column(String(length=50), nullable=False, primary_key=True)
+    status: Mapped[str] = Column(String(length=50), nullable=False, primary_key=True)
+    category: Mapped[str] = Column(String(length=50), nullable=False, primary_key=True)
+    user_id: Mapped[uuid.UUID] = Column(UUID, nullable=False)
+    count: Mapped[int] = Column(Integer, nullable=False)
+    total_amount: Mapped[float] = Column(Float, nullable=False)
@@ -0,0 +1,16 @@
+from datetime import datetime
+
+from sqlalchemy import Column, BigInteger, Identity, String, LargeBinary, DateTime, func
+from sqlalchemy.orm import Mapped
+
+from libs.postgres.mixin_model import MixinModel
+
+
+class OperationsOutboxModel(MixinModel):
+    __tablename__ = "operations_outbox"
+
+    id: Mapped[int] = Column(BigInteger, Identity(always=True), primary_key=True)
+    key: Mapped[str | None] = Column(String(length=255), nullable=True)
+    topic: Mapped[str] = Column(String(length=255), nullable=False)
+    value: Mapped[bytes] = Column(LargeBinary, nullable=False)
+    created_at: Mapped[datetime] = Column(DateTime, nullable=False, server_default=func.now())
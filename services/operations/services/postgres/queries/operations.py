@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Select, select
+
+from libs.postgres.query import build_keyset_filter, build_keyset_order_by
+from libs.postgres.types import ColumnExpressionType
+from services.operations.services.postgres.models.operations import OperationsModel
+
+OPERATIONS_KEYSET = (OperationsModel.created_at, OperationsModel.id)
+
+
+def build_operations_filters(
+        user_id: uuid.UUID,
+        card_id: uuid.UUID | None = None,
+        account_id: uuid.UUID | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None
+) -> ColumnExpressionType:
+    filters = (OperationsModel.user_id == user_id,)
+    if card_id:
+        filters += (OperationsModel.card_id == card_id,)
+
+    if account_id:
+        filters += (OperationsModel.account_id == account_id,)
+
+    if start_date:
+        filters += (OperationsModel.created_at >= start_date,)
+
+    if end_date:
+        filters += (OperationsModel.created_at < end_date,)
+
+    return filters
+
+
+def build_get_operations_query(
+        user_id: uuid.UUID,
+        limit: int | None,
+        card_id: uuid.UUID | None = None,
+        account_id: uuid.UUID | None = None,
+        after: tuple[datetime, uuid.UUID] | None = None
+) -> Select[tuple[OperationsModel]]:
+    filters = build_operations_filters(user_id=user_id, card_id=card_id, account_id=account_id)
+    if after:
+        filters += build_keyset_filter(OPERATIONS_KEYSET, after)
+
+    query = select(OperationsModel).filter(*filters).order_by(*build_keyset_order_by(OPERATIONS_KEYSET))
+    if limit:
+        query = query.limit(limit)
+
+    return query
@@ -1,10 +1,26 @@
+import json
 import uuid
-from datetime import datetime
-from typing import Sequence, TypedDict
+from datetime import date, datetime, time
+from typing import AsyncIterator, Sequence, TypedDict
 
+from sqlalchemy import Date, cast, insert, select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from config import settings
+from libs.base.date import to_naive_utc
+from libs.postgres.query import build_keyset_order_by
 from libs.postgres.repository import BasePostgresRepository
-from services.operations.services.postgres.client import postgres_session_factory
+from libs.postgres.router import PostgresReadRouter
+from services.operations.services.kafka.topics import OperationsKafkaTopic
+from services.operations.services.postgres.client import postgres_session_factory, postgres_read_router
 from services.operations.services.postgres.models.operations import OperationsModel
+from services.operations.services.postgres.models.operations_daily_rollups import OperationsDailyRollupsModel
+from services.operations.services.postgres.models.operations_outbox import OperationsOutboxModel
+from services.operations.services.postgres.queries.operations import (
+    OPERATIONS_KEYSET,
+    build_get_operations_query,
+    build_operations_filters
+)
 from services.operations.types.operations import OperationType, OperationStatus
 
 
@@ -15,12 +31,110 @@ class CreateOperationDict(TypedDict):
     user_id: uuid.UUID
     card_id: uuid.UUID
     category: str
+    event_id: uuid.UUID
     account_id: uuid.UUID
     created_at: datetime
 
 
+class OperationsSummaryDict(TypedDict):
+    type: OperationType
+    status: OperationStatus
+    category: str
+    total_amount: float
+    count: int
+
+
+class OperationsDailyRollupDict(TypedDict):
+    day: date
+    type: OperationType
+    status: OperationStatus
+    count: int
+    user_id: uuid.UUID
+    category: str
+    account_id: uuid.UUID
+    total_amount: float
+
+
+class OperationsOutboxMessageDict(TypedDict):
+    key: str
+    topic: str
+    value: bytes
+
+
+def is_day_aligned(value: datetime | None) -> bool:
+    return value is None or value.time() == time.min
+
+
+def normalize_operation(data: CreateOperationDict) -> CreateOperationDict:
+    return CreateOperationDict(**{**data, 'created_at': to_naive_utc(data['created_at'])})
+
+
+def build_daily_rollups(data: Sequence[CreateOperationDict]) -> list[OperationsDailyRollupDict]:
+    rollups: dict[tuple, OperationsDailyRollupDict] = {}
+    for operation in data:
+        key = (
+            operation['account_id'],
+            operation['created_at'].date(),
+            operation['type'],
+            operation['status'],
+            operation['category']
+        )
+        if key not in rollups:
+            rollups[key] = OperationsDailyRollupDict(
+                day=operation['created_at'].date(),
+                type=operation['type'],
+                status=operation['status'],
+                count=0,
+                user_id=operation['user_id'],
+                category=operation['category'],
+                account_id=operation['account_id'],
+                total_amount=0.0
+            )
+
+        rollups[key]['count'] += 1
+        rollups[key]['total_amount'] += operation['amount']
+
+    return [rollups[key] for key in sorted(rollups)]
+
+
+def build_outbox_messages(
+        data: Sequence[CreateOperationDict],
+        operation_ids: Sequence[uuid.UUID]
+) -> list[OperationsOutboxMessageDict]:
+    return [
+        OperationsOutboxMessageDict(
+            key=str(operation['account_id']),
+            topic=OperationsKafkaTopic.OPERATION_STATUS_CHANGES,
+            value=json.dumps({
+                'id': str(operation_id),
+                'type': operation['type'],
+                'status': operation['status'],
+                'amount': operation['amount'],
+                'userId': str(operation['user_id']),
+                'cardId': str(operation['card_id']),
+                'eventId': str(operation['event_id']),
+                'category': operation['category'],
+                'createdAt': operation['created_at'].isoformat(),
+                'accountId': str(operation['account_id']),
+            }).encode()
+        )
+        for operation, operation_id in zip(data, operation_ids)
+    ]
+
+
 class OperationsRepository(BasePostgresRepository):
     model = OperationsModel
+    rollup_model = OperationsDailyRollupsModel
+    outbox_model = OperationsOutboxModel
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+            read_router: PostgresReadRouter | None = None,
+            use_daily_rollups: bool = False
+    ):
+        super().__init__(session_factory=session_factory, read_router=read_router)
+        self.use_daily_rollups = use_daily_rollups
 
     async def get_by_id(self, operation_id: uuid.UUID) -> OperationsModel | None:
         async with self.session_read() as session:
@@ -31,23 +145,222 @@ class OperationsRepository(BasePostgresRepository):
     async def filter(
             self,
             user_id: uuid.UUID,
+            limit: int | None,
             card_id: uuid.UUID | None = None,
-            account_id: uuid.UUID | None = None
+            account_id: uuid.UUID | None = None,
+            after: tuple[datetime, uuid.UUID] | None = None
     ) -> Sequence[OperationsModel]:
-        filters = (self.model.user_id == user_id,)
-        if card_id:
-            filters += (self.model.card_id == card_id,)
+        query = build_get_operations_query(
+            user_id=user_id,
+            limit=limit,
+            card_id=card_id,
+            account_id=account_id,
+            after=after
+        )
+
+        async with self.session_read() as session:
+            result = await session.execute(query)
+            return result.scalars().all()
+
+    async def stream(
+            self,
+            user_id: uuid.UUID,
+            page_size: int,
+            card_id: uuid.UUID | None = None,
+            account_id: uuid.UUID | None = None
+    ) -> AsyncIterator[OperationsModel]:
+        after: tuple[datetime, uuid.UUID] | None = None
+        while True:
+            operations = await self.filter(
+                user_id=user_id,
+                limit=page_size,
+                card_id=card_id,
+                account_id=account_id,
+                after=after
+            )
+            for operation in operations:
+                yield operation
+
+            if len(operations) < page_size:
+                return
+
+            after = (operations[-1].created_at, operations[-1].id)
 
+    async def export(
+            self,
+            user_id: uuid.UUID,
+            chunk_size: int,
+            card_id: uuid.UUID | None = None,
+            account_id: uuid.UUID | None = None
+    ) -> AsyncIterator[Sequence[OperationsModel]]:
+        filters = build_operations_filters(user_id=user_id, card_id=card_id, account_id=account_id)
+
+        async with self.session_read() as session:
+            partitions = self.model.stream_partitions(
+                session,
+                yield_per=chunk_size,
+                order_by=build_keyset_order_by(OPERATIONS_KEYSET),
+                clause_filter=filters
+            )
+            async for operations in partitions:
+                yield operations
+
+    async def summarize(
+            self,
+            user_id: uuid.UUID,
+            card_id: uuid.UUID | None = None,
+            account_id: uuid.UUID | None = None,
+            start_date: datetime | None = None,
+            end_date: datetime | None = None
+    ) -> list[OperationsSummaryDict]:
+        start_date = to_naive_utc(start_date) if start_date else None
+        end_date = to_naive_utc(end_date) if end_date else None
+
+        if self.use_daily_rollups and not card_id and is_day_aligned(start_date) and is_day_aligned(end_date):
+            return await self.summarize_daily_rollups(
+                user_id=user_id,
+                account_id=account_id,
+                start_day=start_date.date() if start_date else None,
+                end_day=end_date.date() if end_date else None
+            )
+
+        group_by = (self.model.type, self.model.status, self.model.category)
+        query = (
+            select(
+                *group_by,
+                func.sum(self.model.amount).label('total_amount'),
+                func.count().label('count')
+            )
+            .filter(
+                *build_operations_filters(
+                    user_id=user_id,
+                    card_id=card_id,
+                    account_id=account_id,
+                    start_date=start_date,
+                    end_date=end_date
+                )
+            )
+            .group_by(*group_by)
+            .order_by(*group_by)
+        )
+
+        async with self.session_read() as session:
+            result = await session.execute(query)
+            return [OperationsSummaryDict(**row._mapping) for row in result]
+
+    async def summarize_daily_rollups(
+            self,
+            user_id: uuid.UUID,
+            account_id: uuid.UUID | None = None,
+            start_day: date | None = None,
+            end_day: date | None = None
+    ) -> list[OperationsSummaryDict]:
+        filters = (self.rollup_model.user_id == user_id,)
         if account_id:
-            filters += (self.model.account_id == account_id,)
+            filters += (self.rollup_model.account_id == account_id,)
+
+        if start_day:
+            filters += (self.rollup_model.day >= start_day,)
+
+        if end_day:
+            filters += (self.rollup_model.day < end_day,)
+
+        group_by = (self.rollup_model.type, self.rollup_model.status, self.rollup_model.category)
+        query = (
+            select(
+                *group_by,
+                func.sum(self.rollup_model.total_amount).label('total_amount'),
+                func.sum(self.rollup_model.count).label('count')
+            )
+            .filter(*filters)
+            .group_by(*group_by)
+            .order_by(*group_by)
+        )
 
         async with self.session_read() as session:
-            return await self.model.filter(session, clause_filter=filters)
+            result = await session.execute(query)
+            return [OperationsSummaryDict(**row._mapping) for row in result]
+
+    async def rebuild_daily_rollups(self, batch_size: int) -> AsyncIterator[int]:
+        after: uuid.UUID | None = None
+        while True:
+            async with self.session_write() as session:
+                await session.execute(
+                    text(f"LOCK TABLE {self.rollup_model.__tablename__} IN SHARE ROW EXCLUSIVE MODE")
+                )
+
+                query = select(self.model.user_id).distinct().order_by(self.model.user_id).limit(batch_size)
+                if after:
+                    query = query.filter(self.model.user_id > after)
+
+                user_ids = (await session.execute(query)).scalars().all()
+                if not user_ids:
+                    return
+
+                await self.rollup_model.delete(session, clause_filter=(self.rollup_model.user_id.in_(user_ids),))
+
+                day = cast(self.model.created_at, Date)
+                group_by = (
+                    self.model.account_id,
+                    day,
+                    self.model.type,
+                    self.model.status,
+                    self.model.category,
+                    self.model.user_id
+                )
+                await session.execute(
+                    insert(self.rollup_model).from_select(
+                        ['account_id', 'day', 'type', 'status', 'category', 'user_id', 'count', 'total_amount'],
+                        select(*group_by, func.count(), func.sum(self.model.amount))
+                        .filter(self.model.user_id.in_(user_ids))
+                        .group_by(*group_by)
+                    )
+                )
+
+            after = user_ids[-1]
+            yield len(user_ids)
+
+    async def create(self, data: CreateOperationDict) -> OperationsModel | None:
+        data = normalize_operation(data)
+        async with self.session_write() as session:
+            operation = await self.model.create(session, conflict_columns=('event_id',), **data)
+            if operation:
+                await self.rollup_model.accumulate_many(
+                    session, build_daily_rollups([data]), columns=('count', 'total_amount')
+                )
+                await self.outbox_model.create_many(session, build_outbox_messages([data], [operation.id]))
+
+            return operation
+
+    async def create_many(self, data: Sequence[CreateOperationDict]) -> int:
+        operations = [{'id': uuid.uuid4(), **normalize_operation(operation)} for operation in data]
 
-    async def create(self, data: CreateOperationDict) -> OperationsModel:
         async with self.session_write() as session:
-            return await self.model.create(session, **data)
+            created = set(
+                await self.model.create_many(
+                    session,
+                    operations,
+                    ignore_conflicts=True,
+                    conflict_columns=('event_id',),
+                    returning_ids=True
+                )
+            )
+            inserted = [operation for operation in operations if operation['id'] in created]
+            await self.rollup_model.accumulate_many(
+                session,
+                build_daily_rollups(inserted),
+                columns=('count', 'total_amount')
+            )
+            await self.outbox_model.create_many(
+                session, build_outbox_messages(inserted, [operation['id'] for operation in inserted])
+            )
+
+        return len(created)
 
 
 def get_operations_repository() -> OperationsRepository:
-    return OperationsRepository(session_factory=postgres_session_factory)
+    return OperationsRepository(
+        session_factory=postgres_session_factory,
+        read_router=postgres_read_router,
+        use_daily_rollups=settings.operations_summary_daily_rollups
+    )
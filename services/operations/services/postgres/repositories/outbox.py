@@ -0,0 +1,37 @@
+from typing import Awaitable, Callable, Sequence
+
+from sqlalchemy import select
+
+from libs.postgres.repository import BasePostgresRepository
+from services.operations.services.postgres.client import postgres_session_factory
+from services.operations.services.postgres.models.operations_outbox import OperationsOutboxModel
+
+
+class OperationsOutboxRepository(BasePostgresRepository):
+    model = OperationsOutboxModel
+
+    async def relay(
+            self,
+            batch_size: int,
+            publish: Callable[[Sequence[OperationsOutboxModel]], Awaitable[None]]
+    ) -> int:
+        query = (
+            select(self.model)
+            .order_by(self.model.id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        async with self.session_write() as session:
+            messages = (await session.execute(query)).scalars().all()
+            if not messages:
+                return 0
+
+            await publish(messages)
+            await self.model.delete(session, clause_filter=(self.model.id.in_([message.id for message in messages]),))
+
+        return len(messages)
+
+
+def get_operations_outbox_repository() -> OperationsOutboxRepository:
+    return OperationsOutboxRepository(session_factory=postgres_session_factory)
@@ -1,14 +1,17 @@
 import uuid
 
 from fastapi import Depends
-from httpx import Response, Headers
+from httpx import Response
 
 from config import settings
+from libs.cache.base import get_response_cache
+from libs.cache.decorators import cache_response
+from libs.cache.serializers import PydanticCacheSerializer
 from libs.context.base import RequestContext
 from libs.context.http import get_http_request_context
-from libs.http.client.base import HTTPClient, build_http_client
+from libs.http.client.base import HTTPClient
 from libs.http.client.handlers import handle_http_error, HTTPClientError
-from libs.logger import get_logger
+from libs.http.client.registry import http_client_registry
 from libs.routes import APIRoutes
 from services.users.schema import GetUserResponseSchema
 
@@ -22,15 +25,19 @@ class UsersHTTPClient(HTTPClient):
     async def get_user_api(self, user_id: uuid.UUID) -> Response:
         return await self.get(f'{APIRoutes.USERS}/{user_id}')
 
+    @cache_response(
+        cache=get_response_cache(settings.downstream_cache),
+        name='users:http:get_user',
+        serializer=PydanticCacheSerializer(GetUserResponseSchema)
+    )
     async def get_user(self, user_id: uuid.UUID) -> GetUserResponseSchema:
         response = await self.get_user_api(user_id)
         return GetUserResponseSchema.model_validate_json(response.text)
 
 
 def get_users_http_client(context: RequestContext = Depends(get_http_request_context)) -> UsersHTTPClient:
-    client = build_http_client(
-        logger=get_logger("USERS_SERVICE_HTTP_CLIENT"),
-        config=settings.users_http_client,
-        headers=Headers({"x-test-scenario": context.test_scenario})
+    client = http_client_registry.get_client(
+        name="USERS_SERVICE_HTTP_CLIENT",
+        config=settings.users_http_client
     )
-    return UsersHTTPClient(client=client)
+    return UsersHTTPClient(client=client, context=context)
@@ -6,7 +6,7 @@ from httpx import Response
 from tests.clients.http.client import HTTPTestClient, build_http_test_client
 from tests.config import test_settings
 from tests.schema.operations import GetOperationsQueryTestSchema, GetOperationResponseTestSchema, \
-    GetOperationsResponseTestSchema
+    GetOperationsResponseTestSchema, GetOperationsSummaryQueryTestSchema
 from tests.tools.logger import get_test_logger
 from tests.tools.routes import APITestRoutes
 
@@ -23,6 +23,13 @@ class OperationsHTTPTestClient(HTTPTestClient):
             params=query.model_dump(by_alias=True, exclude_none=True)
         )
 
+    @allure.step("Get user operations summary")
+    def get_operations_summary_api(self, query: GetOperationsSummaryQueryTestSchema) -> Response:
+        return self.get(
+            f'{APITestRoutes.OPERATIONS}/summary',
+            params=query.model_dump(mode='json', by_alias=True, exclude_none=True)
+        )
+
     def get_operation(self, operation_id: uuid.UUID) -> GetOperationResponseTestSchema:
         response = self.get_operation_api(operation_id)
         response.raise_for_status()
@@ -1,5 +1,10 @@
+import uuid
+from datetime import datetime
+
 import allure
+from sqlalchemy import text
 
+from services.operations.services.postgres.queries.operations import build_get_operations_query
 from tests.clients.postgres.operations.model import OperationsTestModel
 from tests.clients.postgres.operations.session import operations_test_session_factory
 from tests.clients.postgres.repository import PostgresTestRepository
@@ -46,6 +51,40 @@ class OperationsPostgresTestRepository(PostgresTestRepository):
             )
         )
 
+    @allure.step('Explain get operations query')
+    def explain_get_operations(
+            self,
+            user_id: uuid.UUID,
+            card_id: uuid.UUID | None = None,
+            account_id: uuid.UUID | None = None,
+            after: tuple[datetime, uuid.UUID] | None = None,
+            limit: int = 100
+    ) -> str:
+        """
+        Возвращает план выполнения запроса списка операций.
+
+        Запрос собирается тем же построителем, что использует operations-service,
+        поэтому тест проверяет именно тот запрос, который выполняет сервис.
+
+        Seq scan отключается на время транзакции, потому что на маленькой
+        тестовой таблице планировщик всегда выбирает его. Выбор между индексами,
+        bitmap scan и сортировкой остаётся за планировщиком.
+        """
+        query = build_get_operations_query(
+            user_id=user_id,
+            limit=limit,
+            card_id=card_id,
+            account_id=account_id,
+            after=after
+        )
+
+        with self.session_write() as session:
+            session.execute(text('SET LOCAL enable_seqscan = off'))
+            compiled = query.compile(session.get_bind(), compile_kwargs={'literal_binds': True})
+            rows = session.execute(text(f'EXPLAIN {compiled}')).scalars().all()
+
+        return '\n'.join(rows)
+
 
 def get_operations_postgres_test_repository() -> OperationsPostgresTestRepository:
     return OperationsPostgresTestRepository(session_factory=operations_test_session_factory)
\ No newline at end of file
@@ -1,3 +1,4 @@
 pytest_plugins = (
     'tests.fixtures.gateway',
-)
\ No newline at end of file
+    'tests.fixtures.operations',
+)
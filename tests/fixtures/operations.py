@@ -0,0 +1,17 @@
+import pytest
+
+from tests.clients.http.operations.client import OperationsHTTPTestClient, build_operations_http_test_client
+from tests.clients.postgres.operations.repository import (
+    OperationsPostgresTestRepository,
+    get_operations_postgres_test_repository
+)
+
+
+@pytest.fixture
+def operations_postgres_test_repository() -> OperationsPostgresTestRepository:
+    return get_operations_postgres_test_repository()
+
+
+@pytest.fixture
+def operations_http_test_client() -> OperationsHTTPTestClient:
+    return build_operations_http_test_client()
@@ -45,6 +45,7 @@ class OperationEventTestSchema(BaseModel):
     user_id: UUID4 = Field(default_factory=fake.uuid)
     card_id: UUID4 = Field(default_factory=fake.uuid)
     category: str = Field(default_factory=fake.category)
+    event_id: UUID4 = Field(default_factory=fake.uuid)
     created_at: datetime = Field(default_factory=fake.date_time)
     account_id: UUID4 = Field(default_factory=fake.uuid)
 
@@ -78,3 +79,52 @@ class GetOperationsResponseTestSchema(BaseModel):
     """
 
     operations: list[OperationTestSchema]
+
+
+class GetOperationsSummaryQueryTestSchema(BaseModel):
+    """
+    Схема query-параметров для запроса сводки по операциям.
+    """
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    user_id: UUID4
+    card_id: UUID4 | None = None
+    account_id: UUID4 | None = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+
+
+class OperationsSummaryGroupTestSchema(BaseModel):
+    """
+    Тестовая схема группы в сводке по операциям.
+    """
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    type: OperationTestType
+    status: OperationTestStatus
+    count: int
+    category: str
+    total_amount: float
+
+
+class GetOperationsSummaryResponseTestSchema(BaseModel):
+    """
+    Схема ответа API при получении сводки по операциям.
+    """
+
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+    )
+
+    groups: list[OperationsSummaryGroupTestSchema]
+    total_count: int
+    total_amount: float
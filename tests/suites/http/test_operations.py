@@ -0,0 +1,46 @@
+from datetime import timedelta, timezone, tzinfo, UTC
+from http import HTTPStatus
+
+import allure
+import pytest
+
+from tests.clients.http.operations.client import OperationsHTTPTestClient
+from tests.clients.postgres.operations.repository import OperationsPostgresTestRepository
+from tests.schema.operations import GetOperationsSummaryQueryTestSchema, GetOperationsSummaryResponseTestSchema
+from tests.tools.allure import AllureTag, AllureStory, AllureFeature
+
+
+@pytest.mark.operations
+@pytest.mark.regression
+@allure.tag(AllureTag.HTTP, AllureTag.OPERATIONS_SERVICE)
+@allure.feature(AllureFeature.OPERATIONS_SERVICE)
+class TestOperationsHTTP:
+    @pytest.mark.parametrize("tz", [None, UTC, timezone(timedelta(hours=3))], ids=["naive", "Z", "+03:00"])
+    @allure.story(AllureStory.OPERATIONS_SUMMARY)
+    @allure.title("[HTTP] Get operations summary with date bounds")
+    def test_get_operations_summary_with_date_bounds(
+            self,
+            tz: tzinfo | None,
+            operations_http_test_client: OperationsHTTPTestClient,
+            operations_postgres_test_repository: OperationsPostgresTestRepository
+    ):
+        operation = operations_postgres_test_repository.create_completed_purchase_operation()
+        start_date = operation.created_at - timedelta(hours=1)
+        end_date = operation.created_at + timedelta(hours=1)
+        if tz:
+            start_date = start_date.replace(tzinfo=UTC).astimezone(tz)
+            end_date = end_date.replace(tzinfo=UTC).astimezone(tz)
+
+        response = operations_http_test_client.get_operations_summary_api(
+            GetOperationsSummaryQueryTestSchema(
+                user_id=operation.user_id,
+                start_date=start_date,
+                end_date=end_date
+            )
+        )
+
+        assert response.status_code == HTTPStatus.OK, response.text
+
+        summary = GetOperationsSummaryResponseTestSchema.model_validate_json(response.text)
+        assert summary.total_count == 1
+        assert summary.total_amount == pytest.approx(operation.amount)
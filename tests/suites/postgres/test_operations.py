@@ -0,0 +1,45 @@
+import uuid
+from datetime import datetime
+
+import allure
+import pytest
+
+from tests.clients.postgres.operations.repository import OperationsPostgresTestRepository
+from tests.tools.allure import AllureTag, AllureStory, AllureFeature
+from tests.tools.fakers import fake
+
+
+@pytest.mark.operations
+@pytest.mark.regression
+@allure.tag(AllureTag.POSTGRES, AllureTag.OPERATIONS_SERVICE)
+@allure.feature(AllureFeature.OPERATIONS_SERVICE)
+class TestOperationsPostgres:
+    @pytest.mark.parametrize(
+        "card_id, account_id, after, index",
+        [
+            (None, None, None, "ix_operations_user_id_created_at_id"),
+            (fake.uuid(), None, None, "ix_operations_user_id_card_id_created_at_id"),
+            (None, fake.uuid(), None, "ix_operations_user_id_account_id_created_at_id"),
+            (None, None, (fake.date_time(), fake.uuid()), "ix_operations_user_id_created_at_id"),
+        ]
+    )
+    @allure.story(AllureStory.OPERATION_FILTERS)
+    @allure.title("[Postgres] Get operations query uses index scan")
+    def test_get_operations_query_uses_index_scan(
+            self,
+            card_id: uuid.UUID | None,
+            account_id: uuid.UUID | None,
+            after: tuple[datetime, uuid.UUID] | None,
+            index: str,
+            operations_postgres_test_repository: OperationsPostgresTestRepository
+    ):
+        plan = operations_postgres_test_repository.explain_get_operations(
+            user_id=fake.uuid(),
+            card_id=card_id,
+            account_id=account_id,
+            after=after
+        )
+
+        assert "Seq Scan" not in plan, plan
+        assert "Sort" not in plan, plan
+        assert index in plan, plan